@@ -0,0 +1,7 @@
+"""
+Performance benchmarks for the Eisenhower Matrix application
+
+Each module is runnable on its own from the repository root, e.g.::
+
+    python -m benchmarks.import_time
+"""
@@ -0,0 +1,139 @@
+"""
+Import-time benchmark with regression thresholds
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters,
+keeps the best cumulative time of several runs and compares it against a
+per-module threshold. Headless entry points are also checked for modules
+they must never import (GTK).
+
+Usage::
+
+    python -m benchmarks.import_time [--runs N] [--scale FACTOR] [--json]
+
+Exits with status 1 when any threshold is exceeded or a module's import
+time cannot be read from the -X importtime output.
+"""
+
+import argparse
+import importlib.util
+import json
+import subprocess
+import sys
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional, Tuple
+
+
+@dataclass
+class ImportCheck:
+    """One module to import and the limits it must stay within"""
+    module: str
+    threshold_ms: float
+    forbidden: Tuple[str, ...] = ()
+    requires_gi: bool = False
+
+
+@dataclass
+class ImportResult:
+    """Measured outcome of an ImportCheck (cumulative_ms None if not measured)"""
+    module: str
+    cumulative_ms: Optional[float]
+    threshold_ms: float
+    forbidden_loaded: List[str] = field(default_factory=list)
+    
+    @property
+    def passed(self) -> bool:
+        # No parsable -X importtime line is a failure, never a 0 ms pass
+        return (self.cumulative_ms is not None and self.cumulative_ms <= self.threshold_ms
+                and not self.forbidden_loaded)
+
+
+# Thresholds leave headroom over a typical desktop; use --scale on slow CI
+CHECKS = [
+    ImportCheck('eisenhower_matrix', 15.0, forbidden=('gi',)),
+    ImportCheck('eisenhower_matrix.domain', 80.0, forbidden=('gi',)),
+    ImportCheck('eisenhower_matrix.application', 120.0, forbidden=('gi',)),
+    ImportCheck('eisenhower_matrix.infrastructure.persistence', 150.0, forbidden=('gi',)),
+    ImportCheck('eisenhower_matrix.infrastructure.ui.application', 800.0,
+                forbidden=(
+                    'eisenhower_matrix.infrastructure.ui.task_dialog',
+                    'eisenhower_matrix.infrastructure.ui.project_dialog',
+                    'eisenhower_matrix.infrastructure.ui.user_guide_dialog',
+                ),
+                requires_gi=True),
+]
+
+
+def _parse_cumulative_us(stderr: str, module: str) -> Optional[int]:
+    """Extract the cumulative import time of a module from -X importtime output"""
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or parts[2].strip() != module:
+            continue
+        try:
+            return int(parts[1])
+        except ValueError:
+            continue
+    return None
+
+
+def measure(check: ImportCheck, runs: int) -> ImportResult:
+    """Import a module in fresh interpreters and keep the best run"""
+    code = (
+        f"import sys, {check.module}\n"
+        f"print(','.join(m for m in {check.forbidden!r} if m in sys.modules))"
+    )
+    best_us = None
+    forbidden_loaded: List[str] = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True, text=True, check=True,
+        )
+        cumulative_us = _parse_cumulative_us(proc.stderr, check.module)
+        if cumulative_us is not None and (best_us is None or cumulative_us < best_us):
+            best_us = cumulative_us
+        forbidden_loaded = [m for m in proc.stdout.strip().split(',') if m]
+    
+    return ImportResult(
+        module=check.module,
+        cumulative_ms=best_us / 1000.0 if best_us is not None else None,
+        threshold_ms=check.threshold_ms,
+        forbidden_loaded=forbidden_loaded,
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help='runs per module (best is kept)')
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply all thresholds')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    
+    has_gi = importlib.util.find_spec('gi') is not None
+    results = []
+    for check in CHECKS:
+        if check.requires_gi and not has_gi:
+            continue
+        check.threshold_ms *= args.scale
+        results.append(measure(check, args.runs))
+    
+    if args.json:
+        print(json.dumps([dict(asdict(r), passed=r.passed) for r in results], indent=2))
+    else:
+        for r in results:
+            status = 'ok' if r.passed else 'FAIL'
+            if r.cumulative_ms is None:
+                line = f"{status:4}  {r.module:55}      n/a     (no -X importtime line for the module)"
+            else:
+                line = f"{status:4}  {r.module:55} {r.cumulative_ms:8.1f} ms  (limit {r.threshold_ms:.0f} ms)"
+            if r.forbidden_loaded:
+                line += f"  imports {', '.join(r.forbidden_loaded)}"
+            print(line)
+    
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Project-switch memory benchmark
+
+Switches between synthetic projects through the GUI's own ProjectSession
+- warm services from a ProjectServiceCache, each with a session recorder
+(EISENHOWER_RECORD), followed by the local API server and the window's
+observer - and checks that:
+
+* memory stays bounded: after a warm-up (a quarter of the run, and every
+  project loaded twice), traced memory (tracemalloc) may not grow by more
+  than --max-growth of its warm level. The warm-up absorbs one-off
+  allocations, such as interpreter tables reallocated (and so first
+  traced) after tracemalloc started
+* no service outlives its eviction from the cache (weak references)
+* no more services are alive than the cache holds
+
+Usage::
+
+    python -m benchmarks.memory [--switches 1000] [--projects 12] [--tasks 1000]
+                                [--cache 4] [--max-growth 0.1] [--no-record] [--json]
+
+--no-record leaves the recorder out; recording writes a snapshot per
+loaded service and roughly doubles the run time.
+
+Exits with status 1 when a check fails.
+"""
+
+import argparse
+import gc
+import json
+import queue
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+from eisenhower_matrix.application import EisenhowerMatrixService, ProjectServiceCache
+from eisenhower_matrix.diagnostics.memory import LeakCheck, measure_service
+from eisenhower_matrix.infrastructure.api.server import LocalApiServer
+from eisenhower_matrix.infrastructure.persistence import JsonTaskRepository
+from eisenhower_matrix.infrastructure.project_session import ProjectSession, create_project_service
+from eisenhower_matrix.infrastructure.ui.observer_adapter import GtkObserverAdapter
+from benchmarks.synthetic import generate_tasks
+
+
+class _Window:
+    """What MainWindow keeps of the open project, without GTK"""
+    
+    def __init__(self, session: ProjectSession):
+        self.refreshes = 0
+        self.observer = GtkObserverAdapter(self._on_changed)
+        self._observed = session.service
+        self._observed.add_observer(self.observer)
+    
+    def _on_changed(self):
+        self.refreshes += 1
+    
+    def refresh_panels_for_project(self, service: EisenhowerMatrixService, project_id: str) -> None:
+        """MainWindow.refresh_panels_for_project: move the observer, reread tasks"""
+        if service is not self._observed:
+            self._observed.remove_observer(self.observer)
+            service.add_observer(self.observer)
+            self._observed = service
+        for quadrant in range(1, 5):
+            service.get_tasks(quadrant)
+
+
+def _write_projects(workdir: Path, projects: int, tasks: int) -> List[str]:
+    """Synthetic tasks files, one per project"""
+    project_ids = []
+    for n in range(projects):
+        project_id = f"project-{n}"
+        JsonTaskRepository(data_file=str(workdir / f"tasks_{project_id}.json")).save(
+            generate_tasks(tasks, seed=n)
+        )
+        project_ids.append(project_id)
+    return project_ids
+
+
+def _live_services() -> int:
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, EisenhowerMatrixService))
+
+
+def run(switches: int, projects: int, tasks: int, cache_size: int, workdir: Path,
+        record: bool = True) -> dict:
+    """
+    Switch projects round-robin and sample memory
+    
+    Returns:
+        Samples and check inputs (see main)
+    """
+    project_ids = _write_projects(workdir, projects, tasks)
+    environ = {'EISENHOWER_RECORD': str(workdir / "traces")} if record else {}
+    
+    def create_service(project_id: str) -> EisenhowerMatrixService:
+        return create_project_service(project_id, workdir, environ)
+    
+    leak_check = LeakCheck()
+    evictions = []
+    
+    def on_evict(project_id: str, service: EisenhowerMatrixService) -> None:
+        evictions.append(project_id)
+        leak_check.watch(service, project_id)
+    
+    # Background loads hand their quadrants back here (GLib.idle_add in the GUI)
+    pending: "queue.Queue" = queue.Queue()
+    
+    def switch_project(project_id: str) -> None:
+        service = session.switch(project_id)
+        while not service.is_loaded:
+            pending.get()()
+    
+    cache = ProjectServiceCache(create_service, max_entries=cache_size, on_evict=on_evict)
+    session = ProjectSession(cache, project_ids[0], pending.put)
+    # Followers as EisenhowerApp registers them (retention and the file
+    # watcher need a GLib main loop)
+    api_server = LocalApiServer(socket_path=str(workdir / "api.sock"))
+    window = _Window(session)
+    session.follow(window.refresh_panels_for_project)
+    session.follow(api_server.attach)
+    api_server.attach(session.service, project_ids[0])
+    
+    tracemalloc.start()
+    # Warm up: every project loaded and evicted, interpreter caches grown
+    warmup = max(2 * projects, switches // 4)
+    samples = []
+    for n in range(1, switches + 1):
+        switch_project(project_ids[n % projects])
+        if n == warmup or (n > warmup and n % 100 == 0) or n == switches:
+            gc.collect()
+            samples.append({'switch': n, 'traced_bytes': tracemalloc.get_traced_memory()[0]})
+    tracemalloc.stop()
+    
+    footprints = [measure_service(service) for service in cache.services().values()]
+    return {
+        'switches': switches,
+        'recorded': record,
+        'projects': projects,
+        'tasks_per_project': tasks,
+        'cache_entries': cache_size,
+        'evictions': len(evictions),
+        'samples': samples,
+        'leaked': leak_check.describe(),
+        'live_services': _live_services(),
+        'cached_bytes': sum(f.total_bytes for f in footprints),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check memory stays bounded over many project switches")
+    parser.add_argument('--switches', type=int, default=1000)
+    parser.add_argument('--projects', type=int, default=12)
+    parser.add_argument('--tasks', type=int, default=1000, help='tasks per project')
+    parser.add_argument('--cache', type=int, default=4, help='services the project cache holds')
+    parser.add_argument('--max-growth', type=float, default=0.10,
+                        help='allowed growth of traced memory after warm-up, as a fraction (default 0.10)')
+    parser.add_argument('--no-record', dest='record', action='store_false',
+                        help='do not record the services (EISENHOWER_RECORD)')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args(argv)
+    if args.switches <= 2 * args.projects:
+        parser.error("--switches must exceed twice --projects (the warm-up)")
+    
+    with tempfile.TemporaryDirectory(prefix='eisenhower-memory-') as workdir:
+        result = run(args.switches, args.projects, args.tasks, args.cache, Path(workdir), args.record)
+    
+    warm = result['samples'][0]['traced_bytes']
+    peak = max(sample['traced_bytes'] for sample in result['samples'])
+    growth = (peak - warm) / warm if warm else 0.0
+    checks = {
+        f"memory growth {growth:+.1%} <= {args.max_growth:.0%}": growth <= args.max_growth,
+        f"evicted services collected ({len(result['leaked'])} leaked)": not result['leaked'],
+        f"live services {result['live_services']} <= {args.cache}": result['live_services'] <= args.cache,
+    }
+    result['growth'] = growth
+    result['checks'] = checks
+    
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print(f"{result['switches']} switches over {result['projects']} projects of "
+              f"{result['tasks_per_project']} tasks, cache of {result['cache_entries']} "
+              f"({result['evictions']} evictions)")
+        print(f"{'switch':>8} {'traced MiB':>11}")
+        for sample in result['samples']:
+            print(f"{sample['switch']:>8} {sample['traced_bytes'] / 2**20:11.2f}")
+        print(f"cached projects hold {result['cached_bytes'] / 2**20:.1f} MiB of tasks")
+        for leak in result['leaked']:
+            print(f"leaked: {leak['label']} ({leak['type']}) held by {', '.join(leak['referrers'])}")
+        for description, passed in checks.items():
+            print(f"{'ok  ' if passed else 'FAIL'}  {description}")
+    return 0 if all(checks.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
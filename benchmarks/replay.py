@@ -0,0 +1,215 @@
+"""
+Replay a recorded service trace and report latency percentiles
+
+Traces are recorded from a live session with EISENHOWER_RECORD (see
+eisenhower_matrix.diagnostics.recorder). The replayer seeds a repository
+with the trace's snapshot, re-executes every call in order, as fast as
+possible, and reports p50/p95/p99 latency per operation, next to the
+latency recorded in the session.
+
+Usage::
+
+    python -m benchmarks.replay TRACE [--adapter json|memory|MODULE:FACTORY]
+                                      [--runs N] [--output results.json]
+
+A MODULE:FACTORY adapter is called with a scratch directory and must
+return an ITaskRepository, so any adapter can be measured.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from eisenhower_matrix.application import EisenhowerMatrixService
+from eisenhower_matrix.domain import ITaskRepository
+from eisenhower_matrix.infrastructure.persistence import JsonTaskRepository
+from benchmarks.synthetic import InMemoryTaskRepository
+
+# Repository factory: scratch directory -> empty repository
+AdapterFactory = Callable[[Path], ITaskRepository]
+
+ADAPTERS: Dict[str, AdapterFactory] = {
+    'json': lambda workdir: JsonTaskRepository(data_file=str(workdir / 'tasks.json')),
+    'memory': lambda workdir: InMemoryTaskRepository(),
+}
+
+
+@dataclass
+class OperationStats:
+    """Latency of one operation over a replay"""
+    op: str
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    recorded_p50_ms: Optional[float] = None
+    recorded_p95_ms: Optional[float] = None
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (which must not be empty)"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def load_trace(trace_path: Path):
+    """
+    Read a trace
+    
+    Returns:
+        (header, call records)
+    """
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('trace') != 1:
+            raise ValueError(f"unsupported trace format: {header.get('trace')}")
+        calls = [json.loads(line) for line in f if line.strip()]
+    return header, calls
+
+
+def _map_uids(value, uids: Dict[str, str]):
+    """A recorded argument with recorded uids replaced, also inside lists (bulk calls)"""
+    if isinstance(value, str):
+        return uids.get(value, value)
+    if isinstance(value, list):
+        return [_map_uids(item, uids) for item in value]
+    return value
+
+
+def replay(trace_path: Path, adapter: AdapterFactory, workdir: Path) -> Dict[str, List[float]]:
+    """
+    Re-execute a trace against a fresh repository made by adapter
+    
+    uids of tasks created during the session are mapped to the uids the
+    replay creates, so later calls address the same tasks. Exports are
+    written into workdir instead of the recorded path. A batch's time is
+    reported as "batch commit" (its save and notification); calls that
+    fail in the replay are counted under "<op> (failed)".
+    
+    Returns:
+        Latency samples in milliseconds per operation
+    """
+    header, calls = load_trace(trace_path)
+    snapshot = trace_path.with_name(header['snapshot'])
+    reader = JsonTaskRepository(data_file=str(workdir / 'snapshot.json'))
+    repository = adapter(workdir)
+    repository.save(reader.import_from_file(str(snapshot)))
+    service = EisenhowerMatrixService(repository)
+    
+    uids: Dict[str, str] = {}
+    samples: Dict[str, List[float]] = {}
+    batches = []
+    for call in calls:
+        op = call['op']
+        args = [_map_uids(a, uids) for a in call.get('args', [])]
+        kwargs = {k: _map_uids(v, uids) for k, v in call.get('kwargs', {}).items()}
+        if op == 'export_to_file':
+            args, kwargs = [str(workdir / 'export.json')], {}
+        result = None
+        start = time.perf_counter()
+        try:
+            if op == 'batch':
+                batch = service.batch(*args, **kwargs)
+                batch.__enter__()
+                batches.append(batch)
+                continue
+            if op == 'end-batch':
+                if not batches:
+                    continue
+                op = 'batch commit'
+                batches.pop().__exit__(None, None, None)
+            else:
+                result = getattr(service, op)(*args, **kwargs)
+        except Exception:
+            op = f"{op} (failed)"
+        samples.setdefault(op, []).append((time.perf_counter() - start) * 1000.0)
+        if 'uid' in call and hasattr(result, 'uid'):
+            uids[call['uid']] = result.uid
+    while batches:
+        batches.pop().__exit__(None, None, None)
+    return samples
+
+
+def summarize(samples: Dict[str, List[float]], calls: List[dict]) -> List[OperationStats]:
+    """Percentiles per operation, with those recorded in the session"""
+    recorded: Dict[str, List[float]] = {}
+    for call in calls:
+        if 'ms' in call:
+            recorded.setdefault(call['op'], []).append(call['ms'])
+    stats = []
+    for op, values in sorted(samples.items()):
+        session = recorded.get(op)
+        stats.append(OperationStats(
+            op=op,
+            count=len(values),
+            p50_ms=percentile(values, 50),
+            p95_ms=percentile(values, 95),
+            p99_ms=percentile(values, 99),
+            max_ms=max(values),
+            recorded_p50_ms=percentile(session, 50) if session else None,
+            recorded_p95_ms=percentile(session, 95) if session else None,
+        ))
+    return stats
+
+
+def _adapter(name: str) -> AdapterFactory:
+    """Resolve --adapter: a built-in name or MODULE:FACTORY"""
+    if name in ADAPTERS:
+        return ADAPTERS[name]
+    module_name, _, factory = name.partition(':')
+    if not factory:
+        raise ValueError(f"unknown adapter: {name}")
+    return getattr(importlib.import_module(module_name), factory)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('trace', type=Path, help='trace file (*.trace.jsonl)')
+    parser.add_argument('--adapter', default='json',
+                        help='repository: json, memory or MODULE:FACTORY (default json)')
+    parser.add_argument('--runs', type=int, default=1, help='replays; samples of all runs are pooled')
+    parser.add_argument('--output', help='write the statistics as JSON to this file')
+    args = parser.parse_args(argv)
+    
+    try:
+        adapter = _adapter(args.adapter)
+        _, calls = load_trace(args.trace)
+    except (ValueError, ImportError, AttributeError, OSError) as e:
+        parser.error(str(e))
+    
+    samples: Dict[str, List[float]] = {}
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory(prefix='eisenhower-replay-') as workdir:
+            for op, values in replay(args.trace, adapter, Path(workdir)).items():
+                samples.setdefault(op, []).extend(values)
+    stats = summarize(samples, calls)
+    
+    print(f"{'operation':28} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  {'recorded p50/p95':>18}")
+    for s in stats:
+        recorded = ''
+        if s.recorded_p50_ms is not None:
+            recorded = f"{s.recorded_p50_ms:.2f}/{s.recorded_p95_ms:.2f}"
+        print(f"{s.op:28} {s.count:>7} {s.p50_ms:9.3f} {s.p95_ms:9.3f} {s.p99_ms:9.3f} {s.max_ms:9.3f}  {recorded:>18}")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'trace': str(args.trace),
+                'adapter': args.adapter,
+                'runs': args.runs,
+                'operations': [asdict(s) for s in stats],
+            }, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,434 @@
+"""
+Service, persistence, search, import/export and UI refresh benchmarks
+
+Times each benchmark on synthetic projects (see benchmarks.synthetic) of
+several sizes, keeps the best of several runs, and optionally compares
+the results against a saved baseline. UI benchmarks are skipped when GTK
+is not available or cannot open a display.
+
+Usage::
+
+    python -m benchmarks.suite [--sizes 1000 10000 100000] [--runs N]
+                               [--filter TEXT] [--output results.json]
+                               [--baseline baseline.json] [--tolerance 1.25]
+                               [--noise-ms 1.0]
+
+Exits with status 1 when a benchmark is slower than its baseline by more
+than the tolerance factor (and by more than the noise floor).
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from eisenhower_matrix.application import EisenhowerMatrixService, TaskExportUseCase, TaskImportUseCase
+from eisenhower_matrix.infrastructure.persistence import JsonTaskRepository
+from benchmarks.synthetic import InMemoryTaskRepository, generate_tasks, write_calendar
+
+# Operations per mutation benchmark run
+MUTATIONS = 100
+
+# setup(size, workdir) prepares untimed state and returns the callable to time
+Setup = Callable[[int, Path], Callable[[], None]]
+
+
+@dataclass
+class Benchmark:
+    """One timed operation"""
+    name: str
+    setup: Setup
+    requires_gtk: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of a Benchmark at one project size"""
+    name: str
+    size: int
+    best_ms: float
+    median_ms: float
+    runs_ms: List[float] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Service mutations (in-memory repository: no disk I/O)
+# ---------------------------------------------------------------------------
+
+def _memory_service(size: int) -> EisenhowerMatrixService:
+    return EisenhowerMatrixService(InMemoryTaskRepository(generate_tasks(size)))
+
+
+def _targets(service: EisenhowerMatrixService, count: int = MUTATIONS) -> List[Tuple[int, str]]:
+    """Deterministic sample of active tasks as (quadrant, uid)"""
+    active = [
+        (quadrant, task.uid)
+        for quadrant in range(1, 5)
+        for task in service.get_tasks(quadrant)
+        if not task.completed and not task.archived
+    ]
+    return random.Random(42).sample(active, min(count, len(active)))
+
+
+def _bench_add(size: int, workdir: Path):
+    service = _memory_service(size)
+    
+    def run():
+        for n in range(MUTATIONS):
+            service.add_task(1 + n % 4, f"Benchmark task {n}", notes="notes", tags=['bench'])
+    return run
+
+
+def _bench_update(size: int, workdir: Path):
+    service = _memory_service(size)
+    targets = _targets(service)
+    
+    def run():
+        for quadrant, uid in targets:
+            service.update_task(quadrant, uid, description="Updated", notes="Updated notes")
+    return run
+
+
+def _bench_complete(size: int, workdir: Path):
+    service = _memory_service(size)
+    targets = _targets(service)
+    
+    def run():
+        for quadrant, uid in targets:
+            service.complete_task(quadrant, uid)
+    return run
+
+
+def _bench_archive(size: int, workdir: Path):
+    service = _memory_service(size)
+    targets = _targets(service)
+    
+    def run():
+        for quadrant, uid in targets:
+            service.archive_task(quadrant, uid)
+    return run
+
+
+def _bench_move(size: int, workdir: Path):
+    service = _memory_service(size)
+    targets = _targets(service)
+    
+    def run():
+        for quadrant, uid in targets:
+            service.move_task(quadrant, uid, quadrant % 4 + 1)
+    return run
+
+
+def _bench_remove(size: int, workdir: Path):
+    service = _memory_service(size)
+    targets = _targets(service)
+    
+    def run():
+        for quadrant, uid in targets:
+            service.remove_task(quadrant, uid)
+    return run
+
+
+def _bench_batch(size: int, workdir: Path):
+    service = _memory_service(size)
+    targets = _targets(service)
+    
+    def run():
+        with service.batch("Benchmark"):
+            for quadrant, uid in targets:
+                service.complete_task(quadrant, uid)
+    return run
+
+
+def _bench_undo(size: int, workdir: Path):
+    service = _memory_service(size)
+    for quadrant, uid in _targets(service):
+        service.complete_task(quadrant, uid)
+    
+    def run():
+        while service.undo():
+            pass
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def _bench_search(size: int, workdir: Path):
+    service = _memory_service(size)
+    
+    def run():
+        service.search_tasks("budget review")
+        service.search_tasks("finance")
+    return run
+
+
+def _bench_overdue(size: int, workdir: Path):
+    service = _memory_service(size)
+    return lambda: service.get_overdue_tasks()
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+def _json_repository(size: int, workdir: Path) -> JsonTaskRepository:
+    """A JSON tasks file in workdir holding a synthetic project"""
+    repository = JsonTaskRepository(data_file=str(workdir / f"tasks_{size}.json"))
+    repository.save(generate_tasks(size))
+    return repository
+
+
+def _json_service(size: int, workdir: Path) -> EisenhowerMatrixService:
+    return EisenhowerMatrixService(_json_repository(size, workdir))
+
+
+def _bench_repository_load(size: int, workdir: Path):
+    repository = _json_repository(size, workdir)
+    # A fresh repository, so no state is carried over from saving
+    return JsonTaskRepository(data_file=str(repository.data_file)).load
+
+
+def _bench_repository_save(size: int, workdir: Path):
+    repository = _json_repository(size, workdir)
+    tasks = repository.load()
+    return lambda: repository.save(tasks)
+
+
+# ---------------------------------------------------------------------------
+# Import and export use cases
+# ---------------------------------------------------------------------------
+
+def _export_bench(method: str, suffix: str) -> Setup:
+    def setup(size: int, workdir: Path):
+        use_case = TaskExportUseCase(_json_service(size, workdir))
+        path = str(workdir / f"export_{size}{suffix}")
+        
+        def run():
+            if not getattr(use_case, method)(path):
+                raise RuntimeError(f"{method} failed")
+        return run
+    return setup
+
+
+def _import_bench(method: str, suffix: str, write: Callable[[EisenhowerMatrixService, str], None]) -> Setup:
+    def setup(size: int, workdir: Path):
+        path = str(workdir / f"import_{size}{suffix}")
+        write(_json_service(size, workdir), path)
+        # Import into an empty project
+        target = EisenhowerMatrixService(JsonTaskRepository(data_file=str(workdir / f"target_{size}.json")))
+        use_case = TaskImportUseCase(target)
+        
+        def run():
+            if not getattr(use_case, method)(path):
+                raise RuntimeError(f"{method} failed")
+        return run
+    return setup
+
+
+def _write_json(service: EisenhowerMatrixService, path: str) -> None:
+    service.export_to_file(path)
+
+
+def _write_csv(service: EisenhowerMatrixService, path: str) -> None:
+    TaskExportUseCase(service).export_to_csv(path)
+
+
+def _write_ics(service: EisenhowerMatrixService, path: str) -> None:
+    write_calendar(service.get_all_tasks(), path)
+
+
+# ---------------------------------------------------------------------------
+# UI
+# ---------------------------------------------------------------------------
+
+def _gtk_available() -> bool:
+    """Whether GTK can be imported and open a display"""
+    if importlib.util.find_spec('gi') is None:
+        return False
+    try:
+        import gi
+        gi.require_version('Gtk', '4.0')
+        from gi.repository import Gtk
+        return bool(Gtk.init_check())
+    except (ImportError, ValueError, RuntimeError):
+        return False
+
+
+def _panel(service: EisenhowerMatrixService):
+    from eisenhower_matrix.infrastructure.ui.quadrant_panel import QuadrantPanel
+    
+    def ignore(*args):
+        pass
+    # Q2 is the largest quadrant of synthetic projects
+    return QuadrantPanel(2, service, ignore, ignore, ignore, ignore, ignore, ignore)
+
+
+def _populate(panel) -> None:
+    """Refresh panel and run its incremental populate to completion"""
+    panel.refresh()
+    while panel._populate is not None:
+        panel._run_populate_slice()
+    panel._cancel_populate()
+
+
+def _bench_panel_populate(size: int, workdir: Path):
+    service = _memory_service(size)
+    panel = _panel(EisenhowerMatrixService(InMemoryTaskRepository()))
+    
+    def run():
+        panel.set_service(service)
+        _populate(panel)
+    return run
+
+
+def _bench_panel_update(size: int, workdir: Path):
+    service = _memory_service(size)
+    panel = _panel(service)
+    _populate(panel)
+    task = next(t for t in service.get_tasks(2) if not t.completed)
+    
+    def run():
+        service.update_task(2, task.uid, description="Updated")
+        _populate(panel)
+    return run
+
+
+BENCHMARKS = [
+    Benchmark(f'service.add_task x{MUTATIONS}', _bench_add),
+    Benchmark(f'service.update_task x{MUTATIONS}', _bench_update),
+    Benchmark(f'service.complete_task x{MUTATIONS}', _bench_complete),
+    Benchmark(f'service.archive_task x{MUTATIONS}', _bench_archive),
+    Benchmark(f'service.move_task x{MUTATIONS}', _bench_move),
+    Benchmark(f'service.remove_task x{MUTATIONS}', _bench_remove),
+    Benchmark(f'service.batch complete x{MUTATIONS}', _bench_batch),
+    Benchmark(f'service.undo x{MUTATIONS}', _bench_undo),
+    Benchmark('service.search_tasks', _bench_search),
+    Benchmark('service.get_overdue_tasks', _bench_overdue),
+    Benchmark('repository.load', _bench_repository_load),
+    Benchmark('repository.save', _bench_repository_save),
+    Benchmark('export.json', _export_bench('export_to_json', '.json')),
+    Benchmark('export.csv', _export_bench('export_to_csv', '.csv')),
+    Benchmark('export.markdown', _export_bench('export_to_markdown', '.md')),
+    Benchmark('export.calendar_csv', _export_bench('export_to_calendar_csv', '.csv')),
+    Benchmark('import.json', _import_bench('import_from_json', '.json', _write_json)),
+    Benchmark('import.csv', _import_bench('import_from_csv', '.csv', _write_csv)),
+    Benchmark('import.calendar', _import_bench('import_from_calendar', '.ics', _write_ics)),
+    Benchmark('ui.quadrant_panel.refresh populate', _bench_panel_populate, requires_gtk=True),
+    Benchmark('ui.quadrant_panel.refresh update', _bench_panel_update, requires_gtk=True),
+]
+
+
+def measure(benchmark: Benchmark, size: int, runs: int) -> BenchmarkResult:
+    """Run benchmark runs times with fresh state, keeping every timing"""
+    timings = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory(prefix='eisenhower-bench-') as workdir:
+            run = benchmark.setup(size, Path(workdir))
+            start = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - start) * 1000.0)
+    return BenchmarkResult(
+        name=benchmark.name,
+        size=size,
+        best_ms=min(timings),
+        median_ms=statistics.median(timings),
+        runs_ms=timings,
+    )
+
+
+def compare(results: List[BenchmarkResult], baseline: dict) -> List[Tuple[BenchmarkResult, Optional[float]]]:
+    """
+    Pair results with their ratio to the baseline's best time
+    
+    Returns:
+        (result, best_ms / baseline best_ms), the ratio None when the
+        baseline has no entry for the benchmark at that size
+    """
+    reference: Dict[Tuple[str, int], float] = {
+        (entry['name'], entry['size']): entry['best_ms']
+        for entry in baseline.get('results', [])
+    }
+    paired = []
+    for result in results:
+        base = reference.get((result.name, result.size))
+        paired.append((result, result.best_ms / base if base else None))
+    return paired
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='project sizes in tasks')
+    parser.add_argument('--runs', type=int, default=3, help='runs per benchmark (best is kept)')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains TEXT')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--baseline', help='compare against results JSON from an earlier run')
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help='slowdown factor over the baseline counted as a regression')
+    parser.add_argument('--noise-ms', type=float, default=1.0,
+                        help='slowdowns smaller than this are never regressions')
+    args = parser.parse_args(argv)
+    
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+    
+    has_gtk = _gtk_available()
+    results = []
+    skipped = []
+    for benchmark in BENCHMARKS:
+        if args.filter not in benchmark.name:
+            continue
+        if benchmark.requires_gtk and not has_gtk:
+            skipped.append(benchmark.name)
+            continue
+        for size in args.sizes:
+            result = measure(benchmark, size, args.runs)
+            results.append(result)
+            print(f"{result.name:40} {result.size:>7}  {result.best_ms:10.2f} ms  "
+                  f"(median {result.median_ms:.2f} ms)", flush=True)
+    for name in skipped:
+        print(f"{name:40} skipped (GTK not available)")
+    
+    if args.output:
+        report = {
+            'created': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'runs': args.runs,
+            'results': [asdict(r) for r in results],
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    if baseline is None:
+        return 0
+    
+    print(f"\nCompared with {args.baseline} (tolerance {args.tolerance:.2f}x):")
+    regressions = 0
+    for result, ratio in compare(results, baseline):
+        if ratio is None:
+            status, change = 'new', ''
+        else:
+            slower_ms = result.best_ms - result.best_ms / ratio
+            status = 'FAIL' if ratio > args.tolerance and slower_ms > args.noise_ms else 'ok'
+            change = f"{ratio:6.2f}x"
+        regressions += status == 'FAIL'
+        print(f"{status:4}  {result.name:40} {result.size:>7}  {change}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
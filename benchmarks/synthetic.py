@@ -0,0 +1,199 @@
+"""
+Deterministic synthetic projects for benchmarks
+
+The same (count, seed) always yields the same tasks, uids included, so
+timings from different runs and machines describe the same workload.
+Due dates are spread around a reference day (today by default), which
+keeps the share of overdue tasks stable whenever the benchmark runs.
+
+Run as a module to write a project file, e.g. to try the app with it::
+
+    python -m benchmarks.synthetic 50000 --profile long-lived --output tasks.json
+    python -m benchmarks.synthetic 1000 --set notes_words_mean=200 --output tasks.json
+"""
+
+import argparse
+import random
+import sys
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from eisenhower_matrix.domain import ITaskRepository, Task
+from eisenhower_matrix.infrastructure.persistence import JsonTaskRepository
+
+# Creation times are anchored here so task data does not depend on the clock
+EPOCH = datetime(2025, 1, 1, 9, 0, 0)
+
+WORDS = [
+    'report', 'budget', 'review', 'client', 'deploy', 'invoice', 'meeting',
+    'draft', 'design', 'release', 'hiring', 'roadmap', 'backup', 'audit',
+    'refactor', 'support', 'training', 'research', 'migration', 'planning',
+]
+TAGS = ['work', 'home', 'urgent', 'finance', 'team', 'health', 'errand', 'idea']
+
+
+@dataclass(frozen=True)
+class WorkloadProfile:
+    """
+    Shape of a synthetic project
+    
+    Tags follow a Zipf-like distribution (a few tags on most tasks) and
+    notes lengths an exponential one (mostly short, a long tail), as in
+    real task lists.
+    """
+    # Share of tasks per quadrant, Q1..Q4
+    quadrant_weights: Tuple[float, float, float, float] = (0.2, 0.35, 0.15, 0.3)
+    description_words: Tuple[int, int] = (2, 6)
+    notes_words_mean: float = 10.0
+    tag_vocabulary: int = 8
+    tags_per_task: Tuple[int, int] = (0, 3)
+    metadata_ratio: float = 0.2
+    metadata_keys: Tuple[int, int] = (1, 2)
+    due_ratio: float = 0.5
+    # Due dates fall within this many days either side of the reference
+    due_spread_days: int = 30
+    completed_ratio: float = 0.33
+    # Share of completed tasks that are also archived
+    archived_ratio: float = 0.1
+
+
+PROFILES: Dict[str, WorkloadProfile] = {
+    'default': WorkloadProfile(),
+    # Few, detailed tasks: long notes, many tags and metadata
+    'detailed': WorkloadProfile(notes_words_mean=80.0, tag_vocabulary=40, tags_per_task=(1, 6),
+                                metadata_ratio=0.7, metadata_keys=(1, 5)),
+    # Years of use: most tasks done, a large archive, old due dates
+    'long-lived': WorkloadProfile(completed_ratio=0.85, archived_ratio=0.8, due_spread_days=720,
+                                  tag_vocabulary=25),
+}
+
+
+def _tag_names(count: int) -> List[str]:
+    return TAGS[:count] + [f"tag{n}" for n in range(len(TAGS), count)]
+
+
+def generate_tasks(count: int, seed: int = 1234, reference: Optional[datetime] = None,
+                   profile: WorkloadProfile = WorkloadProfile()) -> Dict[int, List[Task]]:
+    """
+    Generate a synthetic project
+    
+    Args:
+        count: Number of tasks
+        seed: Random seed
+        reference: Day due dates are spread around (defaults to today)
+        profile: Distributions to draw tasks from
+    
+    Returns:
+        Tasks by quadrant, ordinals unique within each quadrant
+    """
+    rng = random.Random(seed)
+    reference = reference or datetime.now()
+    tags = _tag_names(profile.tag_vocabulary)
+    tag_weights = [1.0 / rank for rank in range(1, len(tags) + 1)]
+    tasks: Dict[int, List[Task]] = {1: [], 2: [], 3: [], 4: []}
+    for n in range(count):
+        quadrant = rng.choices(range(1, 5), profile.quadrant_weights)[0]
+        created = EPOCH + timedelta(minutes=n)
+        notes_words = int(rng.expovariate(1.0 / profile.notes_words_mean)) if profile.notes_words_mean else 0
+        task_tags = rng.choices(tags, tag_weights, k=rng.randint(*profile.tags_per_task)) if tags else []
+        metadata = {}
+        if rng.random() < profile.metadata_ratio:
+            for key in range(rng.randint(*profile.metadata_keys)):
+                metadata[f"field{key}"] = rng.choice(WORDS)
+        task = Task(
+            id=len(tasks[quadrant]) + 1,
+            description=' '.join(rng.choices(WORDS, k=rng.randint(*profile.description_words))).capitalize(),
+            created=created.isoformat(),
+            notes=' '.join(rng.choices(WORDS, k=notes_words)),
+            tags=list(dict.fromkeys(task_tags)),
+            metadata=metadata,
+            uid='%032x' % rng.getrandbits(128),
+        )
+        if rng.random() < profile.due_ratio:
+            offset = rng.randint(-profile.due_spread_days, profile.due_spread_days)
+            task.due_date = (reference + timedelta(days=offset)).date().isoformat()
+        if rng.random() < profile.completed_ratio:
+            task.completed = True
+            task.completed_at = (created + timedelta(days=rng.randint(0, 60))).isoformat()
+            if rng.random() < profile.archived_ratio:
+                task.archived = True
+                task.archived_at = task.completed_at
+        tasks[quadrant].append(task)
+    return tasks
+
+
+def write_calendar(tasks: Dict[int, List[Task]], file_path: str) -> None:
+    """Write tasks as iCalendar events, for calendar import benchmarks"""
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0']
+    for task_list in tasks.values():
+        for task in task_list:
+            lines += ['BEGIN:VEVENT', f"UID:{task.uid}", f"SUMMARY:{task.description}"]
+            if task.due_date:
+                lines.append(f"DTSTART;VALUE=DATE:{task.due_date.replace('-', '')}")
+            lines.append('END:VEVENT')
+    lines.append('END:VCALENDAR')
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+class InMemoryTaskRepository(ITaskRepository):
+    """
+    ITaskRepository that keeps tasks in memory
+    
+    Lets service benchmarks measure the service itself rather than disk I/O.
+    """
+    
+    def __init__(self, tasks: Optional[Dict[int, List[Task]]] = None):
+        self._tasks = tasks or {1: [], 2: [], 3: [], 4: []}
+    
+    def save(self, tasks: Dict[int, List[Task]]) -> None:
+        self._tasks = tasks
+    
+    def load(self) -> Dict[int, List[Task]]:
+        return {q: list(task_list) for q, task_list in self._tasks.items()}
+    
+    def export_to_file(self, filepath: str, tasks: Dict[int, List[Task]]) -> None:
+        raise NotImplementedError("InMemoryTaskRepository has no file format")
+    
+    def import_from_file(self, filepath: str) -> Dict[int, List[Task]]:
+        raise NotImplementedError("InMemoryTaskRepository has no file format")
+
+
+def _parse_override(profile: WorkloadProfile, text: str) -> WorkloadProfile:
+    """Apply a NAME=VALUE override (tuples as comma-separated values)"""
+    name, _, value = text.partition('=')
+    current = {f.name: getattr(profile, f.name) for f in fields(profile)}
+    if name not in current:
+        raise ValueError(f"unknown profile field: {name}")
+    if isinstance(current[name], tuple):
+        parsed = tuple(type(item)(part) for item, part in zip(current[name], value.split(',')))
+        if len(parsed) != len(current[name]):
+            raise ValueError(f"{name} takes {len(current[name])} comma-separated values")
+    else:
+        parsed = type(current[name])(value)
+    return replace(profile, **{name: parsed})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic project as a tasks file")
+    parser.add_argument('tasks', type=int, help='number of tasks')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='default')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help='override a WorkloadProfile field (repeatable)')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', required=True, help='tasks file to write')
+    args = parser.parse_args(argv)
+    
+    profile = PROFILES[args.profile]
+    try:
+        for override in args.set:
+            profile = _parse_override(profile, override)
+    except ValueError as e:
+        parser.error(str(e))
+    tasks = generate_tasks(args.tasks, args.seed, profile=profile)
+    JsonTaskRepository(data_file=args.output).save(tasks)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
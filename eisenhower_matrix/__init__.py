@@ -7,29 +7,33 @@ Hexagonal Architecture (Ports and Adapters):
 - Infrastructure: Adapters for persistence and UI
 
 SOLID Principles applied throughout.
+
+Exports are resolved lazily (PEP 562) so that headless consumers of the
+domain and application layers never pay the GTK import cost.
 """
 
+from eisenhower_matrix._lazy import lazy_exports
+
 __version__ = "1.0.4"
 __author__ = "Alex Silva"
 
-# Export domain abstractions
-from eisenhower_matrix.domain import (
-    Task,
-    QuadrantInfo,
-    ITaskRepository,
-    IObserver,
-)
-
-# Export application services
-from eisenhower_matrix.application import (
-    EisenhowerMatrixService,
-    TaskManagementUseCase,
-    TaskExportUseCase,
-    TaskImportUseCase
-)
-
-# Export infrastructure implementations
-from eisenhower_matrix.infrastructure import JsonTaskRepository, EisenhowerApp, MainWindow
+# Exported name -> module that defines it
+_LAZY_EXPORTS = {
+    # Domain abstractions
+    'Task': 'eisenhower_matrix.domain',
+    'QuadrantInfo': 'eisenhower_matrix.domain',
+    'ITaskRepository': 'eisenhower_matrix.domain',
+    'IObserver': 'eisenhower_matrix.domain',
+    # Application services
+    'EisenhowerMatrixService': 'eisenhower_matrix.application',
+    'TaskManagementUseCase': 'eisenhower_matrix.application',
+    'TaskExportUseCase': 'eisenhower_matrix.application',
+    'TaskImportUseCase': 'eisenhower_matrix.application',
+    # Infrastructure implementations
+    'JsonTaskRepository': 'eisenhower_matrix.infrastructure.persistence',
+    'EisenhowerApp': 'eisenhower_matrix.infrastructure.ui',
+    'MainWindow': 'eisenhower_matrix.infrastructure.ui',
+}
 
 __all__ = [
     'Task',
@@ -44,3 +48,5 @@ __all__ = [
     'TaskExportUseCase',
     'TaskImportUseCase',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
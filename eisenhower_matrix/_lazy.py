@@ -0,0 +1,39 @@
+"""
+Lazy Package Exports (PEP 562)
+
+Packages whose exports would pull in heavy dependencies (GTK, the whole
+diagnostics toolkit) resolve them on first access instead of at import.
+"""
+
+import importlib
+import sys
+
+# Builtin annotations only: importing typing here would double the cost
+# of `import eisenhower_matrix`
+
+
+def lazy_exports(module_name: str, exports: dict) -> tuple:
+    """
+    Build the module __getattr__ and __dir__ of a package with lazy exports
+    
+    Args:
+        module_name: __name__ of the package
+        exports: Exported name -> module that defines it (str -> str)
+    
+    Returns:
+        (__getattr__, __dir__) to assign at package level
+    """
+    def __getattr__(name):
+        """Import exported names on first access"""
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+    
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+    
+    return __getattr__, __dir__
@@ -12,10 +12,14 @@ from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
 from eisenhower_matrix.application.task_management import TaskManagementUseCase
 from eisenhower_matrix.application.task_export import TaskExportUseCase
 from eisenhower_matrix.application.task_import import TaskImportUseCase
+from eisenhower_matrix.application.service_cache import ProjectServiceCache
+from eisenhower_matrix.application.global_search import GlobalSearchService
 
 __all__ = [
     'EisenhowerMatrixService',
     'TaskManagementUseCase',
     'TaskExportUseCase',
     'TaskImportUseCase',
+    'ProjectServiceCache',
+    'GlobalSearchService',
 ]
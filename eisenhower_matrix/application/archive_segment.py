@@ -0,0 +1,79 @@
+"""Cold Archive Segment"""
+
+from typing import Dict, List, Optional, Tuple
+from eisenhower_matrix.domain.task import Task
+from eisenhower_matrix.domain.archive_repository import IArchiveRepository
+
+
+class ArchiveSegment:
+    """
+    In-memory view of a project's archived tasks
+    
+    Single Responsibility: Track archived tasks and their unsaved changes
+    
+    Nothing is read from the repository until the entries are first
+    needed. Changes made before that are buffered, replayed over the
+    archive once it is loaded, and written by flush() as appended records.
+    """
+    
+    def __init__(self, repository: IArchiveRepository):
+        self._repository = repository
+        # uid -> (quadrant, task), least recently archived first; None until loaded
+        self._entries: Optional[Dict[str, Tuple[int, Task]]] = None
+        # uid -> entry to store, or None to drop; not yet flushed
+        self._pending: Dict[str, Optional[Tuple[int, Task]]] = {}
+        self._rewrite = False
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._entries is not None
+    
+    def load(self) -> None:
+        """Read the archive (once)"""
+        if self._entries is not None:
+            return
+        entries = {task.uid: (quadrant, task) for quadrant, task in self._repository.load()}
+        for uid, entry in self._pending.items():
+            if entry is None:
+                entries.pop(uid, None)
+            else:
+                entries[uid] = entry
+        self._entries = entries
+    
+    def entries(self) -> Dict[str, Tuple[int, Task]]:
+        """All archived entries by uid, loading the archive if needed"""
+        self.load()
+        return self._entries
+    
+    def tasks(self, quadrant: int) -> List[Task]:
+        """Archived tasks of quadrant, most recently archived first"""
+        return [task for q, task in reversed(list(self.entries().values())) if q == quadrant]
+    
+    def put(self, quadrant: int, task: Task) -> None:
+        """Add task to the archive, or record that an archived task changed"""
+        self._pending[task.uid] = (quadrant, task)
+        if self._entries is not None:
+            self._entries[task.uid] = (quadrant, task)
+    
+    def drop(self, task: Task) -> None:
+        """Remove task from the archive"""
+        self._pending[task.uid] = None
+        if self._entries is not None:
+            self._entries.pop(task.uid, None)
+    
+    def replace(self, entries: List[Tuple[int, Task]]) -> None:
+        """Replace the whole archive"""
+        self._entries = {task.uid: (quadrant, task) for quadrant, task in entries}
+        self._pending.clear()
+        self._rewrite = True
+    
+    def flush(self) -> None:
+        """Write unsaved changes"""
+        if self._rewrite:
+            self._repository.rewrite(list(self._entries.values()))
+        elif self._pending:
+            stored = [entry for entry in self._pending.values() if entry is not None]
+            dropped = [uid for uid, entry in self._pending.items() if entry is None]
+            self._repository.append(stored, dropped)
+        self._pending.clear()
+        self._rewrite = False
@@ -0,0 +1,348 @@
+"""
+Undo/Redo Command Journal
+
+Every EisenhowerMatrixService mutation is recorded as a command: a label
+plus a short list of primitive operations (insert a task at a position,
+remove it, patch some of its fields, put it in or drop it from the
+archive). Operations hold only the delta and
+each has an O(1) inverse, so undoing never needs a snapshot of the whole
+task dictionary.
+"""
+
+import copy
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from typing import AbstractSet, Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+from eisenhower_matrix.domain.task import Task
+from eisenhower_matrix.application.archive_segment import ArchiveSegment
+from eisenhower_matrix.domain.task_merge import task_identity
+
+# Task fields a patch may change (everything but the identity)
+PATCHABLE_FIELDS = tuple(f.name for f in fields(Task) if f.name not in ('created', 'uid'))
+
+
+def _copy_value(value: Any) -> Any:
+    """Detach mutable field values (tags, metadata) from the task"""
+    return copy.copy(value) if isinstance(value, (list, dict)) else value
+
+
+def snapshot_task(task: Task) -> Dict[str, Any]:
+    """Patchable field values of a task"""
+    return {name: _copy_value(getattr(task, name)) for name in PATCHABLE_FIELDS}
+
+
+@dataclass(frozen=True)
+class InsertTask:
+    """Insert task at index of quadrant"""
+    quadrant: int
+    index: int
+    task: Task
+    
+    def apply(self, tasks: Dict[int, List[Task]], archive: Optional[ArchiveSegment] = None) -> bool:
+        task_list = tasks[self.quadrant]
+        if self.index > len(task_list):
+            return False
+        task_list.insert(self.index, self.task)
+        return True
+    
+    def inverse(self) -> 'RemoveTask':
+        return RemoveTask(self.quadrant, self.index, self.task)
+
+
+@dataclass(frozen=True)
+class RemoveTask:
+    """Remove the task at index of quadrant"""
+    quadrant: int
+    index: int
+    task: Task
+    
+    def apply(self, tasks: Dict[int, List[Task]], archive: Optional[ArchiveSegment] = None) -> bool:
+        task_list = tasks[self.quadrant]
+        if self.index >= len(task_list) or task_list[self.index] is not self.task:
+            return False
+        del task_list[self.index]
+        return True
+    
+    def inverse(self) -> InsertTask:
+        return InsertTask(self.quadrant, self.index, self.task)
+
+
+@dataclass(frozen=True)
+class PatchTask:
+    """Set fields of a task (only the fields that changed)"""
+    task: Task
+    before: Tuple[Tuple[str, Any], ...]
+    after: Tuple[Tuple[str, Any], ...]
+    
+    def apply(self, tasks: Dict[int, List[Task]], archive: Optional[ArchiveSegment] = None) -> bool:
+        for name, value in self.after:
+            setattr(self.task, name, _copy_value(value))
+        return True
+    
+    def inverse(self) -> 'PatchTask':
+        return PatchTask(self.task, self.after, self.before)
+
+
+@dataclass(frozen=True)
+class ArchivePut:
+    """Put task of quadrant in the archive"""
+    quadrant: int
+    task: Task
+    
+    def apply(self, tasks: Dict[int, List[Task]], archive: Optional[ArchiveSegment] = None) -> bool:
+        if archive is None:
+            return False
+        archive.put(self.quadrant, self.task)
+        return True
+    
+    def inverse(self) -> 'ArchiveDrop':
+        return ArchiveDrop(self.quadrant, self.task)
+
+
+@dataclass(frozen=True)
+class ArchiveDrop:
+    """Drop task of quadrant from the archive"""
+    quadrant: int
+    task: Task
+    
+    def apply(self, tasks: Dict[int, List[Task]], archive: Optional[ArchiveSegment] = None) -> bool:
+        if archive is None:
+            return False
+        archive.drop(self.task)
+        return True
+    
+    def inverse(self) -> ArchivePut:
+        return ArchivePut(self.quadrant, self.task)
+
+
+Operation = Union[InsertTask, RemoveTask, PatchTask, ArchivePut, ArchiveDrop]
+
+
+def patch_task(task: Task, mutate: Callable[[Task], None]) -> Optional[PatchTask]:
+    """
+    Apply mutate to task and describe the change
+    
+    Returns:
+        The patch, or None if mutate changed nothing
+    """
+    before = snapshot_task(task)
+    mutate(task)
+    after = snapshot_task(task)
+    changed = [name for name in PATCHABLE_FIELDS if before[name] != after[name]]
+    if not changed:
+        return None
+    return PatchTask(
+        task,
+        tuple((name, before[name]) for name in changed),
+        tuple((name, after[name]) for name in changed),
+    )
+
+
+@dataclass(frozen=True)
+class Command:
+    """One undoable user action"""
+    label: str
+    ops: Tuple[Operation, ...]
+    
+    def inverse_ops(self) -> List[Operation]:
+        return [op.inverse() for op in reversed(self.ops)]
+    
+    def touches(self, uids: AbstractSet[str]) -> bool:
+        """Whether any operation involves a task with one of the uids"""
+        return any(op.task.uid in uids for op in self.ops)
+
+
+def drop_touching(commands: Iterable[Command], uids: AbstractSet[str]) -> List[Command]:
+    """
+    Commands (oldest first) still undoable after tasks with uids changed
+    
+    The newest command touching those tasks is dropped along with every
+    older one, which could only be undone after it.
+    """
+    commands = list(commands)
+    for i in range(len(commands) - 1, -1, -1):
+        if commands[i].touches(uids):
+            return commands[i + 1:]
+    return commands
+
+
+def apply_ops(tasks: Dict[int, List[Task]], ops: Iterable[Operation],
+              archive: Optional[ArchiveSegment] = None) -> bool:
+    """
+    Apply operations all-or-nothing
+    
+    Returns:
+        False (with tasks left unchanged) if an operation no longer fits
+        the tasks, e.g. because they were changed outside the journal
+    """
+    applied = []
+    for op in ops:
+        if not op.apply(tasks, archive):
+            for done in reversed(applied):
+                done.inverse().apply(tasks, archive)
+            return False
+        applied.append(op)
+    return True
+
+
+class CommandJournal:
+    """
+    Bounded undo and redo stacks of commands
+    
+    Single Responsibility: Keep command history and its persisted form
+    
+    The persisted form is an append-only log of records ("do" a command,
+    "undo", "redo", "clear", "forget" tasks) so each action writes only
+    its own delta; records() returns a compacted equivalent log.
+    """
+    
+    def __init__(self, limit: int = 100):
+        self.limit = limit
+        self._undo: Deque[Command] = deque(maxlen=limit)
+        self._redo: List[Command] = []
+    
+    def __len__(self) -> int:
+        return len(self._undo) + len(self._redo)
+    
+    @property
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1].label if self._undo else None
+    
+    @property
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1].label if self._redo else None
+    
+    def push(self, command: Command) -> dict:
+        """Record a new command (clears redo); returns its log record"""
+        self._undo.append(command)
+        self._redo.clear()
+        return {'do': self._encode(command)}
+    
+    def pop_undo(self) -> Optional[Command]:
+        return self._undo.pop() if self._undo else None
+    
+    def pop_redo(self) -> Optional[Command]:
+        return self._redo.pop() if self._redo else None
+    
+    def push_undone(self, command: Command) -> dict:
+        """Command was undone; returns the log record"""
+        self._redo.append(command)
+        return {'undo': 1}
+    
+    def push_redone(self, command: Command) -> dict:
+        """Command was redone; returns the log record"""
+        self._undo.append(command)
+        return {'redo': 1}
+    
+    def clear(self) -> dict:
+        """Forget all history; returns the log record"""
+        self._undo.clear()
+        self._redo.clear()
+        return {'clear': 1}
+    
+    def forget(self, uids: Iterable[str]) -> Optional[dict]:
+        """
+        Drop commands invalidated by changes made outside the history
+        
+        A command touching one of the tasks can no longer be replayed, nor
+        can the undo commands older than it and the redo commands after it.
+        
+        Returns:
+            The log record, or None if no command touched the tasks
+        """
+        uids = frozenset(uids)
+        if not any(c.touches(uids) for c in list(self._undo) + self._redo):
+            return None
+        self._forget(uids)
+        return {'forget': sorted(uids)}
+    
+    def _forget(self, uids: AbstractSet[str]) -> None:
+        self._undo = deque(drop_touching(self._undo, uids), maxlen=self.limit)
+        # Redo stack: the next command to redo is last, so it is the "oldest"
+        self._redo = drop_touching(reversed(self._redo), uids)[::-1]
+    
+    def records(self) -> List[dict]:
+        """Compacted log reproducing the current stacks"""
+        # Redo commands are re-done then undone, most recently undone last
+        records = [{'do': self._encode(c)} for c in self._undo]
+        records += [{'do': self._encode(c)} for c in reversed(self._redo)]
+        records += [{'undo': 1}] * len(self._redo)
+        return records
+    
+    def restore(self, records: Iterable[dict], tasks: Dict[int, List[Task]]) -> None:
+        """
+        Rebuild the stacks from a log
+        
+        Tasks referenced by the log are resolved by identity to the objects
+        in tasks, so restored commands operate on the live tasks.
+        """
+        self.clear()
+        records = list(records)
+        registry = {task_identity(t): t for task_list in tasks.values() for t in task_list}
+        try:
+            # Tasks not in the live data are rebuilt from their latest logged state
+            latest = {}
+            for record in records:
+                for op in record.get('do', {}).get('ops', []):
+                    if op[0] != 'patch':
+                        # History written before tasks had uids is dropped
+                        latest[op[-1]['uid']] = Task(**op[-1])
+            for identity, task in latest.items():
+                registry.setdefault(identity, task)
+        except (KeyError, TypeError, IndexError, AttributeError):
+            return
+        
+        for record in records:
+            try:
+                if 'do' in record:
+                    self._undo.append(self._decode(record['do'], registry))
+                    self._redo.clear()
+                elif 'undo' in record and self._undo:
+                    self._redo.append(self._undo.pop())
+                elif 'redo' in record and self._redo:
+                    self._undo.append(self._redo.pop())
+                elif 'clear' in record:
+                    self.clear()
+                elif 'forget' in record:
+                    self._forget(frozenset(record['forget']))
+            except (KeyError, TypeError, ValueError, IndexError):
+                # Unreadable history is dropped rather than half-restored
+                self.clear()
+                return
+    
+    @staticmethod
+    def _encode(command: Command) -> dict:
+        ops = []
+        for op in command.ops:
+            if isinstance(op, PatchTask):
+                ops.append(['patch', task_identity(op.task), dict(op.before), dict(op.after)])
+            elif isinstance(op, (ArchivePut, ArchiveDrop)):
+                kind = 'archive-put' if isinstance(op, ArchivePut) else 'archive-drop'
+                ops.append([kind, op.quadrant, asdict(op.task)])
+            else:
+                kind = 'insert' if isinstance(op, InsertTask) else 'remove'
+                ops.append([kind, op.quadrant, op.index, asdict(op.task)])
+        return {'label': command.label, 'ops': ops}
+    
+    @staticmethod
+    def _decode(data: dict, registry: Dict[str, Task]) -> Command:
+        ops: List[Operation] = []
+        for op in data['ops']:
+            if op[0] == 'patch':
+                _, identity, before, after = op
+                ops.append(PatchTask(
+                    registry[identity],
+                    tuple((k, v) for k, v in before.items() if k in PATCHABLE_FIELDS),
+                    tuple((k, v) for k, v in after.items() if k in PATCHABLE_FIELDS),
+                ))
+                continue
+            if op[0] in ('archive-put', 'archive-drop'):
+                kind, quadrant, task_data = op
+                op_type = ArchivePut if kind == 'archive-put' else ArchiveDrop
+                ops.append(op_type(int(quadrant), registry[task_data['uid']]))
+                continue
+            kind, quadrant, index, task_data = op
+            task = registry[task_identity(Task(**task_data))]
+            op_type = InsertTask if kind == 'insert' else RemoveTask
+            ops.append(op_type(int(quadrant), int(index), task))
+        return Command(data['label'], tuple(ops))
@@ -0,0 +1,60 @@
+"""Application Service - Cross-project Global Search"""
+
+from typing import Dict, List
+from eisenhower_matrix.domain import IProjectRepository, ITaskSearchIndex, TaskSearchHit
+
+
+class GlobalSearchService:
+    """
+    Application Service - Searches tasks across all projects
+    
+    Single Responsibility: Query the shared search index and group hits
+    Dependency Inversion: Depends on ITaskSearchIndex and
+    IProjectRepository abstractions
+    """
+    
+    def __init__(self, index: ITaskSearchIndex, project_repository: IProjectRepository):
+        """
+        Initialize with dependencies (Dependency Injection)
+        
+        Args:
+            index: Implementation of ITaskSearchIndex port
+            project_repository: Used to order results and skip orphaned data
+        """
+        self._index = index
+        self._project_repository = project_repository
+    
+    def search(self, search_text: str, include_completed: bool = True,
+               include_archived: bool = False) -> Dict[str, Dict[int, List[TaskSearchHit]]]:
+        """
+        Search tasks of every project
+        
+        Args:
+            search_text: Text to search for in description, notes and tags
+            include_completed: Whether to include completed tasks
+            include_archived: Whether to include archived tasks
+            
+        Returns:
+            Mapping of project ID to a mapping of quadrant to hits. Projects
+            are ordered like ProjectManagementService.get_all_projects();
+            projects and quadrants without hits are omitted.
+        """
+        if not search_text or not search_text.strip():
+            return {}
+        
+        self._index.refresh()
+        
+        grouped: Dict[str, Dict[int, List[TaskSearchHit]]] = {}
+        for hit in self._index.search(search_text.strip()):
+            if hit.completed and not include_completed:
+                continue
+            if hit.archived and not include_archived:
+                continue
+            grouped.setdefault(hit.project_id, {}).setdefault(hit.quadrant, []).append(hit)
+        
+        results = {}
+        for project in self._project_repository.load_all():
+            if project.id in grouped:
+                quadrants = grouped[project.id]
+                results[project.id] = {q: quadrants[q] for q in sorted(quadrants)}
+        return results
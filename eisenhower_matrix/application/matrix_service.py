@@ -1,12 +1,24 @@
 """Application Service - Eisenhower Matrix Management"""
 
-from typing import Dict, List, Optional
-from eisenhower_matrix.domain.task import Task
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from eisenhower_matrix.domain.task import Task, TaskRef, new_task_uid
 from eisenhower_matrix.domain.quadrant_info import QuadrantInfo
 from eisenhower_matrix.domain.task_repository import ITaskRepository
+from eisenhower_matrix.domain.archive_repository import IArchiveRepository
+from eisenhower_matrix.domain.task_merge import task_identity
 from eisenhower_matrix.domain.observer import IObserver
+from eisenhower_matrix.application.archive_segment import ArchiveSegment
+from eisenhower_matrix.application.command_journal import (
+    ArchiveDrop, ArchivePut, Command, CommandJournal, InsertTask, Operation, RemoveTask,
+    apply_ops, drop_touching, patch_task
+)
+from eisenhower_matrix.diagnostics.tracing import span, traced
 
 
+@traced
 class EisenhowerMatrixService:
     """
     Application Service - Orchestrates task management operations
@@ -16,21 +28,216 @@ class EisenhowerMatrixService:
     Dependency Inversion: Depends on ITaskRepository abstraction, not concrete implementation
     """
     
-    def __init__(self, repository: ITaskRepository):
+    # Commands kept for undo
+    HISTORY_LIMIT = 100
+    
+    def __init__(self, repository: ITaskRepository, autoload: bool = True,
+                 archive: Optional[IArchiveRepository] = None, project_id: Optional[str] = None):
         """
         Initialize with repository dependency (Dependency Injection)
         
         Args:
             repository: Implementation of ITaskRepository port
+            autoload: Load tasks synchronously now. When False the service
+                starts empty and load_in_background() populates it.
+            archive: Cold storage for archived tasks. Archiving moves a
+                task there, so active tasks alone are loaded and saved;
+                the archive is read on first use. Without it archived
+                tasks stay among the active ones.
+            project_id: Project the tasks belong to, for diagnostics
         """
+        self.project_id = project_id
         self._repository = repository
-        self._tasks: Dict[int, List[Task]] = {}
+        self._archive = ArchiveSegment(archive) if archive is not None else None
+        self._tasks: Dict[int, List[Task]] = {1: [], 2: [], 3: [], 4: []}
+        # Task uid -> (quadrant, task)
+        self._index: Dict[str, Tuple[int, Task]] = {}
         self._observers: List[IObserver] = []
-        self._load_tasks()
+        self._version = 0
+        # Seconds the last save took (archive, tasks and history)
+        self._last_save_duration: Optional[float] = None
+        
+        # Nesting depth of batch() and whether a batched mutation is unsaved
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._batch_label: Optional[str] = None
+        # Depth of batches kept out of the undo history
+        self._unhistoried_depth = 0
+        
+        # Undo/redo history; commands and log records not yet saved
+        self._journal = CommandJournal(self.HISTORY_LIMIT)
+        self._unrecorded: List[Command] = []
+        self._journal_records: List[dict] = []
+        self._journal_log_length = 0
+        
+        # Background loading state (see load_in_background)
+        self._loaded = False
+        self._loader: Optional[threading.Thread] = None
+        self._load_lock = threading.Lock()
+        self._loaded_parts: List[Tuple[int, List[Task]]] = []
+        self._load_finished = False
+        self._pending_quadrants = set()
+        
+        if autoload:
+            self._load_tasks()
+    
+    @property
+    def version(self) -> int:
+        """
+        Data version, incremented on every mutation
+        
+        Lets read-side consumers (e.g. UI view caches) detect that the
+        task data changed without diffing it.
+        """
+        return self._version
+    
+    @property
+    def last_save_duration(self) -> Optional[float]:
+        """Seconds the most recent save took, or None before the first"""
+        return self._last_save_duration
+    
+    def trace_context(self) -> dict:
+        """Project and task count attached to slow-operation log entries"""
+        return {'project': self.project_id, 'tasks': self._task_count()}
     
     def _load_tasks(self) -> None:
         """Load tasks from repository"""
-        self._tasks = self._repository.load()
+        with span('repository.load', project=self.project_id) as s:
+            self._tasks = self._repository.load()
+            if s:
+                s.set(tasks=self._task_count())
+        self._loaded = True
+        self._version += 1
+        self._finish_load()
+    
+    def is_loading(self, quadrant: Optional[int] = None) -> bool:
+        """
+        Check whether a background load is still in progress
+        
+        Args:
+            quadrant: Optional quadrant (1-4). If given, only report whether
+                that quadrant is still waiting for its tasks.
+        """
+        if quadrant is None:
+            return self._loader is not None
+        return quadrant in self._pending_quadrants
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether tasks are in memory (a background load has finished)"""
+        return self._loaded and self._loader is None
+    
+    def load_in_background(self, dispatch: Callable[[Callable[[], None]], object]) -> None:
+        """
+        Load tasks on a worker thread, applying quadrants as they arrive
+        
+        The repository is read off the calling thread; each parsed quadrant
+        is handed back through dispatch and applied on the thread that owns
+        the service, followed by an observer notification. Mutations made
+        before loading finishes wait for it first, so nothing is lost.
+        
+        Args:
+            dispatch: Schedules a callable on the service's thread
+                (e.g. GLib.idle_add)
+        """
+        if self._loaded or self._loader is not None:
+            return
+        
+        self._pending_quadrants = {1, 2, 3, 4}
+        self._loader = threading.Thread(
+            target=self._background_load, args=(dispatch,),
+            name="task-loader", daemon=True
+        )
+        self._loader.start()
+    
+    def _background_load(self, dispatch: Callable[[Callable[[], None]], object]) -> None:
+        """Worker thread body: read quadrants and hand them to dispatch"""
+        try:
+            for quadrant, tasks in self._traced_load_quadrants():
+                with self._load_lock:
+                    self._loaded_parts.append((quadrant, tasks))
+                dispatch(self._apply_loaded_parts)
+        finally:
+            with self._load_lock:
+                self._load_finished = True
+            dispatch(self._apply_loaded_parts)
+    
+    def _traced_load_quadrants(self) -> Iterator[Tuple[int, List[Task]]]:
+        """repository.load_quadrants() with a span per quadrant"""
+        parts = iter(self._repository.load_quadrants())
+        while True:
+            with span('repository.load_quadrant', project=self.project_id) as s:
+                part = next(parts, None)
+                if part is None:
+                    return
+                if s:
+                    s.set(quadrant=part[0], tasks=len(part[1]))
+            yield part
+    
+    def _apply_loaded_parts(self) -> None:
+        """Apply quadrants delivered by the loader (service thread only)"""
+        with self._load_lock:
+            parts, self._loaded_parts = self._loaded_parts, []
+            finished = self._load_finished
+        
+        for quadrant, tasks in parts:
+            self._tasks[quadrant] = tasks
+            self._pending_quadrants.discard(quadrant)
+        if parts:
+            self._reindex()
+        
+        if finished and self._loader is not None:
+            self._loader = None
+            self._loaded = True
+            self._pending_quadrants.clear()
+            self._finish_load()
+        elif not parts:
+            return
+        
+        self._version += 1
+        self._notify_observers()
+    
+    def _finish_load(self) -> None:
+        """Index loaded tasks, move archived ones to the archive and restore history"""
+        moved = self._stow_archived()
+        self._reindex()
+        self._restore_journal()
+        if moved:
+            # Logged positions predate the move
+            self.clear_history()
+            self._flush_journal()
+    
+    def _stow_archived(self) -> bool:
+        """
+        Move archived tasks still among the active ones to the archive
+        
+        Migrates files written before the archive existed (or by a process
+        without one).
+        
+        Returns:
+            True if any task was moved (and the result saved)
+        """
+        if self._archive is None:
+            return False
+        moved = False
+        for quadrant, task_list in self._tasks.items():
+            if any(task.archived for task in task_list):
+                for task in task_list:
+                    if task.archived:
+                        self._archive.put(quadrant, task)
+                task_list[:] = [task for task in task_list if not task.archived]
+                moved = True
+        if moved:
+            self._archive.flush()
+            self._repository.save(self._tasks)
+        return moved
+    
+    def _ensure_loaded(self) -> None:
+        """Block until a background load finished before mutating tasks"""
+        loader = self._loader
+        if loader is not None:
+            loader.join()
+            self._apply_loaded_parts()
     
     def add_observer(self, observer: IObserver) -> None:
         """
@@ -47,8 +254,318 @@ class EisenhowerMatrixService:
     
     def _notify_observers(self) -> None:
         """Notify all observers of changes"""
-        for observer in self._observers:
-            observer.on_tasks_changed()
+        with span('service.notify_observers', observers=len(self._observers)):
+            for observer in self._observers:
+                observer.on_tasks_changed()
+    
+    def _commit_changes(self, label: Optional[str] = None,
+                        ops: Tuple[Optional[Operation], ...] = ()) -> None:
+        """
+        Persist tasks, bump the data version and notify observers
+        
+        Args:
+            label: Undo history label of the change
+            ops: Operations describing the change (None entries are skipped)
+        """
+        self._version += 1
+        ops = tuple(op for op in ops if op is not None)
+        if ops and self._unhistoried_depth:
+            self._forget_history({op.task.uid for op in ops})
+        elif ops:
+            self._unrecorded.append(Command(label or "Change", ops))
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._save()
+        self._notify_observers()
+    
+    def _save(self) -> None:
+        """Persist tasks, adopting the merge if storage changed meanwhile"""
+        started = time.perf_counter()
+        if self._unrecorded:
+            commands, self._unrecorded = self._unrecorded, []
+            label = commands[0].label if len(commands) == 1 else (self._batch_label or f"{len(commands)} changes")
+            ops = tuple(op for command in commands for op in command.ops)
+            self._journal_records.append(self._journal.push(Command(label, ops)))
+        
+        # Archive first: a crash in between leaves a task in both, never in neither
+        if self._archive is not None:
+            with span('archive.flush'):
+                self._archive.flush()
+        with span('repository.save') as s:
+            if s:
+                s.set(tasks=self._task_count())
+            self._repository.save(self._tasks)
+        merged = self._repository.poll_external_changes()
+        if merged is not None:
+            self._adopt_tasks(merged)
+        self._flush_journal()
+        self._last_save_duration = time.perf_counter() - started
+    
+    def _restore_journal(self) -> None:
+        """Reload the undo history saved with the tasks"""
+        records = self._repository.load_journal()
+        self._journal.restore(records, self._tasks)
+        self._journal_log_length = len(records)
+    
+    def _flush_journal(self) -> None:
+        """Append new history records, compacting the log once it grows"""
+        if not self._journal_records:
+            return
+        records, self._journal_records = self._journal_records, []
+        self._journal_log_length += len(records)
+        if self._journal_log_length > 4 * self.HISTORY_LIMIT:
+            records = self._journal.records()
+            self._repository.rewrite_journal(records)
+            self._journal_log_length = len(records)
+        else:
+            self._repository.append_journal(records)
+    
+    @property
+    def undo_label(self) -> Optional[str]:
+        """Label of the command undo() would revert, or None"""
+        return self._journal.undo_label
+    
+    @property
+    def redo_label(self) -> Optional[str]:
+        """Label of the command redo() would reapply, or None"""
+        return self._journal.redo_label
+    
+    def undo(self) -> Optional[str]:
+        """
+        Revert the most recent change
+        
+        Returns:
+            Label of the undone command, or None if there was nothing to undo
+        """
+        return self._replay(self._journal.pop_undo, lambda c: c.inverse_ops(), self._journal.push_undone)
+    
+    def redo(self) -> Optional[str]:
+        """
+        Reapply the most recently undone change
+        
+        Returns:
+            Label of the redone command, or None if there was nothing to redo
+        """
+        return self._replay(self._journal.pop_redo, lambda c: c.ops, self._journal.push_redone)
+    
+    def _replay(self, pop, ops_of, push) -> Optional[str]:
+        """Apply a history command's operations, then save and notify"""
+        self._ensure_loaded()
+        if self._batch_depth:
+            return None
+        
+        command = pop()
+        if command is None:
+            return None
+        ops = ops_of(command)
+        if not apply_ops(self._tasks, ops, self._archive):
+            # Tasks no longer match the history (e.g. edited elsewhere)
+            self._journal_records.append(self._journal.clear())
+            self._flush_journal()
+            return None
+        
+        for op in ops:
+            if isinstance(op, InsertTask):
+                self._index[op.task.uid] = (op.quadrant, op.task)
+            elif isinstance(op, RemoveTask):
+                self._index.pop(op.task.uid, None)
+        
+        self._journal_records.append(push(command))
+        self._version += 1
+        self._save()
+        self._notify_observers()
+        return command.label
+    
+    def _forget_history(self, uids: Set[str]) -> None:
+        """Drop history commands that tasks changed outside the history invalidate"""
+        pending = drop_touching(self._unrecorded, uids)
+        if len(pending) < len(self._unrecorded):
+            # A command pending in an enclosing batch was dropped; every
+            # journal command is older than it
+            self._unrecorded = pending
+            if len(self._journal):
+                self._journal_records.append(self._journal.clear())
+            return
+        record = self._journal.forget(uids)
+        if record is not None:
+            self._journal_records.append(record)
+    
+    def clear_history(self) -> None:
+        """Forget undo and redo history"""
+        self._unrecorded.clear()
+        if len(self._journal):
+            self._journal_records.append(self._journal.clear())
+    
+    def reload_external_changes(self) -> bool:
+        """
+        Pick up tasks another process wrote to storage
+        
+        Tasks equal to the ones already held keep their objects, so views
+        only update what actually changed. Skipped while loading or inside
+        a batch; the next save merges those changes instead.
+        
+        Returns:
+            True if tasks changed (observers were notified)
+        """
+        if not self._loaded or self._loader is not None or self._batch_depth:
+            return False
+        
+        external = self._repository.poll_external_changes()
+        if external is None or not self._adopt_tasks(external):
+            return False
+        self._flush_journal()
+        
+        self._version += 1
+        self._notify_observers()
+        return True
+    
+    def _adopt_tasks(self, tasks: Dict[int, List[Task]]) -> bool:
+        """
+        Replace tasks with a stored version, reusing unchanged task objects
+        
+        Returns:
+            True if anything differs from the tasks held before
+        """
+        pool: Dict[str, List[Task]] = {}
+        for task_list in self._tasks.values():
+            for task in task_list:
+                pool.setdefault(task_identity(task), []).append(task)
+        
+        adopted = {}
+        for quadrant in range(1, 5):
+            adopted[quadrant] = []
+            for task in tasks.get(quadrant, []):
+                candidates = pool.get(task_identity(task), [])
+                existing = next((c for c in candidates if c == task), None)
+                if existing is not None:
+                    candidates.remove(existing)
+                    task = existing
+                adopted[quadrant].append(task)
+        
+        changed = any(adopted[q] != self._tasks.get(q, []) for q in range(1, 5))
+        self._tasks = adopted
+        self._reindex()
+        if changed:
+            # History refers to tasks that were just replaced
+            self.clear_history()
+        return changed
+    
+    @contextmanager
+    def batch(self, label: Optional[str] = None,
+              record_history: bool = True) -> Iterator['EisenhowerMatrixService']:
+        """
+        Group mutations into a single save and observer notification
+        
+        Mutations inside the block apply immediately in memory; the
+        repository is written and observers are notified once when the
+        outermost block exits (also if it exits with an exception, so
+        memory and storage never diverge). Blocks may be nested. The
+        block is a single undo step.
+        
+        Args:
+            label: Undo history label (outermost block only)
+            record_history: False keeps the block's mutations out of the
+                undo history, for automatic changes the user did not make.
+                History commands touching the changed tasks are dropped
+                (with the commands that depend on them)
+        
+        Example:
+            with service.batch("Add tasks"):
+                for description in descriptions:
+                    service.add_task(2, description)
+        """
+        self._ensure_loaded()
+        if self._batch_depth == 0:
+            self._batch_label = label
+        self._batch_depth += 1
+        if not record_history:
+            self._unhistoried_depth += 1
+        with span('EisenhowerMatrixService.batch', label=label or ""):
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not record_history:
+                    self._unhistoried_depth -= 1
+                if self._batch_depth == 0:
+                    if self._batch_dirty:
+                        self._batch_dirty = False
+                        self._save()
+                        self._notify_observers()
+                    self._batch_label = None
+    
+    def _task_count(self) -> int:
+        """Number of active tasks"""
+        return sum(len(task_list) for task_list in self._tasks.values())
+    
+    def _reindex(self) -> None:
+        """Rebuild the uid index, giving duplicated uids a fresh one"""
+        self._index = {}
+        for quadrant, task_list in self._tasks.items():
+            for task in task_list:
+                if task.uid in self._index:
+                    task.uid = new_task_uid()
+                self._index[task.uid] = (quadrant, task)
+    
+    def find_task(self, uid: str) -> Optional[Tuple[int, Task]]:
+        """
+        Look up a task by its uid
+        
+        Archived tasks are found once the archive has been loaded.
+        
+        Returns:
+            (quadrant, task), or None if no task has that uid
+        """
+        entry = self._index.get(uid)
+        if entry is None and self._archive is not None and self._archive.is_loaded:
+            entry = self._archive.entries().get(uid)
+        return entry
+    
+    def _locate(self, quadrant: int, task_ref: TaskRef) -> Optional[Tuple[int, Task]]:
+        """
+        Find a task of quadrant by ordinal or uid
+        
+        Returns:
+            (list index, task), or None if quadrant has no such task
+        """
+        tasks = self._tasks[quadrant]
+        if isinstance(task_ref, str):
+            entry = self._index.get(task_ref)
+            if entry is None or entry[0] != quadrant:
+                return None
+            return next(((i, t) for i, t in enumerate(tasks) if t is entry[1]), None)
+        return next(((i, t) for i, t in enumerate(tasks) if t.id == task_ref), None)
+    
+    def _locate_archived(self, quadrant: int, task_ref: TaskRef) -> Optional[Task]:
+        """Find an archived task of quadrant by uid or ordinal, loading the archive"""
+        if self._archive is None:
+            return None
+        entries = self._archive.entries()
+        if isinstance(task_ref, str):
+            entry = entries.get(task_ref)
+            return entry[1] if entry is not None and entry[0] == quadrant else None
+        return next((t for q, t in entries.values() if q == quadrant and t.id == task_ref), None)
+    
+    def _patch_task(self, quadrant: int, task_id: TaskRef,
+                    mutate: Callable[[Task], None], label: str) -> bool:
+        """Apply mutate to an active or archived task and commit the change"""
+        found = self._locate(quadrant, task_id)
+        if found is not None:
+            self._commit_changes(label, (patch_task(found[1], mutate),))
+            return True
+        
+        task = self._locate_archived(quadrant, task_id)
+        if task is None:
+            return False
+        # Re-put the archived record; the drop makes the put undoable
+        drop = ArchiveDrop(quadrant, task)
+        drop.apply(self._tasks, self._archive)
+        patch = patch_task(task, mutate)
+        put = ArchivePut(quadrant, task)
+        put.apply(self._tasks, self._archive)
+        self._commit_changes(label, (drop, patch, put))
+        return True
     
     def _get_next_id(self, quadrant: int) -> int:
         """
@@ -81,19 +598,22 @@ class EisenhowerMatrixService:
         Raises:
             ValueError: If quadrant is invalid or description is empty
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
         task_id = self._get_next_id(quadrant)
         task = Task.create(task_id, description, notes, tags, metadata, due_date)
         
+        insert = InsertTask(quadrant, len(self._tasks[quadrant]), task)
         self._tasks[quadrant].append(task)
-        self._repository.save(self._tasks)
-        self._notify_observers()
+        self._index[task.uid] = (quadrant, task)
+        self._commit_changes("Add task", (insert,))
         
         return task
     
-    def update_task(self, quadrant: int, task_id: int, 
+    def update_task(self, quadrant: int, task_id: TaskRef, 
                     description: Optional[str] = None,
                     notes: Optional[str] = None,
                     tags: Optional[List[str]] = None,
@@ -107,180 +627,466 @@ class EisenhowerMatrixService:
         Returns:
             True if task was found and updated, False otherwise
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
-        for task in self._tasks[quadrant]:
-            if task.id == task_id:
-                task.update_details(description, notes, tags, metadata, due_date)
-                self._repository.save(self._tasks)
-                self._notify_observers()
-                return True
-        
-        return False
+        return self._patch_task(
+            quadrant, task_id,
+            lambda t: t.update_details(description, notes, tags, metadata, due_date),
+            "Edit task"
+        )
     
-    def complete_task(self, quadrant: int, task_id: int) -> bool:
+    def complete_task(self, quadrant: int, task_id: TaskRef) -> bool:
         """
         Mark task as completed
         
         Returns:
             True if task was found and completed, False otherwise
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
-        for task in self._tasks[quadrant]:
-            if task.id == task_id:
-                task.mark_completed()
-                self._repository.save(self._tasks)
-                self._notify_observers()
-                return True
-        
-        return False
+        return self._patch_task(quadrant, task_id, Task.mark_completed, "Complete task")
     
-    def uncomplete_task(self, quadrant: int, task_id: int) -> bool:
+    def uncomplete_task(self, quadrant: int, task_id: TaskRef) -> bool:
         """
         Mark task as not completed
         
         Returns:
             True if task was found and uncompleted, False otherwise
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
-        for task in self._tasks[quadrant]:
-            if task.id == task_id:
-                task.mark_uncompleted()
-                self._repository.save(self._tasks)
-                self._notify_observers()
-                return True
-        
-        return False
+        return self._patch_task(quadrant, task_id, Task.mark_uncompleted, "Reopen task")
     
-    def archive_task(self, quadrant: int, task_id: int) -> bool:
+    def archive_task(self, quadrant: int, task_id: TaskRef) -> bool:
         """
         Archive task
         
         Returns:
             True if task was found and archived, False otherwise
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
-        for task in self._tasks[quadrant]:
-            if task.id == task_id:
-                task.archive()
-                self._repository.save(self._tasks)
-                self._notify_observers()
-                return True
+        found = self._locate(quadrant, task_id)
+        if found is None:
+            return False
+        
+        index, task = found
+        patch = patch_task(task, Task.archive)
+        if self._archive is None:
+            self._commit_changes("Archive task", (patch,))
+            return True
         
-        return False
+        # Move the task to cold storage
+        del self._tasks[quadrant][index]
+        del self._index[task.uid]
+        put = ArchivePut(quadrant, task)
+        put.apply(self._tasks, self._archive)
+        self._commit_changes("Archive task", (patch, RemoveTask(quadrant, index, task), put))
+        return True
     
-    def unarchive_task(self, quadrant: int, task_id: int) -> bool:
+    def unarchive_task(self, quadrant: int, task_id: TaskRef) -> bool:
         """
         Unarchive task
         
         Returns:
             True if task was found and unarchived, False otherwise
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
-        for task in self._tasks[quadrant]:
-            if task.id == task_id:
-                task.unarchive()
-                self._repository.save(self._tasks)
-                self._notify_observers()
-                return True
+        found = self._locate(quadrant, task_id)
+        if found is not None:
+            patch = patch_task(found[1], Task.unarchive)
+            self._commit_changes("Unarchive task", (patch,))
+            return True
         
-        return False
+        task = self._locate_archived(quadrant, task_id)
+        if task is None:
+            return False
+        
+        # Bring the task back from cold storage, renumbering it on collision
+        drop = ArchiveDrop(quadrant, task)
+        drop.apply(self._tasks, self._archive)
+        taken = any(t.id == task.id for t in self._tasks[quadrant])
+        new_id = self._get_next_id(quadrant) if taken else task.id
+        
+        def restore(t: Task) -> None:
+            t.unarchive()
+            t.id = new_id
+        
+        patch = patch_task(task, restore)
+        insert = InsertTask(quadrant, len(self._tasks[quadrant]), task)
+        self._tasks[quadrant].append(task)
+        self._index[task.uid] = (quadrant, task)
+        self._commit_changes("Unarchive task", (drop, patch, insert))
+        return True
     
-    def remove_task(self, quadrant: int, task_id: int) -> bool:
+    def remove_task(self, quadrant: int, task_id: TaskRef) -> bool:
         """
         Remove a task from quadrant
         
         Returns:
             True if task was found and removed, False otherwise
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
-        initial_length = len(self._tasks[quadrant])
-        self._tasks[quadrant] = [
-            task for task in self._tasks[quadrant] if task.id != task_id
-        ]
-        
-        if len(self._tasks[quadrant]) < initial_length:
-            self._repository.save(self._tasks)
-            self._notify_observers()
+        found = self._locate(quadrant, task_id)
+        if found is None:
+            task = self._locate_archived(quadrant, task_id)
+            if task is None:
+                return False
+            drop = ArchiveDrop(quadrant, task)
+            drop.apply(self._tasks, self._archive)
+            self._commit_changes("Delete task", (drop,))
             return True
         
-        return False
+        index, task = found
+        del self._tasks[quadrant][index]
+        del self._index[task.uid]
+        self._commit_changes("Delete task", (RemoveTask(quadrant, index, task),))
+        return True
     
-    def move_task(self, from_quadrant: int, task_id: int, to_quadrant: int) -> bool:
+    def move_task(self, from_quadrant: int, task_id: TaskRef, to_quadrant: int) -> bool:
         """
         Move task from one quadrant to another
         
         Args:
             from_quadrant: Source quadrant (1-4)
-            task_id: Task ID to move
+            task_id: Task ordinal or uid to move
             to_quadrant: Destination quadrant (1-4)
             
         Returns:
             True if task was moved, False if not found
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(from_quadrant):
             raise ValueError(f"Invalid source quadrant: {from_quadrant}")
         if not QuadrantInfo.validate_quadrant(to_quadrant):
             raise ValueError(f"Invalid destination quadrant: {to_quadrant}")
         
         # Find and remove task from source
-        task_to_move = None
-        for task in self._tasks[from_quadrant]:
-            if task.id == task_id:
-                task_to_move = task
-                break
-        
-        if not task_to_move:
+        found = self._locate(from_quadrant, task_id)
+        if found is None:
             return False
         
-        self._tasks[from_quadrant].remove(task_to_move)
+        index, task_to_move = found
+        del self._tasks[from_quadrant][index]
         
-        # Assign new ID in destination quadrant
-        task_to_move.id = self._get_next_id(to_quadrant)
+        # Keep the ordinal unless it is taken in the destination quadrant
+        patch = None
+        if any(task.id == task_to_move.id for task in self._tasks[to_quadrant]):
+            new_id = self._get_next_id(to_quadrant)
+            patch = patch_task(task_to_move, lambda t: setattr(t, 'id', new_id))
+        insert = InsertTask(to_quadrant, len(self._tasks[to_quadrant]), task_to_move)
         self._tasks[to_quadrant].append(task_to_move)
+        self._index[task_to_move.uid] = (to_quadrant, task_to_move)
         
-        self._repository.save(self._tasks)
-        self._notify_observers()
+        self._commit_changes("Move task", (RemoveTask(from_quadrant, index, task_to_move), patch, insert))
         
         return True
     
-    def reorder_task(self, quadrant: int, task_id: int, direction: str) -> bool:
+    def _group_refs(self, task_refs: Iterable[Tuple[int, TaskRef]]) -> Dict[int, List[TaskRef]]:
+        """
+        Group (quadrant, task ref) pairs by quadrant
+        
+        Raises:
+            ValueError: If a quadrant is invalid
+        """
+        grouped: Dict[int, List[TaskRef]] = {}
+        for quadrant, task_ref in task_refs:
+            if not QuadrantInfo.validate_quadrant(quadrant):
+                raise ValueError(f"Invalid quadrant: {quadrant}")
+            grouped.setdefault(quadrant, []).append(task_ref)
+        return grouped
+    
+    def _locate_many(self, quadrant: int,
+                     task_refs: List[TaskRef]) -> Tuple[List[Tuple[int, Task]], List[TaskRef]]:
+        """
+        Find tasks of quadrant by ordinal or uid in one pass over its list
+        
+        Returns:
+            (list index, task) pairs in list order, each task once, and the
+            references that match no active task of quadrant
+        """
+        wanted = set()
+        ordinals = set()
+        for task_ref in task_refs:
+            if isinstance(task_ref, str):
+                entry = self._index.get(task_ref)
+                if entry is not None and entry[0] == quadrant:
+                    wanted.add(id(entry[1]))
+            else:
+                ordinals.add(task_ref)
+        
+        found = []
+        for index, task in enumerate(self._tasks[quadrant]):
+            if id(task) in wanted:
+                found.append((index, task))
+            elif task.id in ordinals:
+                # The first task with an ordinal wins, as in _locate
+                ordinals.discard(task.id)
+                found.append((index, task))
+        
+        uids = {task.uid for _, task in found}
+        ids = {task.id for _, task in found}
+        missing = [r for r in task_refs if (r not in uids if isinstance(r, str) else r not in ids)]
+        return found, missing
+    
+    def _locate_many_archived(self, quadrant: int,
+                              task_refs: List[TaskRef]) -> Tuple[List[Task], List[TaskRef]]:
+        """
+        Find archived tasks of quadrant by uid or ordinal, loading the archive
+        
+        Returns:
+            The tasks (each once) and the references that match none
+        """
+        if self._archive is None or not task_refs:
+            return [], list(task_refs)
+        entries = self._archive.entries()
+        by_ordinal: Dict[int, Task] = {}
+        if any(not isinstance(r, str) for r in task_refs):
+            for q, task in entries.values():
+                if q == quadrant:
+                    by_ordinal.setdefault(task.id, task)
+        
+        found: Dict[int, Task] = {}
+        missing = []
+        for task_ref in task_refs:
+            if isinstance(task_ref, str):
+                entry = entries.get(task_ref)
+                task = entry[1] if entry is not None and entry[0] == quadrant else None
+            else:
+                task = by_ordinal.get(task_ref)
+            if task is None:
+                missing.append(task_ref)
+            else:
+                found[id(task)] = task
+        return list(found.values()), missing
+    
+    def _remove_many(self, quadrant: int, found: List[Tuple[int, Task]]) -> List[RemoveTask]:
+        """
+        Remove found tasks from quadrant in one pass
+        
+        Returns:
+            Their removals, highest index first, so that applying them in
+            order (redo) or their inverses in reverse order (undo) keeps the
+            recorded indexes valid
+        """
+        removed = {id(task) for _, task in found}
+        task_list = self._tasks[quadrant]
+        task_list[:] = [task for task in task_list if id(task) not in removed]
+        for _, task in found:
+            del self._index[task.uid]
+        return [RemoveTask(quadrant, index, task) for index, task in reversed(found)]
+    
+    @staticmethod
+    def _bulk_label(verb: str, count: int) -> str:
+        return f"{verb} task" if count == 1 else f"{verb} {count} tasks"
+    
+    def complete_tasks(self, task_refs: Iterable[Tuple[int, TaskRef]]) -> List[Tuple[int, TaskRef]]:
+        """
+        Mark several tasks as completed with one save and one notification
+        
+        Args:
+            task_refs: (quadrant, task ordinal or uid) pairs; archived tasks
+                are completed in the archive, like complete_task does
+            
+        Returns:
+            The pairs that matched no task (empty if all were found)
+            
+        Raises:
+            ValueError: If a quadrant is invalid
+        """
+        self._ensure_loaded()
+        
+        ops: List[Optional[Operation]] = []
+        missing = []
+        count = 0
+        for quadrant, refs in self._group_refs(task_refs).items():
+            found, unmatched = self._locate_many(quadrant, refs)
+            ops.extend(patch_task(task, Task.mark_completed) for _, task in found)
+            archived, unmatched = self._locate_many_archived(quadrant, unmatched)
+            for task in archived:
+                # Re-put the archived record; the drop makes the put undoable
+                drop = ArchiveDrop(quadrant, task)
+                drop.apply(self._tasks, self._archive)
+                patch = patch_task(task, Task.mark_completed)
+                put = ArchivePut(quadrant, task)
+                put.apply(self._tasks, self._archive)
+                ops.extend((drop, patch, put))
+            count += len(found) + len(archived)
+            missing.extend((quadrant, r) for r in unmatched)
+        
+        if any(op is not None for op in ops):
+            self._commit_changes(self._bulk_label("Complete", count), tuple(ops))
+        return missing
+    
+    def archive_tasks(self, task_refs: Iterable[Tuple[int, TaskRef]]) -> List[Tuple[int, TaskRef]]:
+        """
+        Archive several tasks with one save and one notification
+        
+        Args:
+            task_refs: (quadrant, task ordinal or uid) pairs of active tasks
+            
+        Returns:
+            The pairs that matched no active task (empty if all were found)
+            
+        Raises:
+            ValueError: If a quadrant is invalid
+        """
+        self._ensure_loaded()
+        
+        ops: List[Optional[Operation]] = []
+        missing = []
+        count = 0
+        for quadrant, refs in self._group_refs(task_refs).items():
+            found, unmatched = self._locate_many(quadrant, refs)
+            missing.extend((quadrant, r) for r in unmatched)
+            if not found:
+                continue
+            count += len(found)
+            patches = {id(task): patch_task(task, Task.archive) for _, task in found}
+            if self._archive is None:
+                ops.extend(patches.values())
+                continue
+            
+            # Move the tasks to cold storage
+            for remove in self._remove_many(quadrant, found):
+                put = ArchivePut(quadrant, remove.task)
+                put.apply(self._tasks, self._archive)
+                ops.extend((patches[id(remove.task)], remove, put))
+        
+        if count:
+            self._commit_changes(self._bulk_label("Archive", count), tuple(ops))
+        return missing
+    
+    def remove_tasks(self, task_refs: Iterable[Tuple[int, TaskRef]]) -> List[Tuple[int, TaskRef]]:
+        """
+        Remove several tasks with one save and one notification
+        
+        Args:
+            task_refs: (quadrant, task ordinal or uid) pairs; archived tasks
+                are dropped from the archive, like remove_task does
+            
+        Returns:
+            The pairs that matched no task (empty if all were found)
+            
+        Raises:
+            ValueError: If a quadrant is invalid
+        """
+        self._ensure_loaded()
+        
+        ops: List[Operation] = []
+        missing = []
+        for quadrant, refs in self._group_refs(task_refs).items():
+            found, unmatched = self._locate_many(quadrant, refs)
+            ops.extend(self._remove_many(quadrant, found))
+            archived, unmatched = self._locate_many_archived(quadrant, unmatched)
+            for task in archived:
+                drop = ArchiveDrop(quadrant, task)
+                drop.apply(self._tasks, self._archive)
+                ops.append(drop)
+            missing.extend((quadrant, r) for r in unmatched)
+        
+        if ops:
+            self._commit_changes(self._bulk_label("Delete", len(ops)), tuple(ops))
+        return missing
+    
+    def move_tasks(self, task_refs: Iterable[Tuple[int, TaskRef]],
+                   to_quadrant: int) -> List[Tuple[int, TaskRef]]:
+        """
+        Move several tasks to one quadrant with one save and one notification
+        
+        Moved tasks are appended to the destination in their source order,
+        keeping their ordinals unless taken there. Tasks already in the
+        destination stay where they are.
+        
+        Args:
+            task_refs: (source quadrant, task ordinal or uid) pairs of active tasks
+            to_quadrant: Destination quadrant (1-4)
+            
+        Returns:
+            The pairs that matched no active task (empty if all were found)
+            
+        Raises:
+            ValueError: If a quadrant is invalid
+        """
+        self._ensure_loaded()
+        
+        if not QuadrantInfo.validate_quadrant(to_quadrant):
+            raise ValueError(f"Invalid destination quadrant: {to_quadrant}")
+        
+        ops: List[Optional[Operation]] = []
+        moving: List[Task] = []
+        missing = []
+        for quadrant, refs in self._group_refs(task_refs).items():
+            found, unmatched = self._locate_many(quadrant, refs)
+            missing.extend((quadrant, r) for r in unmatched)
+            if quadrant != to_quadrant and found:
+                ops.extend(self._remove_many(quadrant, found))
+                moving.extend(task for _, task in found)
+        if not moving:
+            return missing
+        
+        # Keep ordinals unless taken in the destination quadrant
+        destination = self._tasks[to_quadrant]
+        taken = {task.id for task in destination}
+        next_id = max(taken, default=0) + 1
+        for task in moving:
+            if task.id in taken:
+                new_id = next_id
+                ops.append(patch_task(task, lambda t, new_id=new_id: setattr(t, 'id', new_id)))
+            taken.add(task.id)
+            next_id = max(next_id, task.id + 1)
+            ops.append(InsertTask(to_quadrant, len(destination), task))
+            destination.append(task)
+            self._index[task.uid] = (to_quadrant, task)
+        
+        self._commit_changes(self._bulk_label("Move", len(moving)), tuple(ops))
+        return missing
+    
+    def reorder_task(self, quadrant: int, task_id: TaskRef, direction: str) -> bool:
         """
         Reorder a task within its quadrant (move up or down)
         
         Args:
             quadrant: Quadrant number (1-4)
-            task_id: Task ID to reorder
+            task_id: Task ordinal or uid to reorder
             direction: 'up' to move earlier in list, 'down' to move later
             
         Returns:
             True if task was reordered, False if not found or at boundary
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
         tasks = self._tasks[quadrant]
         
         # Find task index
-        task_index = None
-        for i, task in enumerate(tasks):
-            if task.id == task_id:
-                task_index = i
-                break
-        
-        if task_index is None:
+        found = self._locate(quadrant, task_id)
+        if found is None:
             return False
+        task_index = found[0]
         
         # Check boundaries
         if direction == 'up' and task_index == 0:
@@ -290,49 +1096,45 @@ class EisenhowerMatrixService:
         
         # Swap positions
         if direction == 'up':
-            tasks[task_index], tasks[task_index - 1] = tasks[task_index - 1], tasks[task_index]
+            new_index = task_index - 1
         elif direction == 'down':
-            tasks[task_index], tasks[task_index + 1] = tasks[task_index + 1], tasks[task_index]
+            new_index = task_index + 1
         else:
             return False
+        task = tasks.pop(task_index)
+        tasks.insert(new_index, task)
         
-        self._repository.save(self._tasks)
-        self._notify_observers()
+        self._commit_changes("Reorder task", (
+            RemoveTask(quadrant, task_index, task), InsertTask(quadrant, new_index, task)
+        ))
         return True
     
-    def reorder_task_relative(self, quadrant: int, task_id: int, position: str, target_task_id: int) -> bool:
+    def reorder_task_relative(self, quadrant: int, task_id: TaskRef, position: str, target_task_id: TaskRef) -> bool:
         """
         Reorder a task relative to another task (for drag and drop)
         
         Args:
             quadrant: Quadrant number (1-4)
-            task_id: Task ID to reorder
+            task_id: Task ordinal or uid to reorder
             position: 'before' or 'after' the target task
-            target_task_id: Task ID to position relative to
+            target_task_id: Task ordinal or uid to position relative to
             
         Returns:
             True if task was reordered, False if not found
         """
+        self._ensure_loaded()
+        
         if not QuadrantInfo.validate_quadrant(quadrant):
             raise ValueError(f"Invalid quadrant: {quadrant}")
         
         tasks = self._tasks[quadrant]
         
         # Find task and target indices
-        task_index = None
-        target_index = None
-        
-        for i, task in enumerate(tasks):
-            if task.id == task_id:
-                task_index = i
-            if task.id == target_task_id:
-                target_index = i
-        
-        if task_index is None or target_index is None:
+        found = self._locate(quadrant, task_id)
+        target = self._locate(quadrant, target_task_id)
+        if found is None or target is None:
             return False
-        
-        # Remove task from current position
-        task = tasks.pop(task_index)
+        task_index, target_index = found[0], target[0]
         
         # Insert at new position
         if position == 'before':
@@ -346,10 +1148,13 @@ class EisenhowerMatrixService:
         if task_index < target_index:
             insert_index -= 1
         
+        # Remove task from current position
+        task = tasks.pop(task_index)
         tasks.insert(insert_index, task)
         
-        self._repository.save(self._tasks)
-        self._notify_observers()
+        self._commit_changes("Reorder task", (
+            RemoveTask(quadrant, task_index, task), InsertTask(quadrant, insert_index, task)
+        ))
         return True
     
     def get_tasks(self, quadrant: int, include_completed: bool = True) -> List[Task]:
@@ -373,9 +1178,56 @@ class EisenhowerMatrixService:
         
         return tasks
     
-    def get_all_tasks(self) -> Dict[int, List[Task]]:
-        """Get all tasks from all quadrants"""
-        return self._tasks.copy()
+    def get_all_tasks(self, include_archived: bool = False) -> Dict[int, List[Task]]:
+        """
+        Get all tasks from all quadrants
+        
+        Args:
+            include_archived: Also return the archived tasks (loads the
+                archive); they follow the active ones
+        """
+        if not include_archived or self._archive is None:
+            return self._tasks.copy()
+        tasks = {quadrant: task_list[:] for quadrant, task_list in self._tasks.items()}
+        for quadrant, task in self._archive.entries().values():
+            tasks[quadrant].append(task)
+        return tasks
+    
+    @property
+    def is_archive_loaded(self) -> bool:
+        """Whether archived tasks are in memory (always, without an archive)"""
+        return self._archive is None or self._archive.is_loaded
+    
+    def load_archive(self) -> None:
+        """Read archived tasks now (otherwise they are read on first use)"""
+        if self._archive is not None:
+            self._archive.load()
+    
+    def get_archived_tasks(self, quadrant: int, offset: int = 0,
+                           limit: Optional[int] = None) -> List[Task]:
+        """
+        Get a page of a quadrant's archived tasks, most recent first
+        
+        Args:
+            quadrant: Quadrant number (1-4)
+            offset: Number of tasks to skip
+            limit: Maximum number of tasks, or None for all
+            
+        Returns:
+            Archived tasks (loads the archive)
+        """
+        if not QuadrantInfo.validate_quadrant(quadrant):
+            raise ValueError(f"Invalid quadrant: {quadrant}")
+        
+        if self._archive is None:
+            tasks = [task for task in reversed(self._tasks[quadrant]) if task.archived]
+        else:
+            tasks = self._archive.tasks(quadrant)
+        return tasks[offset:None if limit is None else offset + limit]
+    
+    def count_archived_tasks(self, quadrant: int) -> int:
+        """Number of a quadrant's archived tasks (loads the archive)"""
+        return len(self.get_archived_tasks(quadrant))
     
     def export_to_file(self, filepath: str) -> bool:
         """
@@ -385,7 +1237,20 @@ class EisenhowerMatrixService:
             True if export succeeded, False otherwise
         """
         try:
-            self._repository.export_to_file(filepath, self._tasks)
+            self._repository.export_to_file(filepath, self.get_all_tasks(include_archived=True))
+            return True
+        except Exception:
+            return False
+    
+    def export_tasks_to_file(self, filepath: str, tasks: Dict[int, List[Task]]) -> bool:
+        """
+        Export the given tasks (e.g. a selection) to a file
+        
+        Returns:
+            True if export succeeded, False otherwise
+        """
+        try:
+            self._repository.export_to_file(filepath, tasks)
             return True
         except Exception:
             return False
@@ -401,52 +1266,76 @@ class EisenhowerMatrixService:
         Returns:
             True if import succeeded, False otherwise
         """
+        self._ensure_loaded()
+        
         try:
             imported_tasks = self._repository.import_from_file(filepath)
             
+            ops = []
             if merge:
                 # Merge imported tasks with existing
                 for quadrant, tasks in imported_tasks.items():
                     for task in tasks:
-                        # Assign new ID to avoid conflicts
+                        # Assign new ID (and uid, if already present) to avoid conflicts
+                        if task.uid in self._index or self.find_task(task.uid):
+                            task.uid = new_task_uid()
+                        if task.archived and self._archive is not None:
+                            put = ArchivePut(quadrant, task)
+                            put.apply(self._tasks, self._archive)
+                            ops.append(put)
+                            continue
                         task.id = self._get_next_id(quadrant)
+                        ops.append(InsertTask(quadrant, len(self._tasks[quadrant]), task))
                         self._tasks[quadrant].append(task)
+                        self._index[task.uid] = (quadrant, task)
             else:
-                # Replace all tasks
+                # Replace all tasks; history refers to the old ones
+                if self._archive is not None:
+                    self._archive.replace([
+                        (quadrant, task)
+                        for quadrant, tasks in imported_tasks.items()
+                        for task in tasks if task.archived
+                    ])
+                    imported_tasks = {
+                        quadrant: [task for task in tasks if not task.archived]
+                        for quadrant, tasks in imported_tasks.items()
+                    }
                 self._tasks = imported_tasks
+                self._reindex()
+                self.clear_history()
             
-            self._repository.save(self._tasks)
-            self._notify_observers()
+            self._commit_changes("Import tasks", tuple(ops))
             return True
         except Exception:
             return False
     
-    def search_tasks(self, search_text: str, quadrant: Optional[int] = None) -> Dict[int, List[Task]]:
+    def search_tasks(self, search_text: str, quadrant: Optional[int] = None,
+                     include_archived: bool = False) -> Dict[int, List[Task]]:
         """
         Search for tasks matching search text
         
         Args:
             search_text: Text to search for in task description, notes, and tags
             quadrant: Optional quadrant to search in (1-4). If None, searches all quadrants.
+            include_archived: Also search archived tasks (loads the archive);
+                they follow the active ones
             
         Returns:
             Dictionary mapping quadrant numbers to matching tasks
         """
+        if quadrant is not None and not QuadrantInfo.validate_quadrant(quadrant):
+            raise ValueError(f"Invalid quadrant: {quadrant}")
+        
+        all_tasks = self.get_all_tasks(include_archived=include_archived)
+        quadrants_to_search = [quadrant] if quadrant is not None else range(1, 5)
+        
         if not search_text or not search_text.strip():
             # Return all tasks if no search text
-            if quadrant is not None:
-                if not QuadrantInfo.validate_quadrant(quadrant):
-                    raise ValueError(f"Invalid quadrant: {quadrant}")
-                return {quadrant: self._tasks[quadrant][:]}
-            return {q: tasks[:] for q, tasks in self._tasks.items()}
+            return {q: all_tasks[q][:] for q in quadrants_to_search}
         
         results = {}
-        quadrants_to_search = [quadrant] if quadrant is not None else range(1, 5)
-        
         for q in quadrants_to_search:
-            if quadrant is not None and not QuadrantInfo.validate_quadrant(quadrant):
-                raise ValueError(f"Invalid quadrant: {quadrant}")
-            matching_tasks = [task for task in self._tasks[q] if task.matches_search(search_text)]
+            matching_tasks = [task for task in all_tasks[q] if task.matches_search(search_text)]
             if matching_tasks:
                 results[q] = matching_tasks
         
@@ -0,0 +1,188 @@
+"""Task Retention Policies"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from eisenhower_matrix.domain.task import Task
+from eisenhower_matrix.domain.notification_service import INotificationService
+from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
+
+# Policy actions
+ARCHIVE_COMPLETED = 'archive-completed'
+PURGE_ARCHIVED = 'purge-archived'
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    A rule for tasks that have been done for a while
+    
+    archive-completed archives tasks completed more than older_than_days
+    ago; purge-archived deletes tasks archived more than older_than_days
+    ago after exporting them to a JSON file in export_dir.
+    """
+    action: str
+    older_than_days: int
+    export_dir: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RetentionPolicy':
+        """
+        Build a policy from its configuration record
+        
+        Raises:
+            ValueError: If the record is not a valid policy
+        """
+        action = data.get('action')
+        if action not in (ARCHIVE_COMPLETED, PURGE_ARCHIVED):
+            raise ValueError(f"unknown retention action: {action}")
+        days = data.get('older_than_days')
+        if not isinstance(days, int) or isinstance(days, bool) or days < 0:
+            raise ValueError(f"older_than_days must be a non-negative integer: {days}")
+        export_dir = data.get('export_dir')
+        if export_dir is not None and not isinstance(export_dir, str):
+            raise ValueError(f"export_dir must be a path: {export_dir}")
+        return cls(action, days, export_dir)
+    
+    @property
+    def description(self) -> str:
+        """Human-readable summary, e.g. for notifications"""
+        if self.action == ARCHIVE_COMPLETED:
+            return f"Archive tasks completed more than {self.older_than_days} days ago"
+        return f"Purge tasks archived more than {self.older_than_days} days ago"
+
+
+def _older_than(timestamp: Optional[str], cutoff: datetime) -> bool:
+    """Whether an ISO timestamp lies before cutoff (False if missing or invalid)"""
+    if not timestamp:
+        return False
+    try:
+        return datetime.fromisoformat(timestamp) < cutoff
+    except ValueError:
+        return False
+
+
+class RetentionJob:
+    """
+    Applies retention policies to one project's tasks
+    
+    Single Responsibility: Select the tasks a policy applies to and
+    apply it in batches
+    
+    Each batch is one bulk service call (one save, one observer
+    notification), so a caller driving steps() from an idle handler keeps
+    the UI responsive however many tasks qualify. Batches are kept out of
+    the undo history: the user did not make these changes, and they must
+    not push the user's own changes out of it. Results are reported
+    through the notification port, one notification per policy that
+    changed anything.
+    """
+    
+    BATCH_SIZE = 200
+    
+    def __init__(self, service: EisenhowerMatrixService, policies: List[RetentionPolicy],
+                 notifier: Optional[INotificationService] = None,
+                 project_id: str = "default", default_export_dir: Optional[Path] = None,
+                 now: Optional[datetime] = None):
+        """
+        Initialize job
+        
+        Args:
+            service: Service of the project to apply the policies to
+            policies: Policies, applied in order
+            notifier: Receives a notify_policy_applied() per effective policy
+            project_id: Used to name export files
+            default_export_dir: Export directory of purge policies without one
+            now: Reference time (defaults to the current time)
+        """
+        self._service = service
+        self._policies = policies
+        self._notifier = notifier
+        self._project_id = project_id
+        self._default_export_dir = default_export_dir
+        self._now = now or datetime.now()
+    
+    def run(self) -> Dict[RetentionPolicy, int]:
+        """
+        Apply all policies now
+        
+        Returns:
+            Number of tasks each policy changed
+        """
+        results: Dict[RetentionPolicy, int] = {}
+        for policy, count in self.steps():
+            results[policy] = results.get(policy, 0) + count
+        return results
+    
+    def steps(self) -> Iterator[Tuple[RetentionPolicy, int]]:
+        """
+        Apply policies one batch per iteration
+        
+        Yields:
+            (policy, number of tasks changed by the batch)
+        """
+        for policy in self._policies:
+            cutoff = self._now - timedelta(days=policy.older_than_days)
+            if policy.action == ARCHIVE_COMPLETED:
+                candidates = self._completed_before(cutoff)
+                apply, label = self._service.archive_tasks, "Archive old completed tasks"
+            else:
+                candidates = self._archived_before(cutoff)
+                apply, label = self._service.remove_tasks, "Purge old archived tasks"
+            if not candidates:
+                continue
+            
+            export_path = None
+            if policy.action == PURGE_ARCHIVED:
+                export_path = self._export(policy, candidates)
+                if export_path is None:
+                    continue  # Never delete what could not be exported
+            
+            total = 0
+            for start in range(0, len(candidates), self.BATCH_SIZE):
+                chunk = [(quadrant, task.uid) for quadrant, task in candidates[start:start + self.BATCH_SIZE]]
+                with self._service.batch(label, record_history=False):
+                    missing = apply(chunk)
+                count = len(chunk) - len(missing)
+                total += count
+                yield policy, count
+            
+            if total and self._notifier is not None:
+                detail = f"exported to {export_path}" if export_path else ""
+                self._notifier.notify_policy_applied(policy.description, total, detail)
+    
+    def _completed_before(self, cutoff: datetime) -> List[Tuple[int, Task]]:
+        """Active completed tasks completed before cutoff, oldest first"""
+        candidates = [
+            (quadrant, task)
+            for quadrant in range(1, 5)
+            for task in self._service.get_tasks(quadrant)
+            if task.completed and not task.archived and _older_than(task.completed_at, cutoff)
+        ]
+        candidates.sort(key=lambda entry: entry[1].completed_at)
+        return candidates
+    
+    def _archived_before(self, cutoff: datetime) -> List[Tuple[int, Task]]:
+        """Archived tasks archived before cutoff, oldest first"""
+        candidates = [
+            (quadrant, task)
+            for quadrant in range(1, 5)
+            for task in self._service.get_archived_tasks(quadrant)
+            if _older_than(task.archived_at, cutoff)
+        ]
+        candidates.sort(key=lambda entry: entry[1].archived_at)
+        return candidates
+    
+    def _export(self, policy: RetentionPolicy, candidates: List[Tuple[int, Task]]) -> Optional[Path]:
+        """Export tasks about to be purged; returns the file, or None on failure"""
+        directory = Path(policy.export_dir).expanduser() if policy.export_dir else self._default_export_dir
+        if directory is None:
+            return None
+        path = directory / f"purged_{self._project_id}_{self._now.strftime('%Y%m%d-%H%M%S')}.json"
+        tasks: Dict[int, List[Task]] = {1: [], 2: [], 3: [], 4: []}
+        for quadrant, task in candidates:
+            tasks[quadrant].append(task)
+        if not self._service.export_tasks_to_file(str(path), tasks):
+            return None
+        return path
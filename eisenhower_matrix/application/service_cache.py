@@ -0,0 +1,150 @@
+"""Application Service - Warm Project Service Cache"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
+
+
+# Rough per-task overhead of a Task instance, its __dict__ and containers
+_TASK_OVERHEAD_BYTES = 1024
+
+
+def estimate_footprint(service: EisenhowerMatrixService) -> int:
+    """
+    Estimate the memory held by a service's tasks, in bytes
+    
+    A cheap approximation (fixed per-task overhead plus text lengths)
+    good enough to budget a cache; not an exact measurement.
+    """
+    total = 0
+    for tasks in service.get_all_tasks().values():
+        for task in tasks:
+            total += _TASK_OVERHEAD_BYTES + len(task.description) + len(task.notes)
+            total += sum(len(tag) for tag in task.tags)
+            total += sum(len(k) + len(v) for k, v in task.metadata.items())
+    return total
+
+
+class ProjectServiceCache:
+    """
+    Bounded LRU cache of loaded EisenhowerMatrixService instances
+    
+    Single Responsibility: Keep recently used projects warm so switching
+    back to them does not reparse their task files.
+    
+    Entries are evicted least recently used first once either the entry
+    limit or the estimated memory budget is exceeded. The most recently
+    requested service (the current project) is never evicted. Limits are
+    checked when an entry is added; footprint estimates are kept per
+    service data version, so only services that loaded or changed since
+    the last check are re-estimated.
+    """
+    
+    def __init__(self, factory: Callable[[str], EisenhowerMatrixService],
+                 max_entries: int = 8, max_bytes: int = 64 * 1024 * 1024,
+                 on_evict: Optional[Callable[[str, EisenhowerMatrixService], None]] = None):
+        """
+        Initialize cache
+        
+        Args:
+            factory: Creates a service for a project ID. It should not load
+                synchronously (autoload=False); the cache or the caller
+                starts loading.
+            max_entries: Maximum number of cached services
+            max_bytes: Memory budget for all cached services (estimated)
+            on_evict: Called with each evicted or discarded service (e.g.
+                to check that it is collected)
+        """
+        self._factory = factory
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._on_evict = on_evict
+        self._services: "OrderedDict[str, EisenhowerMatrixService]" = OrderedDict()
+        # project ID -> (service version, estimated bytes)
+        self._footprints: Dict[str, Tuple[int, int]] = {}
+    
+    def get(self, project_id: str) -> EisenhowerMatrixService:
+        """
+        Return the service for a project, creating it on a miss
+        
+        The returned service becomes the most recently used entry.
+        """
+        service = self._services.get(project_id)
+        if service is not None:
+            # A hit adds nothing, so the limits still hold
+            self._services.move_to_end(project_id)
+            return service
+        service = self._factory(project_id)
+        self._services[project_id] = service
+        self._evict()
+        return service
+    
+    def peek(self, project_id: str) -> Optional[EisenhowerMatrixService]:
+        """Return a cached service without changing its recency"""
+        return self._services.get(project_id)
+    
+    def prefetch(self, project_ids: Iterable[str],
+                 dispatch: Callable[[Callable[[], None]], object]) -> None:
+        """
+        Warm services for projects in the background
+        
+        Prefetched services are added as least recently used and only
+        while there is room, so prefetching never evicts anything.
+        
+        Args:
+            project_ids: Projects to warm, most likely first
+            dispatch: Passed to EisenhowerMatrixService.load_in_background
+        """
+        for project_id in project_ids:
+            if len(self._services) >= self._max_entries:
+                break
+            if project_id in self._services:
+                continue
+            service = self._factory(project_id)
+            self._services[project_id] = service
+            self._services.move_to_end(project_id, last=False)
+            service.load_in_background(dispatch)
+    
+    def discard(self, project_id: str) -> None:
+        """Drop a project's service (e.g. after the project was deleted)"""
+        service = self._services.pop(project_id, None)
+        if service is not None:
+            self._evicted(project_id, service)
+    
+    def services(self) -> Dict[str, EisenhowerMatrixService]:
+        """Cached services by project ID, least recently used first"""
+        return dict(self._services)
+    
+    def footprints(self) -> Dict[str, int]:
+        """Estimated memory footprint of every cached service, in bytes"""
+        return {pid: self._footprint(pid, s) for pid, s in self._services.items()}
+    
+    def _footprint(self, project_id: str, service: EisenhowerMatrixService) -> int:
+        """Footprint estimate of a service, re-estimated only after it changed"""
+        cached = self._footprints.get(project_id)
+        if cached is not None and cached[0] == service.version:
+            return cached[1]
+        footprint = estimate_footprint(service)
+        self._footprints[project_id] = (service.version, footprint)
+        return footprint
+    
+    def _evict(self) -> None:
+        """Evict least recently used services until within limits"""
+        while len(self._services) > self._max_entries:
+            self._evicted(*self._services.popitem(last=False))
+        
+        if len(self._services) <= 1:
+            return
+        
+        footprints = self.footprints()
+        total = sum(footprints.values())
+        for project_id in list(self._services)[:-1]:
+            if total <= self._max_bytes:
+                break
+            total -= footprints[project_id]
+            self._evicted(project_id, self._services.pop(project_id))
+    
+    def _evicted(self, project_id: str, service: EisenhowerMatrixService) -> None:
+        self._footprints.pop(project_id, None)
+        if self._on_evict is not None:
+            self._on_evict(project_id, service)
@@ -27,7 +27,7 @@ class TaskExportUseCase:
     def export_to_csv(self, file_path: str) -> bool:
         """Export all tasks to CSV file"""
         try:
-            tasks = self._service.get_all_tasks()
+            tasks = self._service.get_all_tasks(include_archived=True)
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = ['quadrant', 'id', 'description', 'notes', 'tags', 
                              'completed', 'completed_at', 'created', 'due_date', 'metadata']
@@ -55,7 +55,7 @@ class TaskExportUseCase:
     def export_to_markdown(self, file_path: str) -> bool:
         """Export all tasks to Markdown file"""
         try:
-            tasks = self._service.get_all_tasks()
+            tasks = self._service.get_all_tasks(include_archived=True)
             with open(file_path, 'w', encoding='utf-8') as mdfile:
                 for quadrant, task_list in tasks.items():
                     mdfile.write(f"# Quadrant {quadrant}\n\n")
@@ -76,7 +76,7 @@ class TaskExportUseCase:
     def export_to_calendar_csv(self, file_path: str) -> bool:
         """Export all tasks to calendar-compatible CSV file"""
         try:
-            tasks = self._service.get_all_tasks()
+            tasks = self._service.get_all_tasks(include_archived=True)
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = ['Subject', 'Start Date', 'Due Date', 'Description', 
                              'Location', 'Categories']
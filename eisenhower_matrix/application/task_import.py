@@ -2,8 +2,10 @@
 
 import csv
 from eisenhower_matrix.application import EisenhowerMatrixService
+from eisenhower_matrix.diagnostics.tracing import traced
 
 
+@traced
 class TaskImportUseCase:
     """
     Handles importing tasks from external sources.
@@ -15,6 +17,10 @@ class TaskImportUseCase:
     def __init__(self, matrix_service: EisenhowerMatrixService):
         self._service = matrix_service
     
+    def trace_context(self) -> dict:
+        """Slow-operation log context of the imports (the service's)"""
+        return self._service.trace_context()
+    
     def import_from_json(self, file_path: str) -> bool:
         """Import tasks from JSON file"""
         try:
@@ -28,7 +34,7 @@ class TaskImportUseCase:
         try:
             from datetime import datetime
             
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
+            with open(file_path, 'r', encoding='utf-8') as csvfile, self._service.batch("Import CSV"):
                 reader = csv.DictReader(csvfile)
                 for row in reader:
                     # Parse quadrant (convert 'q1' to 1, or use numeric)
@@ -66,8 +72,7 @@ class TaskImportUseCase:
                     
                     # Set completion status if needed
                     if row.get('completed', '').lower() == 'true':
-                        task.mark_completed()
-                        self._service._repository.save(self._service._tasks)
+                        self._service.complete_task(quadrant, task.uid)
             
             return True
         except Exception:
@@ -116,60 +121,61 @@ class TaskImportUseCase:
             
             # Convert events to tasks
             now = datetime.now()
-            for event in events:
-                summary = event.get('SUMMARY', 'Untitled Event')
-                description_text = event.get('DESCRIPTION', '')
-                location = event.get('LOCATION', '')
-                
-                # Parse date
-                due_date = None
-                dtstart = event.get('DTSTART', '')
-                if dtstart:
-                    try:
-                        # Handle different date formats
-                        if 'T' in dtstart:
-                            # Full datetime: 20260201T120000Z
-                            due_date = datetime.strptime(dtstart.replace('Z', ''), '%Y%m%dT%H%M%S')
+            with self._service.batch("Import calendar"):
+                for event in events:
+                    summary = event.get('SUMMARY', 'Untitled Event')
+                    description_text = event.get('DESCRIPTION', '')
+                    location = event.get('LOCATION', '')
+                    
+                    # Parse date
+                    due_date = None
+                    dtstart = event.get('DTSTART', '')
+                    if dtstart:
+                        try:
+                            # Handle different date formats
+                            if 'T' in dtstart:
+                                # Full datetime: 20260201T120000Z
+                                due_date = datetime.strptime(dtstart.replace('Z', ''), '%Y%m%dT%H%M%S')
+                            else:
+                                # Date only: 20260201
+                                due_date = datetime.strptime(dtstart, '%Y%m%d')
+                        except (ValueError, TypeError):
+                            pass
+                    
+                    # Determine quadrant based on due date
+                    quadrant = 4
+                    if due_date:
+                        days_until = (due_date - now).days
+                        if days_until <= 3:
+                            quadrant = 1  # Urgent & Important
+                        elif days_until <= 14:
+                            quadrant = 2  # Important, Not Urgent
                         else:
-                            # Date only: 20260201
-                            due_date = datetime.strptime(dtstart, '%Y%m%d')
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Determine quadrant based on due date
-                quadrant = 4
-                if due_date:
-                    days_until = (due_date - now).days
-                    if days_until <= 3:
-                        quadrant = 1  # Urgent & Important
-                    elif days_until <= 14:
-                        quadrant = 2  # Important, Not Urgent
-                    else:
-                        quadrant = 3  # Not Urgent
-                
-                # Build notes
-                notes_parts = []
-                if description_text:
-                    notes_parts.append(description_text)
-                if location:
-                    notes_parts.append(f"Location: {location}")
-                notes = '\n'.join(notes_parts) if notes_parts else ''
-                
-                # Build metadata
-                metadata = {'source': 'calendar', 'event_id': event.get('UID', '')}
-                
-                # Format due date as ISO date string for task
-                due_date_str = due_date.strftime('%Y-%m-%d') if due_date else None
-                
-                # Add task using matrix service
-                self._service.add_task(
-                    quadrant=quadrant,
-                    description=summary,
-                    notes=notes,
-                    tags=['calendar-import'],
-                    metadata=metadata,
-                    due_date=due_date_str
-                )
+                            quadrant = 3  # Not Urgent
+                    
+                    # Build notes
+                    notes_parts = []
+                    if description_text:
+                        notes_parts.append(description_text)
+                    if location:
+                        notes_parts.append(f"Location: {location}")
+                    notes = '\n'.join(notes_parts) if notes_parts else ''
+                    
+                    # Build metadata
+                    metadata = {'source': 'calendar', 'event_id': event.get('UID', '')}
+                    
+                    # Format due date as ISO date string for task
+                    due_date_str = due_date.strftime('%Y-%m-%d') if due_date else None
+                    
+                    # Add task using matrix service
+                    self._service.add_task(
+                        quadrant=quadrant,
+                        description=summary,
+                        notes=notes,
+                        tags=['calendar-import'],
+                        metadata=metadata,
+                        due_date=due_date_str
+                    )
             
             return True
         except Exception:
@@ -1,7 +1,7 @@
 """Task Management Use Case"""
 
 from typing import List, Optional, Dict
-from eisenhower_matrix.domain import Task, IObserver
+from eisenhower_matrix.domain import Task, TaskRef, IObserver
 from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
 
 
@@ -30,7 +30,7 @@ class TaskManagementUseCase:
     def update_task(
         self,
         quadrant: int,
-        task_id: int,
+        task_id: TaskRef,
         description: Optional[str] = None,
         due_date: Optional[str] = None,
         notes: Optional[str] = None
@@ -40,17 +40,17 @@ class TaskManagementUseCase:
             quadrant, task_id, description, due_date, notes
         )
     
-    def complete_task(self, quadrant: int, task_id: int) -> bool:
+    def complete_task(self, quadrant: int, task_id: TaskRef) -> bool:
         """Mark a task as completed"""
         return self._service.complete_task(quadrant, task_id)
     
-    def delete_task(self, quadrant: int, task_id: int) -> bool:
+    def delete_task(self, quadrant: int, task_id: TaskRef) -> bool:
         """Delete a task"""
         return self._service.remove_task(quadrant, task_id)
     
-    def move_task(self, from_quadrant: int, to_quadrant: int, task_id: int) -> bool:
+    def move_task(self, from_quadrant: int, to_quadrant: int, task_id: TaskRef) -> bool:
         """Move a task between quadrants"""
-        return self._service.move_task(from_quadrant, to_quadrant, task_id)
+        return self._service.move_task(from_quadrant, task_id, to_quadrant)
     
     def get_tasks_by_quadrant(self, quadrant: int) -> List[Task]:
         """Get all tasks in a quadrant"""
@@ -0,0 +1,579 @@
+"""
+Command-line entry point for Eisenhower Matrix
+
+Headless adapter over EisenhowerMatrixService and ProjectManagementService
+for scripting and bulk operations. Never imports GTK.
+
+Examples:
+    eisenhower                                  # show the matrix
+    eisenhower add 1 "Fix production bug" --tag ops --due 2026-02-01
+    eisenhower complete 1 3
+    eisenhower move 2 3 1                       # Q2 task 3 -> Q1
+    eisenhower list --format ndjson > tasks.ndjson
+    eisenhower batch ops.ndjson                 # one load, one save
+    eisenhower slowlog --top 5                  # worst slow operations
+"""
+
+import argparse
+import html
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO
+
+from eisenhower_matrix.domain import QuadrantInfo, Task, TaskRef, parse_task_ref
+from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
+from eisenhower_matrix.application.project_management import ProjectManagementService
+from eisenhower_matrix.application.global_search import GlobalSearchService
+from eisenhower_matrix.application.task_export import TaskExportUseCase
+from eisenhower_matrix.application.task_import import TaskImportUseCase
+from eisenhower_matrix.infrastructure.persistence import (
+    JsonArchiveRepository, JsonTaskRepository, JsonTaskSearchIndex
+)
+from eisenhower_matrix.infrastructure.persistence.json_project_repository import JsonProjectRepository
+from eisenhower_matrix.diagnostics import recorder_from_environment
+from eisenhower_matrix.diagnostics import slowlog
+from eisenhower_matrix.diagnostics.tracing import tracing_from_environment
+
+
+class CliError(Exception):
+    """User-facing command failure (reported without a traceback)"""
+
+
+def _task_record(quadrant: int, task: Task, project_id: Optional[str] = None) -> dict:
+    """Task as a JSON-serializable record (one NDJSON line)"""
+    record = {'quadrant': quadrant}
+    if project_id is not None:
+        record['project'] = project_id
+    record.update(asdict(task))
+    return record
+
+
+def _write_ndjson(records: Iterable[dict], out: TextIO) -> None:
+    """Stream records as newline-delimited JSON"""
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write('\n')
+
+
+def _read_ndjson(stream: TextIO) -> Iterable[dict]:
+    """Parse newline-delimited JSON, skipping blank lines"""
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CliError(f"line {line_number}: invalid JSON: {e}")
+
+
+def _format_task(quadrant: int, task: Task) -> str:
+    """One-line human-readable task"""
+    mark = '✓' if task.completed else '○'
+    parts = [f"Q{quadrant} {mark} [{task.id}] {task.description}"]
+    if task.due_date and not task.completed:
+        parts.append(f"(due {task.due_date})")
+    if task.tags:
+        parts.append(' '.join(f"#{tag}" for tag in task.tags))
+    if task.archived:
+        parts.append('[archived]')
+    return '  '.join(parts)
+
+
+def _parse_metadata(pairs: Optional[List[str]]) -> Optional[Dict[str, str]]:
+    """Turn ["key=value", ...] into a dict"""
+    if not pairs:
+        return None
+    metadata = {}
+    for pair in pairs:
+        key, sep, value = pair.partition('=')
+        if not sep or not key:
+            raise CliError(f"invalid metadata {pair!r}, expected key=value")
+        metadata[key] = value
+    return metadata
+
+
+def _filter_tasks(tasks: List[Task], include_completed: bool, include_archived: bool) -> List[Task]:
+    """Apply the --completed/--archived listing filters"""
+    return [
+        t for t in tasks
+        if (include_completed or not t.completed) and (include_archived or not t.archived)
+    ]
+
+
+class CliApp:
+    """
+    Wires repositories and services for one CLI invocation
+
+    Single Responsibility: Resolve the target project and run commands
+    against a single loaded service, so every command costs one load and
+    at most one save.
+    """
+
+    def __init__(self, project_id: Optional[str] = None, data_file: Optional[str] = None,
+                 out: TextIO = sys.stdout):
+        self.out = out
+        self.project_repository = JsonProjectRepository()
+        self.project_service = ProjectManagementService(self.project_repository)
+
+        if data_file is None:
+            if project_id is None:
+                # Same default as the GUI: the most recently accessed project
+                projects = self.project_service.get_all_projects()
+                project_id = projects[0].id if projects else "default"
+            elif not self.project_service.project_exists(project_id):
+                raise CliError(f"unknown project: {project_id}")
+
+        self.project_id = project_id
+        self._data_file = data_file
+        self._service: Optional[EisenhowerMatrixService] = None
+
+    @property
+    def service(self) -> EisenhowerMatrixService:
+        """Task service for the target project, loaded on first use"""
+        if self._service is None:
+            repository = JsonTaskRepository(data_file=self._data_file, project_id=self.project_id or "default")
+            self._service = EisenhowerMatrixService(
+                repository, archive=JsonArchiveRepository(repository), project_id=self.project_id or "default"
+            )
+            recorder_from_environment(self._service, self.project_id or "default")
+        return self._service
+
+    # Commands -------------------------------------------------------------
+
+    def cmd_show(self, args) -> int:
+        """Print the whole matrix"""
+        for quadrant in range(1, 5):
+            info = QuadrantInfo.get_info(quadrant)
+            self.out.write(f"Q{quadrant}: {html.unescape(info['name'])} ({info['short_name']})\n")
+            tasks = _filter_tasks(self.service.get_tasks(quadrant), args.completed, False)
+            if not tasks:
+                self.out.write("  (no tasks)\n")
+            for task in tasks:
+                mark = '✓' if task.completed else '○'
+                self.out.write(f"  {mark} [{task.id}] {task.description}\n")
+            self.out.write("\n")
+        return 0
+
+    def cmd_add(self, args) -> int:
+        """Add one task"""
+        task = self.service.add_task(
+            args.quadrant, args.description,
+            notes=args.notes or "",
+            tags=args.tag,
+            metadata=_parse_metadata(args.meta),
+            due_date=args.due
+        )
+        if args.format == 'ndjson':
+            _write_ndjson([_task_record(args.quadrant, task)], self.out)
+        else:
+            self.out.write(f"Added task {task.id} to Q{args.quadrant}\n")
+        return 0
+
+    def cmd_list(self, args) -> int:
+        """List tasks of one or all quadrants"""
+        quadrants = [args.quadrant] if args.quadrant else range(1, 5)
+        # Archived tasks live in the archive, read only when asked for
+        all_tasks = self.service.get_all_tasks(include_archived=args.archived)
+        records = (
+            (q, task)
+            for q in quadrants
+            for task in _filter_tasks(all_tasks[q], args.completed, args.archived)
+        )
+        self._emit(records, args.format)
+        return 0
+
+    def cmd_query(self, args) -> int:
+        """Search tasks in this project or across all projects"""
+        if args.all_projects:
+            search = GlobalSearchService(JsonTaskSearchIndex(), self.project_repository)
+            results = search.search(args.text, include_completed=args.completed,
+                                    include_archived=args.archived)
+            for project_id, quadrants in results.items():
+                for quadrant, hits in quadrants.items():
+                    for hit in hits:
+                        if args.format == 'ndjson':
+                            _write_ndjson([dict(asdict(hit))], self.out)
+                        else:
+                            # The uid keeps naming this task after display IDs change
+                            self.out.write(f"{project_id}  Q{quadrant} [{hit.task_ref}] {hit.description}\n")
+            return 0
+
+        # Archived tasks live in the archive, searched only when asked for
+        results = self.service.search_tasks(args.text, args.quadrant, include_archived=args.archived)
+        records = (
+            (q, task)
+            for q in sorted(results)
+            for task in _filter_tasks(results[q], args.completed, args.archived)
+        )
+        self._emit(records, args.format)
+        return 0
+
+    def cmd_complete(self, args) -> int:
+        """Complete (or reopen) tasks of one quadrant"""
+        if args.reopen:
+            missing = []
+            with self.service.batch():
+                for task_id in args.task_ids:
+                    if not self.service.uncomplete_task(args.quadrant, task_id):
+                        missing.append(task_id)
+        else:
+            refs = [(args.quadrant, task_id) for task_id in args.task_ids]
+            missing = [task_id for _, task_id in self.service.complete_tasks(refs)]
+        if missing:
+            raise CliError(f"task(s) not found in Q{args.quadrant}: {', '.join(map(str, missing))}")
+        return 0
+
+    def cmd_move(self, args) -> int:
+        """Move tasks between quadrants"""
+        refs = [(args.from_quadrant, task_id) for task_id in args.task_ids]
+        missing = [task_id for _, task_id in self.service.move_tasks(refs, args.to_quadrant)]
+        if missing:
+            raise CliError(f"task(s) not found in Q{args.from_quadrant}: {', '.join(map(str, missing))}")
+        return 0
+
+    def cmd_import(self, args) -> int:
+        """Import tasks from JSON, CSV, iCal or NDJSON"""
+        fmt = args.format or self._format_from_suffix(args.file, {
+            '.json': 'json', '.csv': 'csv', '.ics': 'ics', '.ical': 'ics', '.ndjson': 'ndjson',
+        })
+        if fmt == 'json':
+            ok = self.service.import_from_file(args.file, merge=args.merge)
+        elif fmt == 'csv':
+            ok = TaskImportUseCase(self.service).import_from_csv(args.file)
+        elif fmt == 'ics':
+            ok = TaskImportUseCase(self.service).import_from_calendar(args.file)
+        else:
+            with self._open_input(args.file) as stream:
+                failures = self._run_operations(_read_ndjson(stream), echo=False)
+            if failures:
+                raise CliError(f"{failures} line(s) of {args.file} could not be imported")
+            ok = True
+        if not ok:
+            raise CliError(f"could not import {args.file}")
+        return 0
+
+    def cmd_export(self, args) -> int:
+        """Export tasks to JSON, CSV, Markdown, calendar CSV or NDJSON"""
+        fmt = args.format or self._format_from_suffix(args.file, {
+            '.json': 'json', '.csv': 'csv', '.md': 'markdown', '.ndjson': 'ndjson',
+        })
+        export = TaskExportUseCase(self.service)
+        if fmt == 'ndjson':
+            records = (
+                _task_record(q, task)
+                for q, tasks in self.service.get_all_tasks(include_archived=True).items()
+                for task in tasks
+            )
+            if args.file == '-':
+                _write_ndjson(records, self.out)
+            else:
+                with open(args.file, 'w', encoding='utf-8') as f:
+                    _write_ndjson(records, f)
+            return 0
+
+        exporters = {
+            'json': export.export_to_json,
+            'csv': export.export_to_csv,
+            'markdown': export.export_to_markdown,
+            'calendar': export.export_to_calendar_csv,
+        }
+        if not exporters[fmt](args.file):
+            raise CliError(f"could not export to {args.file}")
+        return 0
+
+    def cmd_stats(self, args) -> int:
+        """Per-quadrant task counts"""
+        overdue = self.service.get_overdue_tasks()
+        due_soon = self.service.get_due_soon_tasks()
+        all_tasks = self.service.get_all_tasks(include_archived=True)
+        rows = []
+        for q in range(1, 5):
+            tasks = all_tasks[q]
+            rows.append({
+                'quadrant': q,
+                'total': len(tasks),
+                'open': sum(1 for t in tasks if not t.completed),
+                'completed': sum(1 for t in tasks if t.completed),
+                'archived': sum(1 for t in tasks if t.archived),
+                'overdue': len(overdue.get(q, [])),
+                'due_soon': len(due_soon.get(q, [])),
+            })
+
+        if args.format == 'ndjson':
+            _write_ndjson(rows, self.out)
+            return 0
+
+        columns = ['quadrant', 'total', 'open', 'completed', 'archived', 'overdue', 'due_soon']
+        self.out.write('  '.join(f"{c:>9}" for c in columns) + '\n')
+        for row in rows:
+            self.out.write('  '.join(f"{row[c]:>9}" for c in columns) + '\n')
+        return 0
+
+    def cmd_batch(self, args) -> int:
+        """Apply NDJSON operations with one load and one save"""
+        with self._open_input(args.file) as stream:
+            failures = self._run_operations(_read_ndjson(stream), echo=True)
+        return 1 if failures else 0
+
+    def cmd_serve(self, args) -> int:
+        """Serve the local HTTP/JSON API in the foreground"""
+        from eisenhower_matrix.infrastructure.api import LocalApiServer
+
+        server = LocalApiServer(socket_path=args.socket, port=args.port)
+        server.attach(self.service, self.project_id)
+        started = []
+
+        def on_started():
+            # Printed once bound, so --port 0 reports the chosen port
+            started.append(True)
+            print(f"Serving {self.project_id} on {server.address} (Ctrl+C to stop)", file=sys.stderr)
+
+        try:
+            server.run(on_started)
+        except KeyboardInterrupt:
+            pass
+        if not started:
+            raise CliError(f"could not serve on {server.address}")
+        return 0
+
+    def cmd_slowlog(self, args) -> int:
+        """Summarize the slow-operation log (see EISENHOWER_SLOW_MS)"""
+        # Only an explicit --project filters; the default project would hide the rest
+        return slowlog.report(args, self.out, project_id=args.project)
+
+    # Helpers --------------------------------------------------------------
+
+    def _emit(self, records, fmt: str) -> None:
+        """Write (quadrant, task) pairs as text or NDJSON"""
+        if fmt == 'ndjson':
+            _write_ndjson((_task_record(q, task) for q, task in records), self.out)
+        else:
+            for q, task in records:
+                self.out.write(_format_task(q, task) + '\n')
+
+    def _run_operations(self, operations: Iterable[dict], echo: bool) -> int:
+        """
+        Apply operations inside a single service batch
+
+        Each operation is a dict with an "op" key (add, update, complete,
+        uncomplete, archive, unarchive, remove, move); records without "op"
+        are treated as tasks to add, so `list --format ndjson` output can
+        be fed back in. With echo, one result line is written per operation.
+
+        Returns:
+            Number of failed operations
+        """
+        failures = 0
+        with self.service.batch():
+            for number, operation in enumerate(operations, 1):
+                try:
+                    result = self._apply_operation(operation)
+                    ok = result is not False
+                except (KeyError, TypeError, ValueError) as e:
+                    result, ok = str(e), False
+                if not ok:
+                    failures += 1
+                if echo:
+                    line = {'line': number, 'ok': ok}
+                    if isinstance(result, Task):
+                        line['task'] = _task_record(operation.get('quadrant', 0), result)
+                    elif isinstance(result, str):
+                        line['error'] = result
+                    elif not ok:
+                        line['error'] = 'task not found'
+                    _write_ndjson([line], self.out)
+        return failures
+
+    def _apply_operation(self, operation: dict):
+        """Apply one batch operation, returning the service's result"""
+        op = operation.get('op', 'add')
+        service = self.service
+        if op == 'add':
+            quadrant = int(operation['quadrant'])
+            task = service.add_task(
+                quadrant, operation['description'],
+                notes=operation.get('notes', ''),
+                tags=operation.get('tags'),
+                metadata=operation.get('metadata'),
+                due_date=operation.get('due_date')
+            )
+            # Keep state when re-importing `list --format ndjson` output
+            if operation.get('completed'):
+                service.complete_task(quadrant, task.uid)
+            if operation.get('archived'):
+                service.archive_task(quadrant, task.uid)
+            return task
+        if op == 'update':
+            return service.update_task(
+                int(operation['quadrant']), _operation_ref(operation),
+                description=operation.get('description'),
+                notes=operation.get('notes'),
+                tags=operation.get('tags'),
+                metadata=operation.get('metadata'),
+                due_date=operation.get('due_date')
+            )
+        if op == 'move':
+            return service.move_task(int(operation['quadrant']), _operation_ref(operation), int(operation['to']))
+
+        simple = {
+            'complete': service.complete_task,
+            'uncomplete': service.uncomplete_task,
+            'archive': service.archive_task,
+            'unarchive': service.unarchive_task,
+            'remove': service.remove_task,
+        }
+        if op not in simple:
+            raise ValueError(f"unknown op: {op}")
+        return simple[op](int(operation['quadrant']), _operation_ref(operation))
+
+    def _open_input(self, path: str):
+        """Open a file for reading, or stdin for '-'"""
+        if path == '-':
+            return _NonClosing(sys.stdin)
+        return open(path, 'r', encoding='utf-8')
+
+    @staticmethod
+    def _format_from_suffix(path: str, formats: Dict[str, str]) -> str:
+        """Infer a format from a file suffix"""
+        if path == '-':
+            return 'ndjson'
+        fmt = formats.get(Path(path).suffix.lower())
+        if fmt is None:
+            raise CliError(f"cannot infer format of {path}, use --format")
+        return fmt
+
+
+def _operation_ref(operation: dict) -> TaskRef:
+    """Task a batch operation refers to: its uid if given, else its id"""
+    if operation.get('uid'):
+        return str(operation['uid'])
+    return parse_task_ref(str(operation['id']))
+
+
+class _NonClosing:
+    """Context manager yielding a stream without closing it"""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def __enter__(self) -> TextIO:
+        return self._stream
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser for the eisenhower command"""
+    parser = argparse.ArgumentParser(
+        prog='eisenhower',
+        description='Headless Eisenhower Matrix task management',
+    )
+    parser.add_argument('--project', help='project ID (default: most recently accessed)')
+    parser.add_argument('--data-file', help='operate on this tasks JSON file directly')
+    parser.set_defaults(completed=False)
+
+    sub = parser.add_subparsers(dest='command')
+
+    def quadrant(value: str) -> int:
+        q = int(value.lstrip('qQ'))
+        if not QuadrantInfo.validate_quadrant(q):
+            raise argparse.ArgumentTypeError(f"invalid quadrant: {value}")
+        return q
+
+    def add_format(p, choices=('text', 'ndjson')):
+        p.add_argument('--format', choices=choices, default='text')
+
+    def add_filters(p):
+        p.add_argument('--completed', action='store_true', help='include completed tasks')
+        p.add_argument('--archived', action='store_true', help='include archived tasks')
+
+    p = sub.add_parser('show', help='show the matrix (default)')
+    p.add_argument('--completed', action='store_true', help='include completed tasks')
+
+    p = sub.add_parser('add', help='add a task')
+    p.add_argument('quadrant', type=quadrant)
+    p.add_argument('description')
+    p.add_argument('--notes')
+    p.add_argument('--tag', action='append', help='tag (repeatable)')
+    p.add_argument('--meta', action='append', metavar='KEY=VALUE', help='metadata (repeatable)')
+    p.add_argument('--due', metavar='YYYY-MM-DD', help='due date')
+    add_format(p)
+
+    p = sub.add_parser('list', help='list tasks')
+    p.add_argument('quadrant', type=quadrant, nargs='?')
+    add_filters(p)
+    add_format(p)
+
+    p = sub.add_parser('query', help='search tasks')
+    p.add_argument('text')
+    p.add_argument('--quadrant', type=quadrant)
+    p.add_argument('--all-projects', action='store_true', help='search every project')
+    add_filters(p)
+    add_format(p)
+
+    p = sub.add_parser('complete', help='complete tasks')
+    p.add_argument('quadrant', type=quadrant)
+    p.add_argument('task_ids', type=parse_task_ref, nargs='+', metavar='task',
+                   help='task ordinal or uid')
+    p.add_argument('--reopen', action='store_true', help='mark as not completed instead')
+
+    p = sub.add_parser('move', help='move tasks to another quadrant')
+    p.add_argument('from_quadrant', type=quadrant)
+    p.add_argument('task_ids', type=parse_task_ref, nargs='+', metavar='task',
+                   help='task ordinal or uid')
+    p.add_argument('to_quadrant', type=quadrant)
+
+    p = sub.add_parser('import', help='import tasks (json, csv, ics, ndjson; "-" reads NDJSON from stdin)')
+    p.add_argument('file')
+    p.add_argument('--format', choices=('json', 'csv', 'ics', 'ndjson'))
+    p.add_argument('--merge', action='store_true', help='merge JSON instead of replacing all tasks')
+
+    p = sub.add_parser('export', help='export tasks (json, csv, markdown, calendar, ndjson; "-" writes NDJSON to stdout)')
+    p.add_argument('file')
+    p.add_argument('--format', choices=('json', 'csv', 'markdown', 'calendar', 'ndjson'))
+
+    p = sub.add_parser('stats', help='per-quadrant task counts')
+    add_format(p)
+
+    p = sub.add_parser('batch', help='apply NDJSON operations with one load and one save')
+    p.add_argument('file', nargs='?', default='-', help='NDJSON file (default: stdin)')
+
+    p = sub.add_parser('serve', help='serve the local HTTP/JSON API (see eisenhower_matrix.infrastructure.api)')
+    listen = p.add_mutually_exclusive_group()
+    listen.add_argument('--socket', help='Unix socket path (default: $XDG_RUNTIME_DIR/eisenhower/api.sock)')
+    listen.add_argument('--port', type=int, help='listen on this loopback TCP port instead')
+
+    p = sub.add_parser('slowlog', help='summarize the slowest logged operations (enable with EISENHOWER_SLOW_MS)')
+    slowlog.add_arguments(p)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for CLI"""
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        args.command = 'show'
+    tracing_from_environment()
+    slowlog.slow_log_from_environment()
+    try:
+        app = CliApp(project_id=args.project, data_file=args.data_file)
+        return getattr(app, f"cmd_{args.command}")(args)
+    except CliError as e:
+        print(f"eisenhower: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"eisenhower: {e}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        # Input or output files that cannot be opened, read or written
+        print(f"eisenhower: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Diagnostics Package
+
+Opt-in tooling for measuring the application in real use. Nothing here is
+active unless enabled explicitly (see each module).
+
+Exports are resolved lazily, so hot-path modules can import tracing
+without pulling in the rest of the package.
+"""
+
+from eisenhower_matrix._lazy import lazy_exports
+
+# Exported name -> module that defines it
+_LAZY_EXPORTS = {
+    'ServiceRecorder': 'eisenhower_matrix.diagnostics.recorder',
+    'recorder_from_environment': 'eisenhower_matrix.diagnostics.recorder',
+    'traced': 'eisenhower_matrix.diagnostics.tracing',
+    'span': 'eisenhower_matrix.diagnostics.tracing',
+    'start_tracing': 'eisenhower_matrix.diagnostics.tracing',
+    'stop_tracing': 'eisenhower_matrix.diagnostics.tracing',
+    'is_tracing': 'eisenhower_matrix.diagnostics.tracing',
+    'tracing_from_environment': 'eisenhower_matrix.diagnostics.tracing',
+    'SlowOperationLog': 'eisenhower_matrix.diagnostics.slowlog',
+    'slow_log_from_environment': 'eisenhower_matrix.diagnostics.slowlog',
+    'LeakCheck': 'eisenhower_matrix.diagnostics.memory',
+    'memory_report': 'eisenhower_matrix.diagnostics.memory',
+    'memory_tracing_from_environment': 'eisenhower_matrix.diagnostics.memory',
+}
+
+__all__ = [
+    'ServiceRecorder',
+    'recorder_from_environment',
+    'traced',
+    'span',
+    'start_tracing',
+    'stop_tracing',
+    'is_tracing',
+    'tracing_from_environment',
+    'SlowOperationLog',
+    'slow_log_from_environment',
+    'LeakCheck',
+    'memory_report',
+    'memory_tracing_from_environment',
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,265 @@
+"""
+Memory Diagnostics
+
+Where the memory of an open session goes, per loaded project:
+
+    Task objects    the Task instances of a service, their attribute dicts
+                    and the lists and dicts holding them
+    strings         descriptions, notes, tags, metadata, uids and dates
+    widget tree     the widgets displaying the open project (count), and
+                    the Python memory allocated by the UI modules
+
+Object sizes come from walking each service's tasks (sys.getsizeof, shared
+objects counted once); they are exact for the Python side and available
+at any time. tracemalloc attributes the process's Python allocations to
+the layer that made them (domain, application, persistence, UI), but only
+allocations made after it started, so start it with EISENHOWER_MEMORY=1
+for the whole run. GTK's own (native) widget memory is invisible to both.
+
+LeakCheck holds weak references to services that should be gone (evicted
+from the project cache) and reports the ones that survive a collection,
+with the types referring to them.
+
+The GUI writes a report with Ctrl+Alt+Shift+M; benchmarks.memory checks
+that 1,000 project switches do not grow memory or leak services.
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+import weakref
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Frames kept per traced allocation: enough to find the layer behind helpers
+TRACE_FRAMES = 8
+
+# Layer of an allocation: first matching path fragment of its traceback
+_LAYERS = (
+    ('ui', os.path.join('eisenhower_matrix', 'infrastructure', 'ui')),
+    ('persistence', os.path.join('eisenhower_matrix', 'infrastructure', 'persistence')),
+    ('api', os.path.join('eisenhower_matrix', 'infrastructure', 'api')),
+    ('application', os.path.join('eisenhower_matrix', 'application')),
+    ('domain', os.path.join('eisenhower_matrix', 'domain')),
+)
+
+
+def default_memory_dir() -> Path:
+    return Path.home() / ".local" / "share" / "eisenhower" / "memory"
+
+
+@dataclass
+class ProjectFootprint:
+    """Python memory held by one loaded project"""
+    project_id: str
+    tasks: int
+    task_bytes: int
+    string_bytes: int
+    widgets: int = 0
+    
+    @property
+    def total_bytes(self) -> int:
+        return self.task_bytes + self.string_bytes
+
+
+def measure_service(service, project_id: Optional[str] = None) -> ProjectFootprint:
+    """
+    Measure the tasks of a service (active ones and a loaded archive)
+    
+    Args:
+        service: EisenhowerMatrixService to measure
+        project_id: Reported project (defaults to service.project_id)
+    """
+    seen = set()
+    task_bytes = string_bytes = count = 0
+    
+    def size(obj) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        return sys.getsizeof(obj)
+    
+    include_archived = service.is_archive_loaded
+    all_tasks = service.get_all_tasks(include_archived=include_archived)
+    for tasks in all_tasks.values():
+        task_bytes += size(tasks)
+        for task in tasks:
+            count += 1
+            task_bytes += size(task) + size(task.__dict__)
+            for value in task.__dict__.values():
+                if isinstance(value, str):
+                    string_bytes += size(value)
+                elif isinstance(value, list):
+                    task_bytes += size(value)
+                    string_bytes += sum(size(item) for item in value)
+                elif isinstance(value, dict):
+                    task_bytes += size(value)
+                    string_bytes += sum(size(k) + size(v) for k, v in value.items())
+    return ProjectFootprint(
+        project_id=project_id if project_id is not None else (service.project_id or ""),
+        tasks=count,
+        task_bytes=task_bytes,
+        string_bytes=string_bytes,
+    )
+
+
+def count_widgets(root) -> int:
+    """Number of widgets in a GTK 4 widget tree, root included"""
+    count = 0
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        count += 1
+        child = widget.get_first_child()
+        while child is not None:
+            stack.append(child)
+            child = child.get_next_sibling()
+    return count
+
+
+class LeakCheck:
+    """
+    Watches objects that should be collected
+    
+    Single Responsibility: Tell which supposedly dropped objects are
+    still alive, and what holds them
+    
+    Watching costs one weak reference per object, released as soon as the
+    object is collected.
+    """
+    
+    def __init__(self):
+        self._watched: Dict[int, Tuple[str, weakref.ref]] = {}
+    
+    def watch(self, obj, label: str) -> None:
+        """Expect obj to be collected soon"""
+        key = id(obj)
+        self._watched[key] = (label, weakref.ref(obj, lambda ref, key=key: self._watched.pop(key, None)))
+    
+    def survivors(self) -> List[str]:
+        """Labels of the watched objects still alive after a full collection"""
+        gc.collect()
+        return [label for label, ref in list(self._watched.values()) if ref() is not None]
+    
+    def describe(self, limit: int = 10) -> List[dict]:
+        """Survivors with their type and (up to limit) what refers to them"""
+        gc.collect()
+        frame = sys._getframe()
+        leaked = []
+        for label, ref in list(self._watched.values()):
+            obj = ref()
+            if obj is None:
+                continue
+            referrers = [_describe_referrer(r) for r in gc.get_referrers(obj) if r is not frame]
+            leaked.append({'label': label, 'type': type(obj).__qualname__, 'referrers': referrers[:limit]})
+            del obj
+        return leaked
+
+
+def _describe_referrer(referrer) -> str:
+    """Type of a referrer; for an instance __dict__, the instance's type"""
+    if isinstance(referrer, dict):
+        for owner in gc.get_referrers(referrer):
+            if getattr(owner, '__dict__', None) is referrer:
+                return f"{type(owner).__qualname__}.__dict__"
+    return type(referrer).__qualname__
+
+
+def _layer(traceback: tracemalloc.Traceback) -> str:
+    """Layer responsible for an allocation (innermost project frame wins)"""
+    for frame in reversed(traceback):
+        for layer, fragment in _LAYERS:
+            if fragment in frame.filename:
+                return layer
+    return 'other'
+
+
+def layer_statistics(snapshot: tracemalloc.Snapshot) -> Dict[str, int]:
+    """Traced bytes per layer of a snapshot"""
+    totals: Dict[str, int] = {}
+    for stat in snapshot.statistics('traceback'):
+        layer = _layer(stat.traceback)
+        totals[layer] = totals.get(layer, 0) + stat.size
+    return totals
+
+
+def start_memory_tracing(frames: int = TRACE_FRAMES) -> bool:
+    """
+    Start tracemalloc
+    
+    Returns:
+        False if it was already running
+    """
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    return True
+
+
+def memory_tracing_from_environment(environ: Mapping[str, str] = os.environ) -> bool:
+    """Start tracemalloc for the whole run if EISENHOWER_MEMORY is set"""
+    value = environ.get('EISENHOWER_MEMORY', '').strip()
+    if not value or value == '0':
+        return False
+    return start_memory_tracing()
+
+
+def memory_report(services: Mapping[str, object], widget_roots: Optional[Mapping[str, Iterable]] = None,
+                  leak_check: Optional[LeakCheck] = None, top: int = 10) -> dict:
+    """
+    Collect a memory report
+    
+    Args:
+        services: Loaded services by project ID
+        widget_roots: Widgets displaying each project, by project ID
+        leak_check: Checked for services that outlived their project
+        top: Allocation sites listed when tracemalloc is running
+    
+    Returns:
+        JSON-serializable report
+    """
+    projects = []
+    for project_id, service in services.items():
+        footprint = measure_service(service, project_id)
+        for root in (widget_roots or {}).get(project_id, ()):
+            footprint.widgets += count_widgets(root)
+        projects.append(dict(asdict(footprint), total_bytes=footprint.total_bytes))
+    report = {
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'projects': projects,
+    }
+    
+    if leak_check is not None:
+        report['leaked'] = leak_check.describe()
+    
+    if tracemalloc.is_tracing():
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ])
+        current, peak = tracemalloc.get_traced_memory()
+        report['tracemalloc'] = {
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'by_layer': layer_statistics(snapshot),
+            'top_sites': [
+                {'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                 'bytes': stat.size, 'blocks': stat.count}
+                for stat in snapshot.statistics('lineno')[:top]
+            ],
+        }
+    return report
+
+
+def write_memory_report(report: dict, directory: Optional[Path] = None) -> Path:
+    """Write a report as memory-<time>.json and return its path"""
+    directory = directory or default_memory_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"memory-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return path
@@ -0,0 +1,114 @@
+"""
+On-Demand Profiler
+
+Profiles the running application for a while and writes two files:
+
+    profile-<time>.prof         cProfile statistics of the thread that
+                                started the session (python -m pstats,
+                                snakeviz, ...)
+    profile-<time>.folded.txt   sampled stacks of every thread in collapsed
+                                format (flamegraph.pl, speedscope, Perfetto)
+
+The GUI starts a session with Ctrl+Alt+Shift+P.
+"""
+
+import cProfile
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+def default_profile_dir() -> Path:
+    return Path.home() / ".local" / "share" / "eisenhower" / "profiles"
+
+
+class ProfilerSession:
+    """
+    A cProfile session plus a stack sampler
+    
+    Single Responsibility: Capture where a running process spends its time
+    
+    start() and stop() are cheap and must be called on the profiled thread;
+    write() does the file I/O and may run on any thread. The sampler is a
+    daemon thread that takes one sample of every thread's stack per
+    interval, so long-running calls on the profiled thread show up in the
+    flamegraph even while it is busy.
+    """
+    
+    # Seconds between stack samples
+    SAMPLE_INTERVAL = 0.005
+    
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize session
+        
+        Args:
+            directory: Where write() puts the files (defaults to
+                default_profile_dir())
+        """
+        self._directory = directory or default_profile_dir()
+        self._profile = cProfile.Profile()
+        self._samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._started_at: Optional[datetime] = None
+    
+    @property
+    def is_running(self) -> bool:
+        return self._sampler is not None and not self._stop.is_set()
+    
+    def start(self) -> None:
+        """Start profiling the calling thread and sampling all threads"""
+        self._started_at = datetime.now()
+        self._sampler = threading.Thread(target=self._sample_loop, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+        self._profile.enable()
+    
+    def stop(self) -> None:
+        """Stop profiling"""
+        self._profile.disable()
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+    
+    def write(self) -> Tuple[Path, Path]:
+        """
+        Write the statistics and the collapsed stacks
+        
+        Returns:
+            (.prof file, .folded.txt file)
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        stem = f"profile-{(self._started_at or datetime.now()).strftime('%Y%m%d-%H%M%S')}"
+        prof_path = self._directory / f"{stem}.prof"
+        folded_path = self._directory / f"{stem}.folded.txt"
+        self._profile.dump_stats(str(prof_path))
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, count in self._samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return prof_path, folded_path
+    
+    def _sample_loop(self) -> None:
+        """Sampler thread body"""
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.SAMPLE_INTERVAL):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                self._samples[self._collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+    
+    @staticmethod
+    def _collapse(thread_name: str, frame) -> str:
+        """A stack as 'thread;outermost;...;innermost'"""
+        parts = []
+        while frame is not None:
+            code = frame.f_code
+            parts.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        parts.append(thread_name)
+        # The count follows the last space, so frames may contain spaces
+        return ';'.join(part.replace(';', ':') for part in reversed(parts))
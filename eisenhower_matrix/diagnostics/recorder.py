@@ -0,0 +1,223 @@
+"""
+Service Call Recorder
+
+Captures the EisenhowerMatrixService calls of a live session into a trace
+that benchmarks.replay re-executes against any repository adapter.
+
+A trace is a JSON Lines file:
+
+    {"trace": 1, "project_id": "...", "started": "...", "snapshot": "<file>"}
+    {"op": "complete_task", "args": [2, "<uid>"], "kwargs": {}, "ms": 0.41}
+    {"op": "add_task", "args": [1, "Call Bob"], "kwargs": {}, "ms": 0.9, "uid": "<uid>"}
+    {"op": "batch", "args": ["Import CSV"], "kwargs": {}}
+    {"op": "end-batch"}
+
+The snapshot next to it holds the tasks as they were before the first
+recorded call, in the JSON export format.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Mapping, Optional, TextIO
+from eisenhower_matrix.domain.task import Task
+from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
+
+TRACE_VERSION = 1
+
+# File name ending of traces written by recorder_from_environment
+TRACE_SUFFIX = '.trace.jsonl'
+
+# Recorders to stop at exit; weak so that evicted services can be collected
+_active_recorders: "weakref.WeakSet[ServiceRecorder]" = weakref.WeakSet()
+
+
+@atexit.register
+def _stop_active_recorders() -> None:
+    for recorder in list(_active_recorders):
+        recorder.stop()
+
+
+# Service methods whose calls are recorded
+RECORDED_METHODS = (
+    'add_task', 'update_task', 'complete_task', 'uncomplete_task',
+    'archive_task', 'unarchive_task', 'remove_task', 'move_task',
+    'reorder_task', 'reorder_task_relative', 'undo', 'redo',
+    'complete_tasks', 'archive_tasks', 'remove_tasks', 'move_tasks',
+    'get_tasks', 'get_all_tasks', 'get_archived_tasks', 'count_archived_tasks',
+    'find_task', 'search_tasks', 'get_overdue_tasks', 'get_due_soon_tasks',
+    'import_from_file', 'export_to_file',
+)
+
+
+class ServiceRecorder:
+    """
+    Records a service's public calls to a trace file
+    
+    Single Responsibility: Capture a session's service workload
+    
+    Wraps the recorded methods on the service instance (the class is
+    untouched), so every caller - windows, panels, the local API - is
+    captured. Only outermost calls are recorded; calls a service method
+    makes to other public methods belong to it. Recording starts once
+    the service has loaded its tasks.
+    """
+    
+    def __init__(self, service: EisenhowerMatrixService, trace_path: Path, project_id: str = ""):
+        """
+        Initialize recorder
+        
+        Args:
+            service: Service to record
+            trace_path: Trace file to write (the snapshot goes next to it)
+            project_id: Stored in the trace header
+        """
+        self._service = service
+        self.trace_path = Path(trace_path)
+        self.snapshot_path = self.trace_path.with_name(self.trace_path.stem + '.snapshot.json')
+        self._project_id = project_id
+        self._file: Optional[TextIO] = None
+        self._close_file: Optional[weakref.finalize] = None
+        self._depth = 0
+        self._lock = threading.Lock()
+        self._started = False
+    
+    @property
+    def is_recording(self) -> bool:
+        return self._started
+    
+    def start(self) -> None:
+        """Start recording (calls made before the tasks loaded are skipped)"""
+        if self._started:
+            return
+        self._started = True
+        for name in RECORDED_METHODS:
+            setattr(self._service, name, self._wrap(name, getattr(self._service, name)))
+        self._service.batch = self._wrap_batch(self._service.batch)
+        _active_recorders.add(self)
+    
+    def stop(self) -> None:
+        """Stop recording and close the trace"""
+        if not self._started:
+            return
+        self._started = False
+        for name in RECORDED_METHODS + ('batch',):
+            self._service.__dict__.pop(name, None)
+        with self._lock:
+            if self._file is not None:
+                self._close_file()
+                self._file = None
+        _active_recorders.discard(self)
+    
+    def _open(self) -> bool:
+        """Write the snapshot and trace header on first use; False while loading"""
+        if self._file is not None:
+            return True
+        if not self._service.is_loaded:
+            return False
+        self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+        # Claim the trace (and so the snapshot) name before writing either
+        self._file = self._create_trace()
+        # A recorder collected with its service still flushes its trace
+        self._close_file = weakref.finalize(self, self._file.close)
+        self._depth += 1
+        try:
+            tasks = self._service.get_all_tasks(include_archived=True)
+            self._service.export_tasks_to_file(str(self.snapshot_path), tasks)
+        finally:
+            self._depth -= 1
+        self._write({
+            'trace': TRACE_VERSION,
+            'project_id': self._project_id,
+            'started': datetime.now().isoformat(),
+            'snapshot': self.snapshot_path.name,
+        })
+        return True
+    
+    def _create_trace(self) -> TextIO:
+        """
+        Create the trace file, never overwriting one
+        
+        Another session may have taken the name (same project, same
+        instant); a numeric suffix is added until the name is free.
+        """
+        base = self.trace_path
+        name = base.name[:-len(TRACE_SUFFIX)] if base.name.endswith(TRACE_SUFFIX) else base.stem
+        suffix = TRACE_SUFFIX if base.name.endswith(TRACE_SUFFIX) else base.suffix
+        attempt = 0
+        while True:
+            try:
+                f = open(self.trace_path, 'x', encoding='utf-8')
+            except FileExistsError:
+                attempt += 1
+                self.trace_path = base.with_name(f"{name}-{attempt}{suffix}")
+                continue
+            self.snapshot_path = self.trace_path.with_name(self.trace_path.stem + '.snapshot.json')
+            return f
+    
+    def _write(self, record: dict) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.write(json.dumps(record, default=str) + '\n')
+    
+    def _wrap(self, name: str, method):
+        @functools.wraps(method)
+        def recorded(*args, **kwargs):
+            if self._depth or not self._open():
+                return method(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                self._depth -= 1
+            record = {'op': name, 'args': list(args), 'kwargs': kwargs, 'ms': round(elapsed_ms, 3)}
+            if isinstance(result, Task):
+                # Lets the replayer map this uid to the one it creates
+                record['uid'] = result.uid
+            self._write(record)
+            return result
+        return recorded
+    
+    def _wrap_batch(self, batch):
+        @contextmanager
+        def recorded(label: Optional[str] = None, **kwargs):
+            opened = not self._depth and self._open()
+            if opened:
+                self._write({'op': 'batch', 'args': [label], 'kwargs': kwargs})
+            try:
+                with batch(label, **kwargs) as service:
+                    yield service
+            finally:
+                if opened:
+                    self._write({'op': 'end-batch'})
+        return recorded
+
+
+def recorder_from_environment(service: EisenhowerMatrixService, project_id: str,
+                              environ: Mapping[str, str] = os.environ) -> Optional[ServiceRecorder]:
+    """
+    Start recording service if EISENHOWER_RECORD names a directory
+    
+    Each recorded service writes <project_id>-<timestamp>-<pid>.trace.jsonl
+    (and its snapshot) into that directory.
+    
+    Returns:
+        The started recorder, or None when recording is not enabled
+    """
+    directory = environ.get('EISENHOWER_RECORD', '').strip()
+    if not directory:
+        return None
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    path = Path(directory).expanduser() / f"{project_id}-{stamp}-{os.getpid()}{TRACE_SUFFIX}"
+    recorder = ServiceRecorder(service, path, project_id)
+    recorder.start()
+    return recorder
@@ -0,0 +1,293 @@
+"""
+Slow-Operation Log
+
+Records every traced span - service operations, repository loads and
+saves, JSON reads and writes, imports, panel and window refreshes - that
+takes longer than a threshold, as one JSON object per line:
+
+    {"ts": "2026-03-02T10:15:04.120", "op": "repository.save", "ms": 412.7,
+     "project": "work", "tasks": 18250, "thread": "MainThread"}
+    {"ts": "...", "op": "json.write", "ms": 398.1, "project": "work",
+     "tasks": 18250, "bytes": 6213377, "thread": "MainThread"}
+
+Warnings and errors logged by the application (e.g. a tasks file that
+cannot be read) are written to the same file with "level" and "message".
+The file rotates at 1 MiB, keeping three old files.
+
+Enable it for a run with EISENHOWER_SLOW_MS=<threshold in ms> (0 logs
+every span). Summarize the worst offenders with
+
+    eisenhower slowlog [--top N] [--sort total|max|count]
+    python -m eisenhower_matrix.diagnostics.slowlog [FILE]
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import threading
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, TextIO
+from eisenhower_matrix.diagnostics import tracing
+
+# Rotation of the log file
+MAX_BYTES = 1024 * 1024
+BACKUP_COUNT = 3
+
+# Logger the slow entries are written through
+LOGGER_NAME = 'eisenhower_matrix.slow'
+
+# --sort choice -> summary field ranked by
+SORT_KEYS = {'total': 'total_ms', 'max': 'max_ms', 'count': 'count'}
+
+
+def default_slow_log_path() -> Path:
+    return Path.home() / ".local" / "share" / "eisenhower" / "logs" / "slow-operations.jsonl"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats slow entries as they are and other records as JSON objects"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = getattr(record, 'slow_entry', None)
+        if entry is None:
+            entry = {
+                'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+                'level': record.levelname.lower(),
+                'logger': record.name,
+                'message': record.getMessage(),
+            }
+            if record.exc_info:
+                entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _slow_or_warning(record: logging.LogRecord) -> bool:
+    """Handler filter: slow entries and application warnings and errors"""
+    return hasattr(record, 'slow_entry') or record.levelno >= logging.WARNING
+
+
+class SlowOperationLog:
+    """
+    Writes spans over a threshold to a rotating JSON Lines file
+    
+    Single Responsibility: Persist slow operations with their context
+    
+    While started, it receives every finished span from the tracing
+    module; spans under the threshold cost a comparison and nothing else.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, threshold_ms: float = 100.0):
+        """
+        Initialize log
+        
+        Args:
+            path: Log file (defaults to default_slow_log_path())
+            threshold_ms: Spans lasting at least this long are recorded
+        """
+        self.path = Path(path) if path else default_slow_log_path()
+        self.threshold = threshold_ms / 1000.0
+        self._handler: Optional[logging.Handler] = None
+        self._logger = logging.getLogger(LOGGER_NAME)
+    
+    def start(self) -> None:
+        """Open the file and start receiving spans"""
+        if self._handler is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handler = RotatingFileHandler(
+            self.path, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding='utf-8', delay=True
+        )
+        self._handler.setFormatter(JsonLinesFormatter())
+        self._handler.addFilter(_slow_or_warning)
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(self._handler)
+        
+        # Application warnings and errors go to the file too, and still to
+        # stderr (adding a handler disables logging's default output)
+        app_logger = logging.getLogger('eisenhower_matrix')
+        if not app_logger.handlers:
+            app_logger.addHandler(logging.StreamHandler())
+        app_logger.addHandler(self._handler)
+        
+        tracing.set_slow_log(self)
+    
+    def stop(self) -> None:
+        """Stop receiving spans and close the file"""
+        if self._handler is None:
+            return
+        tracing.set_slow_log(None)
+        self._logger.removeHandler(self._handler)
+        logging.getLogger('eisenhower_matrix').removeHandler(self._handler)
+        self._handler.close()
+        self._handler = None
+    
+    def record(self, name: str, seconds: float, fields: Mapping) -> None:
+        """
+        Write one slow span
+        
+        Args:
+            name: Span name (the operation)
+            seconds: Its duration
+            fields: Its context and arguments (project, tasks, bytes, ...)
+        """
+        entry = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'op': name,
+            'ms': round(seconds * 1000.0, 3),
+        }
+        entry.update(fields)
+        entry['thread'] = threading.current_thread().name
+        self._logger.info(name, extra={'slow_entry': entry})
+
+
+def slow_log_from_environment(environ: Mapping[str, str] = os.environ) -> Optional[SlowOperationLog]:
+    """
+    Start the slow-operation log if EISENHOWER_SLOW_MS is set
+    
+    The value is the threshold in milliseconds; the log is written to
+    default_slow_log_path().
+    
+    Returns:
+        The started log, or None when it is not enabled
+    """
+    value = environ.get('EISENHOWER_SLOW_MS', '').strip()
+    if not value:
+        return None
+    try:
+        threshold_ms = float(value)
+    except ValueError:
+        logging.getLogger(__name__).warning("Ignoring invalid EISENHOWER_SLOW_MS value: %s", value)
+        return None
+    log = SlowOperationLog(threshold_ms=threshold_ms)
+    log.start()
+    return log
+
+
+# Analyzer -----------------------------------------------------------------
+
+def read_entries(path: Path) -> Iterator[dict]:
+    """Slow entries of a log file and its rotated predecessors, oldest first"""
+    files = [path.with_name(f"{path.name}.{n}") for n in range(BACKUP_COUNT, 0, -1)] + [path]
+    for file in files:
+        if not file.exists():
+            continue
+        with open(file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict) and 'op' in entry and 'ms' in entry:
+                    yield entry
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted, non-empty values"""
+    return ordered[max(1, math.ceil(pct / 100.0 * len(ordered))) - 1]
+
+
+def summarize(entries: List[dict]) -> List[dict]:
+    """
+    Aggregate entries per operation
+    
+    Returns:
+        One row per operation: count, total/p50/p95/max ms and the
+        slowest entry
+    """
+    by_op: Dict[str, List[dict]] = {}
+    for entry in entries:
+        by_op.setdefault(entry['op'], []).append(entry)
+    rows = []
+    for op, group in by_op.items():
+        durations = sorted(e['ms'] for e in group)
+        rows.append({
+            'op': op,
+            'count': len(group),
+            'total_ms': round(sum(durations), 3),
+            'p50_ms': _percentile(durations, 50),
+            'p95_ms': _percentile(durations, 95),
+            'max_ms': durations[-1],
+            'worst': max(group, key=lambda e: e['ms']),
+        })
+    return rows
+
+
+def _describe(entry: dict) -> str:
+    """Context of an entry: project, tasks and bytes where known"""
+    parts = []
+    if entry.get('project'):
+        parts.append(f"project={entry['project']}")
+    for key in ('tasks', 'rows', 'bytes'):
+        if entry.get(key) is not None:
+            parts.append(f"{key}={entry[key]}")
+    return ' '.join(parts)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Analyzer options (shared by `eisenhower slowlog`)"""
+    parser.add_argument('file', nargs='?', type=Path, default=None,
+                        help='log file (default: the slow log in the data directory)')
+    parser.add_argument('--top', type=int, default=10, help='operations and entries to show (default 10)')
+    parser.add_argument('--sort', choices=('total', 'max', 'count'), default='total',
+                        help='rank operations by total time, worst case or frequency (default total)')
+    parser.add_argument('--op', dest='operation', help='only entries of this operation')
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+
+
+def report(args, out: TextIO = sys.stdout, project_id: Optional[str] = None) -> int:
+    """
+    Print the worst offenders of a slow log
+    
+    Args:
+        args: Parsed add_arguments() options
+        out: Where to write the report
+        project_id: Only entries of this project
+    
+    Returns:
+        Exit status
+    """
+    path = args.file or default_slow_log_path()
+    entries = [
+        e for e in read_entries(path)
+        if (project_id is None or e.get('project') == project_id)
+        and (args.operation is None or e['op'] == args.operation)
+    ]
+    rows = sorted(summarize(entries), key=lambda r: r[SORT_KEYS[args.sort]], reverse=True)[:args.top]
+    slowest = sorted(entries, key=lambda e: e['ms'], reverse=True)[:args.top]
+    
+    if args.format == 'json':
+        json.dump({'file': str(path), 'entries': len(entries), 'operations': rows, 'slowest': slowest},
+                  out, indent=2, default=str)
+        out.write('\n')
+        return 0
+    
+    if not entries:
+        out.write(f"No slow operations in {path}\n")
+        return 0
+    out.write(f"{len(entries)} slow operations in {path}\n\n")
+    out.write(f"{'operation':40} {'count':>6} {'total ms':>10} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}\n")
+    for row in rows:
+        out.write(f"{row['op']:40} {row['count']:>6} {row['total_ms']:10.1f} {row['p50_ms']:9.1f} "
+                  f"{row['p95_ms']:9.1f} {row['max_ms']:9.1f}\n")
+    out.write("\nSlowest entries:\n")
+    for entry in slowest:
+        out.write(f"  {entry['ms']:9.1f} ms  {entry['op']:40} {entry.get('ts', '')}  {_describe(entry)}\n")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Summarize the slowest operations of a slow-operation log")
+    add_arguments(parser)
+    parser.add_argument('--project', help='only entries of this project')
+    args = parser.parse_args(argv)
+    return report(args, project_id=args.project)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""
+Hot-Path Tracing
+
+Spans around service calls, persistence, observer notification and UI
+refresh, written as Chrome trace-event JSON (open it in Perfetto or
+chrome://tracing).
+
+Tracing costs nothing while disabled: @traced only registers functions,
+which are swapped for timing wrappers when tracing starts and restored
+when it stops, and span() returns a shared no-op object. Enable it with
+EISENHOWER_TRACE=1 (or a file path) for a whole run, or toggle it in the
+app with Ctrl+Alt+Shift+T.
+
+The same spans feed the slow-operation log (see slowlog) while it is
+enabled, with or without a trace running. Spans inside a call on an
+object that defines trace_context() (the service: project and task
+count) carry that context into the log.
+
+    @traced
+    class Service: ...              # every public method
+    
+    with span('repository.save', tasks=count) as s:
+        text = serialize()
+        if s:                       # only pay for arguments when tracing
+            s.set(bytes=len(text))
+"""
+
+import atexit
+import functools
+import importlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Events kept per trace; later spans are counted but dropped
+MAX_EVENTS = 1_000_000
+
+# Method supplying the context of spans in calls on its object; never wrapped
+CONTEXT_METHOD = 'trace_context'
+
+
+class _NullSpan:
+    """Span returned while tracing is disabled"""
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    def __enter__(self) -> '_NullSpan':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        pass
+    
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """A timed region of the active trace"""
+    
+    __slots__ = ('_name', '_args', '_start')
+    
+    def __init__(self, name: str, args: dict):
+        self._name = name
+        self._args = args
+        self._start = 0.0
+    
+    def __bool__(self) -> bool:
+        return True
+    
+    def __enter__(self) -> 'Span':
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        _finish(self._name, self._start, time.perf_counter(), self._args)
+    
+    def set(self, **args) -> None:
+        """Add arguments (e.g. counts known only at the end) to the span"""
+        self._args.update(args)
+
+
+class Tracer:
+    """
+    Collects complete ("X") trace events
+    
+    Single Responsibility: Buffer spans and write them as a Chrome trace
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._epoch = time.perf_counter()
+        self._events: List[dict] = []
+        self._threads: Dict[int, str] = {}
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+    
+    def add(self, name: str, start: float, end: float, args: Optional[dict] = None) -> None:
+        thread = threading.current_thread()
+        tid = thread.native_id or thread.ident
+        event = {
+            'name': name,
+            'cat': name.split('.', 1)[0],
+            'ph': 'X',
+            'ts': round((start - self._epoch) * 1e6, 3),
+            'dur': round((end - start) * 1e6, 3),
+            'pid': self._pid,
+            'tid': tid,
+        }
+        if args:
+            event['args'] = args
+        with self._lock:
+            if len(self._events) >= MAX_EVENTS:
+                self._dropped += 1
+                return
+            self._events.append(event)
+            self._threads.setdefault(tid, thread.name)
+    
+    def write(self) -> Path:
+        """Write the trace file"""
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+            dropped = self._dropped
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in threads.items()
+        ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({
+                'traceEvents': metadata + events,
+                'displayTimeUnit': 'ms',
+                'otherData': {'droppedEvents': dropped},
+            }, f)
+        return self.path
+
+
+_tracer: Optional[Tracer] = None
+
+# Slow-operation log receiving spans over its threshold (see slowlog)
+_slow_log = None
+
+# Object whose trace_context() describes the current call
+_context_owner: ContextVar = ContextVar('trace_context_owner', default=None)
+
+# Registered functions: (module name, qualified name, original function)
+_targets: List[Tuple[str, str, Callable]] = []
+
+
+def _result_size(result) -> Optional[int]:
+    """Number of tasks in a list or quadrant dict result"""
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, dict) and all(isinstance(v, list) for v in result.values()):
+        return sum(len(v) for v in result.values())
+    return None
+
+
+def _finish(name: str, start: float, end: float, args: Optional[dict]) -> None:
+    """Hand a finished span to the active trace and slow-operation log"""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.add(name, start, end, args)
+    slow_log = _slow_log
+    if slow_log is not None and end - start >= slow_log.threshold:
+        owner = _context_owner.get()
+        context = getattr(owner, CONTEXT_METHOD)() if owner is not None else {}
+        slow_log.record(name, end - start, {**context, **(args or {})})
+
+
+def _wrap(func: Callable, name: str) -> Callable:
+    @functools.wraps(func)
+    def traced_call(*args, **kwargs):
+        if _tracer is None and _slow_log is None:
+            return func(*args, **kwargs)
+        token = None
+        if args and hasattr(args[0], CONTEXT_METHOD):
+            token = _context_owner.set(args[0])
+        start = time.perf_counter()
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            size = _result_size(result)
+            _finish(name, start, time.perf_counter(), {'tasks': size} if size is not None else None)
+            if token is not None:
+                _context_owner.reset(token)
+    return traced_call
+
+
+def _span_name(qualname: str) -> str:
+    return qualname.replace('.<locals>', '')
+
+
+def _register(func: Callable) -> Callable:
+    _targets.append((func.__module__, func.__qualname__, func))
+    if _tracer is not None or _slow_log is not None:
+        # Defined while wrappers are installed: install this one right away
+        return _wrap(func, _span_name(func.__qualname__))
+    return func
+
+
+def traced(target):
+    """
+    Mark a function, or every public method of a class, for tracing
+    
+    Marked functions are unchanged until tracing starts.
+    """
+    if inspect.isclass(target):
+        for attr, value in list(vars(target).items()):
+            # Skip private helpers and wrapped generators (context managers)
+            if (attr.startswith('_') or attr == CONTEXT_METHOD or not inspect.isfunction(value)
+                    or hasattr(value, '__wrapped__')):
+                continue
+            setattr(target, attr, _register(value))
+        return target
+    return _register(target)
+
+
+def _resolve_owner(module_name: str, qualname: str):
+    """The object holding a registered function, or None"""
+    owner = importlib.import_module(module_name)
+    for part in qualname.split('.')[:-1]:
+        owner = getattr(owner, part, None)
+        if owner is None:
+            return None
+    return owner
+
+
+def _install(wrapped: bool) -> None:
+    """Swap every registered function for its wrapper, or back"""
+    for module_name, qualname, func in _targets:
+        owner = _resolve_owner(module_name, qualname)
+        if owner is None:
+            continue
+        attr = qualname.rsplit('.', 1)[-1]
+        setattr(owner, attr, _wrap(func, _span_name(qualname)) if wrapped else func)
+
+
+def _set_sinks(tracer: Optional[Tracer], slow_log) -> None:
+    """Replace the trace and slow log, installing wrappers while either is set"""
+    global _tracer, _slow_log
+    was_active = _tracer is not None or _slow_log is not None
+    _tracer, _slow_log = tracer, slow_log
+    active = tracer is not None or slow_log is not None
+    if active != was_active:
+        _install(active)
+
+
+def set_slow_log(slow_log) -> None:
+    """
+    Send spans to a slow-operation log, or stop with None
+    
+    Args:
+        slow_log: Object with a threshold (seconds) and
+            record(name, seconds, fields); see slowlog.SlowOperationLog
+    """
+    _set_sinks(_tracer, slow_log)
+
+
+def is_tracing() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **args):
+    """Context manager timing a region while tracing; a no-op otherwise"""
+    if _tracer is None and _slow_log is None:
+        return _NULL_SPAN
+    return Span(name, args)
+
+
+def default_trace_path() -> Path:
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    return Path.home() / ".local" / "share" / "eisenhower" / "traces" / f"trace-{stamp}.json"
+
+
+def start_tracing(path: Optional[Path] = None) -> Path:
+    """
+    Start collecting spans
+    
+    Args:
+        path: Trace file written by stop_tracing() (defaults to
+            default_trace_path())
+    
+    Returns:
+        The trace file
+    """
+    if _tracer is not None:
+        return _tracer.path
+    tracer = Tracer(Path(path) if path else default_trace_path())
+    _set_sinks(tracer, _slow_log)
+    return tracer.path
+
+
+def stop_tracing() -> Optional[Path]:
+    """
+    Stop collecting spans and write the trace
+    
+    Returns:
+        The written trace file, or None if tracing was not active
+    """
+    tracer = _tracer
+    if tracer is None:
+        return None
+    _set_sinks(None, _slow_log)
+    try:
+        return tracer.write()
+    except IOError as e:
+        logger.error("Error writing trace: %s", e)
+        return None
+
+
+def tracing_from_environment(environ: Mapping[str, str] = os.environ) -> Optional[Path]:
+    """
+    Start tracing for the rest of the run if EISENHOWER_TRACE is set
+    
+    1 uses default_trace_path(), any other value is the trace file. The
+    trace is written when the process exits.
+    
+    Returns:
+        The trace file, or None when tracing is not enabled
+    """
+    value = environ.get('EISENHOWER_TRACE', '').strip()
+    if not value or value == '0':
+        return None
+    path = start_tracing(None if value == '1' else Path(value).expanduser())
+    atexit.register(stop_tracing)
+    return path
@@ -4,20 +4,28 @@ Domain Layer - Core business logic and entities
 This layer contains pure domain logic with no external dependencies.
 """
 
-from eisenhower_matrix.domain.task import Task
+from eisenhower_matrix.domain.task import Task, TaskRef, new_task_uid, parse_task_ref
 from eisenhower_matrix.domain.project import Project
 from eisenhower_matrix.domain.quadrant_info import QuadrantInfo
 from eisenhower_matrix.domain.task_repository import ITaskRepository
+from eisenhower_matrix.domain.archive_repository import IArchiveRepository
 from eisenhower_matrix.domain.project_repository import IProjectRepository
 from eisenhower_matrix.domain.observer import IObserver
 from eisenhower_matrix.domain.notification_service import INotificationService
+from eisenhower_matrix.domain.search_index import ITaskSearchIndex, TaskSearchHit
 
 __all__ = [
     'Task',
+    'TaskRef',
+    'new_task_uid',
+    'parse_task_ref',
     'Project',
     'QuadrantInfo',
     'ITaskRepository',
+    'IArchiveRepository',
     'IProjectRepository',
     'IObserver',
     'INotificationService',
+    'ITaskSearchIndex',
+    'TaskSearchHit',
 ]
@@ -0,0 +1,41 @@
+"""Archive Repository Port Interface"""
+
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+from eisenhower_matrix.domain.task import Task
+
+
+class IArchiveRepository(ABC):
+    """
+    Port: Archived Task Storage
+    
+    Cold storage for archived tasks, kept apart from the active tasks so
+    that loading and saving those never touches the archive. Changes are
+    appended; the archive is only read when archived tasks are browsed.
+    """
+    
+    @abstractmethod
+    def load(self) -> List[Tuple[int, Task]]:
+        """
+        Load all archived tasks
+        
+        Returns:
+            (quadrant, task) entries, least recently archived first
+        """
+        pass
+    
+    @abstractmethod
+    def append(self, stored: List[Tuple[int, Task]], dropped: List[str]) -> None:
+        """
+        Record archive changes
+        
+        Args:
+            stored: (quadrant, task) entries added to or updated in the archive
+            dropped: uids of tasks removed from the archive
+        """
+        pass
+    
+    @abstractmethod
+    def rewrite(self, entries: List[Tuple[int, Task]]) -> None:
+        """Replace the whole archive with entries"""
+        pass
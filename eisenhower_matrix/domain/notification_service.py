@@ -26,3 +26,14 @@ class INotificationService(ABC):
     def notify_task_deleted(self, task: Task, quadrant: int) -> None:
         """Notify when a task is deleted"""
         pass
+    
+    def notify_policy_applied(self, policy: str, count: int, detail: str = "") -> None:
+        """
+        Notify when an automatic policy (e.g. retention) changed tasks
+        
+        Args:
+            policy: Description of the policy
+            count: Number of tasks it changed
+            detail: Optional extra information (e.g. an export file)
+        """
+        pass
@@ -0,0 +1,52 @@
+"""Task Search Index Port Interface"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List
+from eisenhower_matrix.domain.task import TaskRef
+
+
+@dataclass(frozen=True)
+class TaskSearchHit:
+    """
+    Value Object - A task found by a cross-project search
+    
+    Carries just enough to display the hit and open the task; open it
+    by uid, since task_id is only the task's current display ID.
+    """
+    project_id: str
+    quadrant: int
+    task_id: int
+    uid: str
+    description: str
+    completed: bool = False
+    archived: bool = False
+    
+    @property
+    def task_ref(self) -> TaskRef:
+        """Reference to open the task by: its uid (display ID for legacy entries)"""
+        return self.uid or self.task_id
+
+
+class ITaskSearchIndex(ABC):
+    """
+    Port: Cross-project Task Search Index
+    
+    Defines how the application searches tasks of every project without
+    loading each project's service.
+    """
+    
+    @abstractmethod
+    def refresh(self) -> None:
+        """Bring the index up to date with the storage backend"""
+        pass
+    
+    @abstractmethod
+    def search(self, search_text: str) -> List[TaskSearchHit]:
+        """
+        Find tasks matching search text
+        
+        Matches description, notes and tags case-insensitively, like
+        Task.matches_search.
+        """
+        pass
@@ -1,8 +1,22 @@
 """Task Entity - Core Domain Model"""
 
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
+
+# A task reference: its display ordinal (unique within a quadrant) or its uid
+TaskRef = Union[int, str]
+
+
+def new_task_uid() -> str:
+    """Generate a globally unique task identifier"""
+    return uuid.uuid4().hex
+
+
+def parse_task_ref(value: str) -> TaskRef:
+    """Parse a task reference from text: an ordinal if numeric, else a uid"""
+    return int(value) if value.isdigit() else value
 
 
 @dataclass
@@ -12,6 +26,9 @@ class Task:
     
     Represents a single task in the Eisenhower Matrix.
     Contains only business logic, no infrastructure concerns.
+    
+    `id` is the display ordinal, unique within a quadrant and renumbered
+    when it would collide; `uid` is the task's immutable global identity.
     """
     id: int
     description: str
@@ -24,6 +41,7 @@ class Task:
     tags: List[str] = field(default_factory=list)
     metadata: Dict[str, str] = field(default_factory=dict)
     due_date: Optional[str] = None  # ISO format date string
+    uid: str = field(default_factory=new_task_uid)
     
     @classmethod
     def create(cls, task_id: int, description: str, notes: str = "", 
@@ -0,0 +1,136 @@
+"""Three-way Merge of Task Sets - Domain Logic"""
+
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+from eisenhower_matrix.domain.task import Task
+
+# Identity -> (quadrant, task)
+TaskIndex = Dict[str, Tuple[int, Task]]
+
+
+def task_identity(task: Task) -> str:
+    """Stable identity of a task across edits, moves and processes"""
+    return task.uid
+
+
+def index_tasks(tasks: Dict[int, List[Task]]) -> TaskIndex:
+    """Map each task's identity to its quadrant and task"""
+    index: TaskIndex = {}
+    for quadrant, task_list in tasks.items():
+        for task in task_list:
+            key = task_identity(task)
+            # Disambiguate duplicated uids (e.g. hand-edited files)
+            suffix = 1
+            unique_key = key
+            while unique_key in index:
+                suffix += 1
+                unique_key = f"{key}#{suffix}"
+            index[unique_key] = (quadrant, task)
+    return index
+
+
+def _keys_in_order(tasks: Dict[int, List[Task]], quadrant: int, index: TaskIndex) -> List[str]:
+    """Identities of a quadrant's tasks in list order"""
+    by_object = {id(task): key for key, (_, task) in index.items()}
+    return [by_object[id(task)] for task in tasks.get(quadrant, [])]
+
+
+def merge_task_sets(base: Dict[int, List[Task]],
+                    ours: Dict[int, List[Task]],
+                    theirs: Dict[int, List[Task]]) -> Dict[int, List[Task]]:
+    """
+    Three-way merge of two divergent versions of the same task set
+    
+    Each task is merged by identity: a side that left a task as it was in
+    base takes the other side's version (edit, move or deletion). When
+    both sides changed the same task, ours wins, except that an edit is
+    never lost to a deletion. Within a quadrant, the order of the side
+    that reordered it is kept; tasks only present on the other side are
+    placed after their predecessor there.
+    
+    Args:
+        base: Common ancestor (last state both sides agreed on)
+        ours: Local version
+        theirs: Version written by someone else
+    
+    Returns:
+        Merged tasks. Task objects are reused from ours or theirs; tasks
+        whose ID collides within a quadrant are given a fresh ID.
+    """
+    base_index = index_tasks(base)
+    our_index = index_tasks(ours)
+    their_index = index_tasks(theirs)
+    
+    # Identity -> (quadrant, task, side it was taken from)
+    merged: Dict[str, Tuple[int, Task, str]] = {}
+    for key in list(our_index) + [k for k in their_index if k not in our_index]:
+        base_entry = base_index.get(key)
+        our_entry = our_index.get(key)
+        their_entry = their_index.get(key)
+        
+        if base_entry is None:
+            # Added on one or both sides
+            entry, side = (our_entry, 'ours') if our_entry else (their_entry, 'theirs')
+        elif our_entry == base_entry:
+            entry, side = their_entry, 'theirs'
+        elif their_entry == base_entry or their_entry is None:
+            entry, side = our_entry, 'ours'
+        elif our_entry is None:
+            entry, side = their_entry, 'theirs'
+        else:
+            entry, side = our_entry, 'ours'
+        
+        if entry is not None:
+            merged[key] = (entry[0], entry[1], side)
+    
+    result: Dict[int, List[Task]] = {}
+    for quadrant in range(1, 5):
+        base_order = _keys_in_order(base, quadrant, base_index)
+        our_order = _keys_in_order(ours, quadrant, our_index)
+        their_order = _keys_in_order(theirs, quadrant, their_index)
+        
+        # Skeleton: the side that changed this quadrant's order (ours on ties)
+        if our_order == base_order:
+            skeleton, other = their_order, our_order
+        else:
+            skeleton, other = our_order, their_order
+        
+        keys = [k for k in skeleton if k in merged and merged[k][0] == quadrant]
+        placed = set(keys)
+        for position, key in enumerate(other):
+            if key in placed or key not in merged or merged[key][0] != quadrant:
+                continue
+            predecessor = _previous_placed(other, position, placed)
+            keys.insert(keys.index(predecessor) + 1 if predecessor else 0, key)
+            placed.add(key)
+        # Tasks that moved into this quadrant on a side whose order wasn't used
+        for key, (task_quadrant, _, _) in merged.items():
+            if task_quadrant == quadrant and key not in placed:
+                keys.append(key)
+                placed.add(key)
+        
+        result[quadrant] = _with_unique_ids([merged[k] for k in keys])
+    return result
+
+
+def _previous_placed(order: List[str], position: int, placed: set) -> Optional[str]:
+    """Nearest key before position that is already placed"""
+    for key in reversed(order[:position]):
+        if key in placed:
+            return key
+    return None
+
+
+def _with_unique_ids(entries: List[Tuple[int, Task, str]]) -> List[Task]:
+    """Give tasks whose ID collides within a quadrant a fresh ID (theirs keep theirs)"""
+    taken = {task.id for _, task, side in entries if side == 'theirs'}
+    next_id = max([task.id for _, task, _ in entries] or [0]) + 1
+    tasks = []
+    for _, task, side in entries:
+        if side == 'ours':
+            if task.id in taken:
+                task = replace(task, id=next_id)
+                next_id += 1
+            taken.add(task.id)
+        tasks.append(task)
+    return tasks
@@ -1,7 +1,7 @@
 """Task Repository Port Interface"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 from eisenhower_matrix.domain.task import Task
 
 
@@ -25,6 +25,42 @@ class ITaskRepository(ABC):
         """Load all tasks from persistent storage"""
         pass
     
+    def load_quadrants(self) -> Iterator[Tuple[int, List[Task]]]:
+        """
+        Load tasks one quadrant at a time, most useful quadrant first
+        
+        Lets callers display quadrants as soon as each one is ready.
+        Adapters may override this to stream; the default loads everything.
+        """
+        yield from self.load().items()
+    
+    def poll_external_changes(self) -> Optional[Dict[int, List[Task]]]:
+        """
+        Report tasks changed in storage by someone else
+        
+        Returns:
+            All tasks as now stored if storage changed since it was last
+            loaded or saved through this repository, otherwise None.
+            Adapters whose storage is not shared keep this default.
+        """
+        return None
+    
+    def load_journal(self) -> List[dict]:
+        """
+        Load the saved undo history log (see CommandJournal)
+        
+        Adapters that do not persist history keep these defaults.
+        """
+        return []
+    
+    def append_journal(self, records: List[dict]) -> None:
+        """Append records to the undo history log"""
+        pass
+    
+    def rewrite_journal(self, records: List[dict]) -> None:
+        """Replace the undo history log with a compacted one"""
+        pass
+    
     @abstractmethod
     def export_to_file(self, filepath: str, tasks: Dict[int, List[Task]]) -> None:
         """Export tasks to a file"""
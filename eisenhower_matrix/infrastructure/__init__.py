@@ -1,7 +1,21 @@
-"""Infrastructure Package"""
+"""
+Infrastructure Package
 
-from eisenhower_matrix.infrastructure.persistence import JsonTaskRepository
-from eisenhower_matrix.infrastructure.persistence.json_project_repository import JsonProjectRepository
-from eisenhower_matrix.infrastructure.ui import EisenhowerApp, MainWindow
+Exports are resolved lazily so that importing the persistence adapters
+does not pull in GTK through the UI package.
+"""
 
-__all__ = ['JsonTaskRepository', 'JsonProjectRepository', 'EisenhowerApp', 'MainWindow']
+from eisenhower_matrix._lazy import lazy_exports
+
+# Exported name -> module that defines it
+_LAZY_EXPORTS = {
+    'JsonTaskRepository': 'eisenhower_matrix.infrastructure.persistence',
+    'JsonProjectRepository': 'eisenhower_matrix.infrastructure.persistence.json_project_repository',
+    'ProjectSession': 'eisenhower_matrix.infrastructure.project_session',
+    'EisenhowerApp': 'eisenhower_matrix.infrastructure.ui',
+    'MainWindow': 'eisenhower_matrix.infrastructure.ui',
+}
+
+__all__ = ['JsonTaskRepository', 'JsonProjectRepository', 'ProjectSession', 'EisenhowerApp', 'MainWindow']
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
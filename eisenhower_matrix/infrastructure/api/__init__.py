@@ -0,0 +1,10 @@
+"""
+Infrastructure API Package
+
+Optional local HTTP/JSON adapter that lets other tools on the same machine
+read and modify tasks through the running application's service.
+"""
+
+from eisenhower_matrix.infrastructure.api.server import LocalApiServer, server_from_environment
+
+__all__ = ['LocalApiServer', 'server_from_environment']
@@ -0,0 +1,684 @@
+"""
+Infrastructure Layer - Local HTTP/JSON API Adapter
+
+Serves the running application's EisenhowerMatrixService to other local
+tools over HTTP/1.1, on a Unix socket or a loopback TCP port:
+
+    GET  /v1/version                 project, data version, loading state
+    GET  /v1/tasks                   paginated listing
+         ?quadrant=1-4 &completed=true|false &archived=true|false
+         &offset=N &limit=N
+    GET  /v1/tasks/<uid>             single task
+    GET  /v1/tasks/<quadrant>/<id>   single task by ordinal (or uid)
+    GET  /v1/events                  server-sent change events
+    POST /v1/rpc                     JSON-RPC 2.0 call or batch
+
+Reads carry an ETag derived from the service version (and a token drawn
+per attached service, since versions restart with every service
+instance) and honour If-None-Match with 304 Not Modified. Every service access, read or write,
+is dispatched to the thread that owns the service (the GTK main loop in
+the GUI), so API clients and the window never race on tasks or the file.
+
+Example:
+    curl --unix-socket $XDG_RUNTIME_DIR/eisenhower/api.sock \\
+        http://localhost/v1/tasks?quadrant=1
+"""
+
+import asyncio
+import json
+import logging
+import os
+import secrets
+import socket
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from eisenhower_matrix.domain import IObserver, Task, TaskRef, parse_task_ref
+
+logger = logging.getLogger(__name__)
+
+# Service methods reachable through /v1/rpc
+RPC_READ_METHODS = frozenset({
+    'get_tasks', 'search_tasks', 'get_overdue_tasks', 'get_due_soon_tasks',
+    'find_task',
+})
+RPC_WRITE_METHODS = frozenset({
+    'add_task', 'update_task', 'complete_task', 'uncomplete_task',
+    'archive_task', 'unarchive_task', 'remove_task', 'move_task',
+    'reorder_task', 'reorder_task_relative',
+    'complete_tasks', 'archive_tasks', 'remove_tasks', 'move_tasks',
+})
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+EVENT_KEEPALIVE_SECONDS = 15.0
+EVENT_QUEUE_SIZE = 64
+
+_REASONS = {
+    200: 'OK', 204: 'No Content', 304: 'Not Modified', 400: 'Bad Request',
+    403: 'Forbidden', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 415: 'Unsupported Media Type',
+    431: 'Request Header Fields Too Large', 500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+_LOOPBACK_HOSTS = {'localhost', '127.0.0.1', '[::1]'}
+
+
+class HttpError(Exception):
+    """Request failure reported to the client as a JSON error body"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def default_socket_path() -> Path:
+    """Per-user socket location ($XDG_RUNTIME_DIR, else the data dir)"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / "eisenhower" / "api.sock"
+    return Path.home() / ".local" / "share" / "eisenhower" / "api.sock"
+
+
+def _host_name(host_header: str) -> str:
+    """Host header without its port"""
+    if host_header.startswith('['):
+        return host_header.split(']', 1)[0] + ']'
+    return host_header.rsplit(':', 1)[0]
+
+
+def _to_json(value):
+    """Convert service results (tasks, quadrant dicts) to JSON values"""
+    if isinstance(value, Task):
+        return asdict(value)
+    if isinstance(value, dict):
+        return {str(k): _to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    return value
+
+
+def _task_record(quadrant: int, task: Task) -> dict:
+    """Task as a listing record"""
+    record = {'quadrant': quadrant}
+    record.update(asdict(task))
+    return record
+
+
+def _parse_bool(query: Mapping[str, List[str]], name: str, default: bool) -> bool:
+    values = query.get(name)
+    if not values:
+        return default
+    value = values[-1].lower()
+    if value in ('1', 'true', 'yes'):
+        return True
+    if value in ('0', 'false', 'no'):
+        return False
+    raise HttpError(400, f"invalid boolean for {name}: {values[-1]}")
+
+
+def _parse_int(query: Mapping[str, List[str]], name: str, default: Optional[int],
+               low: int, high: int) -> Optional[int]:
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise HttpError(400, f"invalid integer for {name}: {values[-1]}")
+    if not low <= value <= high:
+        raise HttpError(400, f"{name} must be between {low} and {high}")
+    return value
+
+
+class _ChangeObserver(IObserver):
+    """Forwards service change notifications to the server"""
+
+    def __init__(self, server: 'LocalApiServer'):
+        self._server = server
+
+    def on_tasks_changed(self) -> None:
+        self._server._publish_change()
+
+
+class LocalApiServer:
+    """
+    Local HTTP/JSON API over the application's task service
+
+    Single Responsibility: Translate HTTP requests into service calls made
+    on the service's own thread
+
+    The asyncio event loop runs on a background thread (start) or the
+    calling thread (run). Service calls are handed to dispatch, which must
+    run them on the thread owning the service (GLib.idle_add in the GUI);
+    without dispatch they run directly on the event loop thread, which then
+    owns the service.
+    """
+
+    def __init__(self, dispatch: Optional[Callable[[Callable[[], bool]], object]] = None,
+                 socket_path: Optional[str] = None, host: str = '127.0.0.1',
+                 port: Optional[int] = None):
+        """
+        Initialize server
+
+        Args:
+            dispatch: Schedules a callable on the service's thread
+            socket_path: Unix socket to listen on. Defaults to
+                default_socket_path() unless a port is given.
+            host: Loopback address for TCP mode
+            port: TCP port (0 picks a free one)
+        """
+        if socket_path is None and port is None:
+            socket_path = str(default_socket_path())
+        self.socket_path = Path(socket_path) if socket_path else None
+        self.host = host
+        self.port = port
+        self._dispatch = dispatch
+
+        # Owned by the service thread
+        self._service = None
+        self._project_id: Optional[str] = None
+        # Distinguishes the versions of successive attached services
+        self._service_token = ''
+        self._observer = _ChangeObserver(self)
+        self._listing_cache: Optional[Tuple[tuple, List[Tuple[int, Task]]]] = None
+
+        # Owned by the event loop thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._subscribers = set()
+
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def address(self) -> str:
+        """Human-readable listening address"""
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the server is listening"""
+        return self._loop is not None
+
+    def attach(self, service, project_id: Optional[str] = None) -> None:
+        """
+        Serve a (different) project's service
+
+        Call on the thread that owns the service, e.g. after a project
+        switch. Event subscribers are told about the switch.
+
+        Args:
+            service: EisenhowerMatrixService, or None to detach
+            project_id: Reported to clients and part of the ETag
+        """
+        if self._service is not None:
+            self._service.remove_observer(self._observer)
+        self._service = service
+        self._project_id = project_id
+        self._service_token = secrets.token_hex(4)
+        self._listing_cache = None
+        if service is not None:
+            service.add_observer(self._observer)
+            self._publish_change()
+
+    def start(self) -> None:
+        """Serve on a background thread"""
+        if self._thread is not None:
+            return
+        self._ready.clear()
+        self._thread = threading.Thread(target=self.run, name="eisenhower-api", daemon=True)
+        self._thread.start()
+        self._ready.wait(5)
+
+    def run(self, on_started: Optional[Callable[[], None]] = None) -> None:
+        """
+        Serve on the calling thread until stop() is called
+
+        Args:
+            on_started: Called once listening (address then holds the
+                bound port); not called if the server cannot start
+        """
+        asyncio.run(self._serve(on_started))
+
+    def stop(self) -> None:
+        """Stop serving, end event streams and remove the socket"""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._stopping.set)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(5)
+        self._thread = None
+        self.attach(None)
+
+    # Event loop -----------------------------------------------------------
+
+    async def _serve(self, on_started: Optional[Callable[[], None]] = None) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        try:
+            if self.socket_path:
+                self._claim_socket_path()
+                server = await asyncio.start_unix_server(
+                    self._handle_connection, path=str(self.socket_path), limit=MAX_HEADER_BYTES
+                )
+                os.chmod(self.socket_path, 0o600)
+            else:
+                server = await asyncio.start_server(
+                    self._handle_connection, self.host, self.port, limit=MAX_HEADER_BYTES
+                )
+                self.port = server.sockets[0].getsockname()[1]
+        except OSError as e:
+            logger.error("Error starting API server: %s", e)
+            self._loop = None
+            self._ready.set()
+            return
+
+        self._ready.set()
+        if on_started is not None:
+            on_started()
+        try:
+            await self._stopping.wait()
+        finally:
+            # End event streams first; open streams would keep the server busy
+            for queue in list(self._subscribers):
+                self._offer(queue, None)
+            server.close()
+            if self.socket_path:
+                try:
+                    self.socket_path.unlink()
+                except OSError:
+                    pass
+            self._loop = None
+
+    def _claim_socket_path(self) -> None:
+        """Create the socket directory and remove a stale socket"""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()
+        else:
+            raise OSError(f"{self.socket_path} is in use by another server")
+        finally:
+            probe.close()
+
+    async def _call(self, fn: Callable[[], object]):
+        """Run fn on the service thread and await its result"""
+        if self._dispatch is None:
+            return fn()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def settle(setter, value):
+            if not future.done():
+                setter(value)
+
+        def run():
+            try:
+                result = fn()
+            except BaseException as e:
+                loop.call_soon_threadsafe(settle, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(settle, future.set_result, result)
+            return False
+
+        self._dispatch(run)
+        return await future
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Serve one request per connection"""
+        try:
+            try:
+                method, target, headers, body = await self._read_request(reader)
+                await self._route(method, target, headers, body, writer)
+            except HttpError as e:
+                await self._send_json(writer, e.status, {'error': e.message})
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as e:
+                logger.error("Error handling API request: %s", e)
+                await self._send_json(writer, 500, {'error': str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Parse request line, headers and body"""
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.LimitOverrunError:
+            raise HttpError(431, "request headers too large")
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, _version = lines[0].split(' ', 2)
+        except ValueError:
+            raise HttpError(400, "malformed request line")
+
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(':')
+            if not sep:
+                raise HttpError(400, "malformed header")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise HttpError(400, "invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "request body too large")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target, headers, body
+
+    async def _route(self, method: str, target: str, headers: Dict[str, str],
+                     body: bytes, writer: asyncio.StreamWriter) -> None:
+        if not self.socket_path:
+            # Reject DNS-rebinding requests coming through a browser
+            if _host_name(headers.get('host', '')) not in _LOOPBACK_HOSTS:
+                raise HttpError(403, "only loopback Host headers are accepted")
+
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        query = parse_qs(url.query)
+        parts = path.strip('/').split('/')
+
+        if path == '/v1/rpc':
+            if method != 'POST':
+                raise HttpError(405, "use POST")
+            if not headers.get('content-type', '').startswith('application/json'):
+                raise HttpError(415, "Content-Type must be application/json")
+            await self._handle_rpc(body, writer)
+            return
+
+        if method != 'GET':
+            raise HttpError(405, "use GET")
+
+        if path == '/v1/version':
+            await self._send_json(writer, 200, await self._call(self._state))
+        elif path == '/v1/events':
+            await self._stream_events(writer)
+        elif path == '/v1/tasks':
+            await self._handle_listing(query, headers, writer)
+        elif len(parts) == 3 and parts[:2] == ['v1', 'tasks']:
+            await self._handle_task(None, parts[2], headers, writer)
+        elif len(parts) == 4 and parts[:2] == ['v1', 'tasks']:
+            try:
+                quadrant = int(parts[2])
+            except ValueError:
+                raise HttpError(404, "not found")
+            await self._handle_task(quadrant, parse_task_ref(parts[3]), headers, writer)
+        else:
+            raise HttpError(404, "not found")
+
+    # Service-thread helpers -------------------------------------------------
+
+    def _require_service(self):
+        if self._service is None:
+            raise HttpError(503, "no project is open")
+        return self._service
+
+    def _etag(self) -> str:
+        service = self._require_service()
+        return f'"{self._project_id}:{self._service_token}:{service.version}"'
+
+    def _state(self) -> dict:
+        service = self._require_service()
+        return {'project': self._project_id, 'version': service.version, 'loading': service.is_loading()}
+
+    def _filtered_rows(self, quadrant: Optional[int], completed: bool,
+                       archived: bool) -> List[Tuple[int, Task]]:
+        """Filtered (quadrant, task) rows, memoized per data version"""
+        service = self._require_service()
+        key = (self._project_id, service.version, quadrant, completed, archived)
+        if self._listing_cache is not None and self._listing_cache[0] == key:
+            return self._listing_cache[1]
+        quadrants = [quadrant] if quadrant else range(1, 5)
+        all_tasks = service.get_all_tasks(include_archived=archived)
+        rows = [
+            (q, task)
+            for q in quadrants
+            for task in all_tasks[q]
+            if (completed or not task.completed) and (archived or not task.archived)
+        ]
+        self._listing_cache = (key, rows)
+        return rows
+
+    # Endpoints --------------------------------------------------------------
+
+    async def _handle_listing(self, query, headers: Dict[str, str], writer) -> None:
+        quadrant = _parse_int(query, 'quadrant', None, 1, 4)
+        completed = _parse_bool(query, 'completed', True)
+        archived = _parse_bool(query, 'archived', False)
+        offset = _parse_int(query, 'offset', 0, 0, 2 ** 31)
+        limit = _parse_int(query, 'limit', DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+        if_none_match = headers.get('if-none-match')
+
+        def page():
+            etag = self._etag()
+            if if_none_match == etag:
+                return etag, None
+            rows = self._filtered_rows(quadrant, completed, archived)
+            end = offset + limit
+            return etag, {
+                'project': self._project_id,
+                'version': self._service.version,
+                'total': len(rows),
+                'offset': offset,
+                'limit': limit,
+                'next_offset': end if end < len(rows) else None,
+                'tasks': [_task_record(q, task) for q, task in rows[offset:end]],
+            }
+
+        etag, payload = await self._call(page)
+        if payload is None:
+            await self._send(writer, 304, headers={'ETag': etag})
+        else:
+            await self._send_json(writer, 200, payload, headers={'ETag': etag})
+
+    async def _handle_task(self, quadrant: Optional[int], task_ref: TaskRef,
+                           headers: Dict[str, str], writer) -> None:
+        """One task by uid (any quadrant), or by quadrant and ordinal or uid"""
+        if_none_match = headers.get('if-none-match')
+
+        def find():
+            etag = self._etag()
+            if if_none_match == etag:
+                return etag, None
+            if isinstance(task_ref, str):
+                found = self._service.find_task(task_ref)
+                if found is not None and quadrant in (None, found[0]):
+                    return etag, _task_record(*found)
+            elif quadrant in range(1, 5):
+                for task in self._service.get_tasks(quadrant):
+                    if task.id == task_ref:
+                        return etag, _task_record(quadrant, task)
+            where = f" in Q{quadrant}" if quadrant is not None else ""
+            raise HttpError(404, f"task {task_ref} not found{where}")
+
+        etag, payload = await self._call(find)
+        if payload is None:
+            await self._send(writer, 304, headers={'ETag': etag})
+        else:
+            await self._send_json(writer, 200, payload, headers={'ETag': etag})
+
+    async def _handle_rpc(self, body: bytes, writer) -> None:
+        """
+        JSON-RPC 2.0 over POST
+
+        A batch array runs in one service batch: one save and one change
+        event however many mutations it contains.
+        """
+        try:
+            request = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            await self._send_json(writer, 200, self._rpc_error(None, -32700, f"parse error: {e}"))
+            return
+
+        is_batch = isinstance(request, list)
+        calls = request if is_batch else [request]
+        if not calls:
+            await self._send_json(writer, 200, self._rpc_error(None, -32600, "empty batch"))
+            return
+
+        def run_all():
+            service = self._require_service()
+            has_writes = any(isinstance(c, dict) and c.get('method') in RPC_WRITE_METHODS for c in calls)
+            if not has_writes:
+                return [self._run_rpc(service, call) for call in calls]
+            with service.batch():
+                return [self._run_rpc(service, call) for call in calls]
+
+        responses = [r for r in await self._call(run_all) if r is not None]
+        if not responses:
+            await self._send(writer, 204)
+        else:
+            await self._send_json(writer, 200, responses if is_batch else responses[0])
+
+    @staticmethod
+    def _rpc_error(request_id, code: int, message: str) -> dict:
+        return {'jsonrpc': '2.0', 'error': {'code': code, 'message': message}, 'id': request_id}
+
+    def _run_rpc(self, service, call) -> Optional[dict]:
+        """Execute one JSON-RPC call (service thread)"""
+        if not isinstance(call, dict) or call.get('jsonrpc') != '2.0' or not isinstance(call.get('method'), str):
+            return self._rpc_error(None, -32600, "invalid request")
+
+        request_id = call.get('id')
+        is_notification = 'id' not in call
+        method = call['method']
+        if method not in RPC_READ_METHODS and method not in RPC_WRITE_METHODS:
+            return None if is_notification else self._rpc_error(request_id, -32601, f"unknown method: {method}")
+
+        params = call.get('params', {})
+        try:
+            if isinstance(params, dict):
+                result = getattr(service, method)(**params)
+            elif isinstance(params, list):
+                result = getattr(service, method)(*params)
+            else:
+                return None if is_notification else self._rpc_error(request_id, -32602, "params must be an object or array")
+        except (TypeError, ValueError, KeyError) as e:
+            return None if is_notification else self._rpc_error(request_id, -32602, f"invalid params: {e}")
+        except Exception as e:
+            return None if is_notification else self._rpc_error(request_id, -32000, str(e))
+
+        if is_notification:
+            return None
+        return {'jsonrpc': '2.0', 'result': _to_json(result), 'id': request_id}
+
+    async def _stream_events(self, writer) -> None:
+        """
+        Server-sent events: one "tasks-changed" event per service change
+
+        The current state is sent first. A slow client never blocks the
+        service: when its queue is full the oldest event is dropped, which
+        is harmless since every event carries the latest version.
+        """
+        queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            writer.write(
+                b'HTTP/1.1 200 OK\r\n'
+                b'Content-Type: text/event-stream\r\n'
+                b'Cache-Control: no-cache\r\n'
+                b'Connection: close\r\n\r\n'
+            )
+            payload = await self._call(self._state)
+            while payload is not None:
+                writer.write(b'event: tasks-changed\ndata: ' + json.dumps(payload).encode() + b'\n\n')
+                await writer.drain()
+                while True:
+                    try:
+                        payload = await asyncio.wait_for(queue.get(), EVENT_KEEPALIVE_SECONDS)
+                        break
+                    except asyncio.TimeoutError:
+                        writer.write(b': keepalive\n\n')
+                        await writer.drain()
+        finally:
+            self._subscribers.discard(queue)
+
+    def _publish_change(self) -> None:
+        """Queue a change event for subscribers (service thread)"""
+        loop = self._loop
+        service = self._service
+        if loop is None or service is None:
+            return
+        payload = {'project': self._project_id, 'version': service.version, 'loading': service.is_loading()}
+        try:
+            loop.call_soon_threadsafe(self._broadcast, payload)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def _broadcast(self, payload: dict) -> None:
+        for queue in self._subscribers:
+            self._offer(queue, payload)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item) -> None:
+        """Put without blocking, dropping the oldest item when full"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    # Responses --------------------------------------------------------------
+
+    async def _send(self, writer, status: int, body: bytes = b'',
+                    content_type: str = 'application/json',
+                    headers: Optional[Dict[str, str]] = None) -> None:
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}", "Connection: close"]
+        if status not in (204, 304):
+            lines.append(f"Content-Type: {content_type}")
+            lines.append(f"Content-Length: {len(body)}")
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+    async def _send_json(self, writer, status: int, payload,
+                         headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        await self._send(writer, status, body, headers=headers)
+
+
+def server_from_environment(dispatch: Optional[Callable] = None,
+                            environ: Mapping[str, str] = os.environ) -> Optional[LocalApiServer]:
+    """
+    Build a server from EISENHOWER_API, or None when it is not enabled
+
+    Accepted values:
+        unix | 1            Unix socket at default_socket_path()
+        unix:/path/to.sock  Unix socket at the given path
+        tcp:PORT | PORT     Loopback TCP port
+    """
+    value = environ.get('EISENHOWER_API', '').strip()
+    if not value or value == '0':
+        return None
+    if value in ('1', 'unix'):
+        return LocalApiServer(dispatch)
+    if value.startswith('unix:'):
+        return LocalApiServer(dispatch, socket_path=value[len('unix:'):])
+    port = value[len('tcp:'):] if value.startswith('tcp:') else value
+    try:
+        return LocalApiServer(dispatch, port=int(port))
+    except ValueError:
+        logger.warning("Ignoring invalid EISENHOWER_API value: %s", value)
+        return None
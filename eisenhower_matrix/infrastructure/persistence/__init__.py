@@ -1,5 +1,7 @@
 """Infrastructure Persistence Package"""
 
 from eisenhower_matrix.infrastructure.persistence.json_repository import JsonTaskRepository
+from eisenhower_matrix.infrastructure.persistence.json_archive_repository import JsonArchiveRepository
+from eisenhower_matrix.infrastructure.persistence.json_search_index import JsonTaskSearchIndex
 
-__all__ = ['JsonTaskRepository']
+__all__ = ['JsonTaskRepository', 'JsonArchiveRepository', 'JsonTaskSearchIndex']
@@ -0,0 +1,112 @@
+"""
+Infrastructure Layer - JSON Lines Archive Adapter
+
+Adapter that implements the IArchiveRepository port as an append-only
+JSON Lines file next to a project's tasks file.
+"""
+
+import json
+import logging
+from typing import Dict, List, Tuple
+from eisenhower_matrix.domain import IArchiveRepository, Task
+from eisenhower_matrix.infrastructure.persistence.json_repository import JsonTaskRepository
+from eisenhower_matrix.infrastructure.persistence.json_storage import (
+    dict_to_task, locked, task_to_dict, write_atomic
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JsonArchiveRepository(IArchiveRepository):
+    """
+    Concrete implementation of IArchiveRepository using a JSON Lines log
+    
+    Single Responsibility: Handle archive persistence
+    
+    Each line stores a task ({"quadrant": q, "task": {...}}) or removes
+    one ({"drop": uid}); replaying the log gives the archive, later lines
+    winning. Archiving or restoring a task appends a line, so the cost of
+    a change never depends on the archive's size. The log is compacted
+    when it is read and mostly consists of superseded lines.
+    """
+    
+    # Compact once superseded lines outnumber live entries by this factor
+    COMPACT_RATIO = 2
+    
+    def __init__(self, tasks: JsonTaskRepository):
+        """
+        Initialize the archive of a tasks file
+        
+        Args:
+            tasks: Repository of the project's active tasks; the archive
+                shares its lock and task format
+        """
+        self.archive_file = tasks.archive_file
+        self.lock_file = tasks.lock_file
+    
+    def load(self) -> List[Tuple[int, Task]]:
+        """
+        Load archived tasks, skipping unreadable lines
+        
+        Returns:
+            (quadrant, task) entries, least recently archived first
+        """
+        if not self.archive_file.exists():
+            return []
+        entries: Dict[str, Tuple[int, Task]] = {}
+        try:
+            with locked(self.lock_file, exclusive=True):
+                with open(self.archive_file, 'r') as f:
+                    lines = 0
+                    for line in f:
+                        lines += 1
+                        try:
+                            self._replay(json.loads(line), entries)
+                        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                            continue
+                if lines > (self.COMPACT_RATIO + 1) * len(entries) + 100:
+                    write_atomic(self.archive_file, self._serialize(entries.values()))
+        except IOError as e:
+            logger.error("Error loading archive: %s", e)
+        return list(entries.values())
+    
+    def append(self, stored: List[Tuple[int, Task]], dropped: List[str]) -> None:
+        """Append stored and dropped tasks to the archive log"""
+        if not stored and not dropped:
+            return
+        text = self._serialize(stored) + ''.join(json.dumps({'drop': uid}) + '\n' for uid in dropped)
+        try:
+            with locked(self.lock_file, exclusive=True):
+                with open(self.archive_file, 'a') as f:
+                    f.write(text)
+        except IOError as e:
+            logger.error("Error saving archive: %s", e)
+            raise
+    
+    def rewrite(self, entries: List[Tuple[int, Task]]) -> None:
+        """Replace the archive log with entries"""
+        try:
+            with locked(self.lock_file, exclusive=True):
+                write_atomic(self.archive_file, self._serialize(entries))
+        except IOError as e:
+            logger.error("Error saving archive: %s", e)
+            raise
+    
+    def _replay(self, record: dict, entries: Dict[str, Tuple[int, Task]]) -> None:
+        """Apply one log line to entries"""
+        if 'drop' in record:
+            entries.pop(record['drop'], None)
+            return
+        quadrant = int(record['quadrant'])
+        if quadrant not in range(1, 5):
+            raise ValueError(f"Invalid quadrant: {quadrant}")
+        task = dict_to_task(record['task'])
+        # An update keeps the task's place; a re-archived task goes last
+        entries[task.uid] = (quadrant, task)
+    
+    def _serialize(self, entries) -> str:
+        """Log lines storing entries"""
+        return ''.join(
+            json.dumps({'quadrant': quadrant, 'task': task_to_dict(task)}) + '\n'
+            for quadrant, task in entries
+        )
@@ -5,10 +5,14 @@ Adapter that implements the IProjectRepository port using JSON file storage.
 """
 
 import json
+import logging
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from eisenhower_matrix.domain import IProjectRepository, Project
 
+logger = logging.getLogger(__name__)
+
 
 class JsonProjectRepository(IProjectRepository):
     """
@@ -16,6 +20,10 @@ class JsonProjectRepository(IProjectRepository):
     
     Single Responsibility: Handle JSON persistence for projects
     Dependency Inversion: Implements domain port
+    
+    Keeps an in-memory index of projects.json that is reloaded only when
+    the file's identity (inode, size, mtime) changes; writes go through
+    to disk and update the index.
     """
     
     def __init__(self, data_file: str = None):
@@ -32,6 +40,11 @@ class JsonProjectRepository(IProjectRepository):
         else:
             self.data_file = Path(data_file)
         
+        # In-memory index and the file identity it was read from
+        self._index: dict = {}
+        self._index_stamp: Optional[Tuple[int, int, int, int]] = None
+        self._sorted_cache: Optional[List[Project]] = None
+        
         # Ensure file exists with default project
         if not self.data_file.exists():
             self._initialize_default_project()
@@ -48,7 +61,7 @@ class JsonProjectRepository(IProjectRepository):
         Args:
             project: Project to save
         """
-        projects = self._load_all_dict()
+        projects = dict(self._load_all_dict())
         projects[project.id] = self._project_to_dict(project)
         self._save_all_dict(projects)
     
@@ -75,10 +88,13 @@ class JsonProjectRepository(IProjectRepository):
             List of all projects, sorted by last accessed (most recent first)
         """
         projects = self._load_all_dict()
-        project_list = [self._dict_to_project(data) for data in projects.values()]
-        # Sort by last_accessed, most recent first
-        project_list.sort(key=lambda p: p.last_accessed or p.created, reverse=True)
-        return project_list
+        if self._sorted_cache is None:
+            project_list = [self._dict_to_project(data) for data in projects.values()]
+            # Sort by last_accessed, most recent first
+            project_list.sort(key=lambda p: p.last_accessed or p.created, reverse=True)
+            self._sorted_cache = project_list
+        # Hand out copies so callers cannot mutate the index
+        return [self._copy_project(p) for p in self._sorted_cache]
     
     def delete(self, project_id: str) -> bool:
         """
@@ -90,7 +106,7 @@ class JsonProjectRepository(IProjectRepository):
         Returns:
             True if project was deleted, False if not found
         """
-        projects = self._load_all_dict()
+        projects = dict(self._load_all_dict())
         if project_id in projects:
             del projects[project_id]
             self._save_all_dict(projects)
@@ -114,25 +130,67 @@ class JsonProjectRepository(IProjectRepository):
         return project_id in projects
     
     def _load_all_dict(self) -> dict:
-        """Load all projects as dictionary"""
-        if self.data_file.exists():
+        """
+        Load all projects as dictionary
+        
+        Served from the in-memory index; the file is re-read only when it
+        changed on disk since the index was last filled. Callers must not
+        mutate the returned dictionary.
+        """
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._index_stamp:
+            return self._index
+        
+        projects = {}
+        if stamp is not None:
             try:
                 with open(self.data_file, 'r') as f:
-                    return json.load(f)
+                    projects = json.load(f)
             except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading projects: {e}")
-                return {}
-        return {}
+                logger.error("Error loading projects: %s", e)
+                projects = {}
+        
+        self._set_index(projects, stamp)
+        return projects
     
     def _save_all_dict(self, projects: dict) -> None:
-        """Save all projects dictionary to file"""
+        """Save all projects dictionary to file (write-through to the index)"""
         try:
             self.data_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.data_file, 'w') as f:
                 json.dump(projects, f, indent=2)
         except IOError as e:
-            print(f"Error saving projects: {e}")
+            logger.error("Error saving projects: %s", e)
+            # The file may be partially written; re-read it next time
+            self._index_stamp = None
             raise
+        
+        self._set_index(projects, self._file_stamp())
+    
+    def _set_index(self, projects: dict, stamp: Optional[Tuple[int, int, int, int]]) -> None:
+        """Replace the in-memory index"""
+        self._index = projects
+        self._index_stamp = stamp
+        self._sorted_cache = None
+    
+    def _file_stamp(self) -> Optional[Tuple[int, int, int, int]]:
+        """Identity of the projects file on disk, or None if it is missing"""
+        try:
+            st = os.stat(self.data_file)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    @staticmethod
+    def _copy_project(project: Project) -> Project:
+        """Return an independent copy of a Project"""
+        return Project(
+            id=project.id,
+            name=project.name,
+            description=project.description,
+            created=project.created,
+            last_accessed=project.last_accessed
+        )
     
     def _project_to_dict(self, project: Project) -> dict:
         """Convert Project entity to dictionary"""
@@ -155,11 +213,13 @@ class JsonProjectRepository(IProjectRepository):
         )
     
     def _delete_project_tasks(self, project_id: str) -> None:
-        """Delete the tasks file for a project"""
+        """Delete the tasks file for a project, with its history, archive and lock files"""
         data_dir = Path.home() / ".local" / "share" / "eisenhower"
-        tasks_file = data_dir / f"tasks_{project_id}.json"
-        if tasks_file.exists():
-            try:
-                tasks_file.unlink()
-            except IOError as e:
-                print(f"Error deleting project tasks: {e}")
+        stem = f"tasks_{project_id}"
+        for name in (f"{stem}.json", f"{stem}.journal.json", f"{stem}.archive.json", f"{stem}.json.lock"):
+            tasks_file = data_dir / name
+            if tasks_file.exists():
+                try:
+                    tasks_file.unlink()
+                except IOError as e:
+                    logger.error("Error deleting project tasks: %s", e)
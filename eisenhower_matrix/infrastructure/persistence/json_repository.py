@@ -6,9 +6,18 @@ This is a concrete implementation that the domain doesn't know about.
 """
 
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 from eisenhower_matrix.domain import ITaskRepository, Task
+from eisenhower_matrix.domain.task_merge import merge_task_sets
+from eisenhower_matrix.diagnostics.tracing import span
+from eisenhower_matrix.infrastructure.persistence.json_storage import (
+    dict_to_task, locked, task_to_dict, write_atomic
+)
+
+logger = logging.getLogger(__name__)
 
 
 class JsonTaskRepository(ITaskRepository):
@@ -17,6 +26,11 @@ class JsonTaskRepository(ITaskRepository):
     
     Single Responsibility: Handle JSON persistence
     Dependency Inversion: Implements domain port, depends on abstraction
+    
+    Safe for several processes sharing a file: reads and writes hold an
+    advisory lock on a sidecar .lock file, files are replaced atomically,
+    and a save that finds the file changed since this repository last
+    read or wrote it merges both versions instead of overwriting.
     """
     
     def __init__(self, data_file: str = None, project_id: str = "default"):
@@ -28,12 +42,27 @@ class JsonTaskRepository(ITaskRepository):
             project_id: Project identifier for multi-project support
         """
         if data_file is None:
-            data_dir = Path.home() / ".local" / "share" / "eisenhower"
-            data_dir.mkdir(parents=True, exist_ok=True)
-            # Use project-specific file name
-            self.data_file = data_dir / f"tasks_{project_id}.json"
+            self.data_file = self.path_for_project(project_id)
+            self.data_file.parent.mkdir(parents=True, exist_ok=True)
         else:
             self.data_file = Path(data_file)
+        self.lock_file = self.data_file.with_name(self.data_file.name + ".lock")
+        # Undo history log, one JSON record per line
+        self.journal_file = self.data_file.with_name(f"{self.data_file.stem}.journal.json")
+        # Archived tasks (see JsonArchiveRepository), one JSON record per line
+        self.archive_file = self.data_file.with_name(f"{self.data_file.stem}.archive.json")
+        
+        # File contents and stamp as last read or written by this repository:
+        # the common ancestor for merging, and how external writes are noticed
+        self._base_text: Optional[str] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        # Result of a merge during save, handed out by poll_external_changes
+        self._merged: Optional[Dict[int, List[Task]]] = None
+    
+    @staticmethod
+    def path_for_project(project_id: str) -> Path:
+        """Default tasks file of a project"""
+        return Path.home() / ".local" / "share" / "eisenhower" / f"tasks_{project_id}.json"
     
     def load(self) -> Dict[int, List[Task]]:
         """
@@ -42,36 +71,175 @@ class JsonTaskRepository(ITaskRepository):
         Returns:
             Dictionary mapping quadrant numbers to task lists
         """
-        if self.data_file.exists():
+        data = self._read_data()
+        if data is not None:
             try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    return self._deserialize_tasks(data)
-            except (json.JSONDecodeError, IOError, KeyError, TypeError) as e:
-                print(f"Error loading tasks: {e}")
+                return self._deserialize_tasks(data)
+            except (KeyError, TypeError) as e:
+                logger.error("Error loading tasks: %s", e)
         
         # Return empty structure
         return {1: [], 2: [], 3: [], 4: []}
     
+    def load_quadrants(self) -> Iterator[Tuple[int, List[Task]]]:
+        """
+        Load tasks one quadrant at a time, largest quadrant first
+        
+        The file is parsed once; Task entities are then built per quadrant
+        so callers can display each quadrant as soon as it is ready.
+        
+        Yields:
+            (quadrant, tasks) pairs covering all four quadrants
+        """
+        data = self._read_data() or {}
+        order = sorted(
+            range(1, 5),
+            key=lambda q: len(data.get(str(q)) or []),
+            reverse=True
+        )
+        for quadrant in order:
+            try:
+                tasks = [
+                    dict_to_task(task_data)
+                    for task_data in data.get(str(quadrant)) or []
+                ]
+            except (KeyError, TypeError, AttributeError) as e:
+                logger.error("Error loading tasks: %s", e)
+                tasks = []
+            yield quadrant, tasks
+    
+    def _read_data(self) -> Optional[dict]:
+        """Read and parse the JSON file, or None if missing or unreadable"""
+        if not self.data_file.exists():
+            return None
+        try:
+            with span('json.read') as s:
+                with locked(self.lock_file, exclusive=False):
+                    stamp = self._file_stamp()
+                    with open(self.data_file, 'r') as f:
+                        text = f.read()
+                data = json.loads(text)
+                if s:
+                    s.set(bytes=len(text))
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error("Error loading tasks: %s", e)
+            return None
+        self._base_text, self._stamp = text, stamp
+        return data
+    
     def save(self, tasks: Dict[int, List[Task]]) -> None:
         """
         Save tasks to JSON file
         
+        Compare-and-swap: if another process changed the file since it was
+        last read or written here, both versions are merged three-way and
+        the merge is saved; poll_external_changes() then returns it.
+        
         Args:
             tasks: Dictionary mapping quadrant numbers to task lists
         """
         try:
-            data = self._serialize_tasks(tasks)
-            
             # Ensure directory exists
             self.data_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with locked(self.lock_file, exclusive=True):
+                stamp = self._file_stamp()
+                if stamp is not None and stamp != self._stamp:
+                    theirs = self._read_unlocked()
+                    if theirs is not None:
+                        tasks = merge_task_sets(self._base_tasks(), tasks, theirs)
+                        self._merged = tasks
+                
+                with span('json.write') as s:
+                    text = json.dumps(self._serialize_tasks(tasks), indent=2)
+                    write_atomic(self.data_file, text)
+                    if s:
+                        s.set(bytes=len(text))
+                self._base_text, self._stamp = text, self._file_stamp()
         except IOError as e:
-            print(f"Error saving tasks: {e}")
+            logger.error("Error saving tasks: %s", e)
             raise
     
+    def poll_external_changes(self) -> Optional[Dict[int, List[Task]]]:
+        """
+        Tasks as now stored, if the file changed since last read or written
+        
+        Returns:
+            The merged or externally written tasks, or None if unchanged
+        """
+        if self._merged is not None:
+            merged, self._merged = self._merged, None
+            return merged
+        
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return None
+        
+        data = self._read_data()
+        if data is None:
+            return None
+        try:
+            return self._deserialize_tasks(data)
+        except (KeyError, TypeError) as e:
+            logger.error("Error loading tasks: %s", e)
+            return None
+    
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """(inode, size, mtime) of the data file, or None if missing"""
+        try:
+            st = os.stat(self.data_file)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    def _read_unlocked(self) -> Optional[Dict[int, List[Task]]]:
+        """Parse the current file (caller holds the lock), or None"""
+        try:
+            with open(self.data_file, 'r') as f:
+                return self._deserialize_tasks(json.load(f))
+        except (json.JSONDecodeError, IOError, KeyError, TypeError) as e:
+            logger.error("Error loading tasks: %s", e)
+            return None
+    
+    def _base_tasks(self) -> Dict[int, List[Task]]:
+        """Tasks as last read or written here (empty if never)"""
+        if self._base_text is None:
+            return {1: [], 2: [], 3: [], 4: []}
+        return self._deserialize_tasks(json.loads(self._base_text))
+    
+    def load_journal(self) -> List[dict]:
+        """Load the undo history log, skipping unreadable lines"""
+        if not self.journal_file.exists():
+            return []
+        records = []
+        try:
+            with open(self.journal_file, 'r') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except IOError as e:
+            logger.error("Error loading history: %s", e)
+        return records
+    
+    def append_journal(self, records: List[dict]) -> None:
+        """Append records to the undo history log"""
+        try:
+            with locked(self.lock_file, exclusive=True):
+                with open(self.journal_file, 'a') as f:
+                    f.write(''.join(json.dumps(record) + '\n' for record in records))
+        except IOError as e:
+            logger.error("Error saving history: %s", e)
+    
+    def rewrite_journal(self, records: List[dict]) -> None:
+        """Replace the undo history log with a compacted one"""
+        try:
+            with locked(self.lock_file, exclusive=True):
+                write_atomic(self.journal_file, ''.join(json.dumps(record) + '\n' for record in records))
+        except IOError as e:
+            logger.error("Error saving history: %s", e)
+    
     def export_to_file(self, filepath: str, tasks: Dict[int, List[Task]]) -> None:
         """
         Export tasks to a specific file
@@ -89,7 +257,7 @@ class JsonTaskRepository(ITaskRepository):
             with open(export_path, 'w') as f:
                 json.dump(data, f, indent=2)
         except IOError as e:
-            print(f"Error exporting tasks: {e}")
+            logger.error("Error exporting tasks: %s", e)
             raise
     
     def import_from_file(self, filepath: str) -> Dict[int, List[Task]]:
@@ -107,7 +275,7 @@ class JsonTaskRepository(ITaskRepository):
                 data = json.load(f)
                 return self._deserialize_tasks(data)
         except (json.JSONDecodeError, IOError, KeyError) as e:
-            print(f"Error importing tasks: {e}")
+            logger.error("Error importing tasks: %s", e)
             raise
     
     def _serialize_tasks(self, tasks: Dict[int, List[Task]]) -> dict:
@@ -117,7 +285,7 @@ class JsonTaskRepository(ITaskRepository):
         Single Responsibility: Serialization logic
         """
         return {
-            str(quadrant): [self._task_to_dict(task) for task in task_list]
+            str(quadrant): [task_to_dict(task) for task in task_list]
             for quadrant, task_list in tasks.items()
         }
     
@@ -132,53 +300,9 @@ class JsonTaskRepository(ITaskRepository):
             quadrant_key = str(quadrant)
             if quadrant_key in data:
                 tasks[quadrant] = [
-                    self._dict_to_task(task_data)
+                    dict_to_task(task_data)
                     for task_data in data[quadrant_key]
                 ]
             else:
                 tasks[quadrant] = []
         return tasks
-    
-    def _task_to_dict(self, task: Task) -> dict:
-        """Convert Task entity to dictionary"""
-        return {
-            'id': task.id,
-            'description': task.description,
-            'created': task.created,
-            'completed': task.completed,
-            'completed_at': task.completed_at,
-            'notes': task.notes,
-            'tags': task.tags,
-            'metadata': task.metadata,
-            'due_date': task.due_date
-        }
-    
-    def _dict_to_task(self, data: dict) -> Task:
-        """
-        Convert dictionary to Task entity with backward compatibility
-        
-        Single Responsibility: Task reconstruction
-        """
-        # Handle backward compatibility
-        if 'notes' not in data:
-            data['notes'] = ""
-        if 'tags' not in data:
-            data['tags'] = []
-        if 'metadata' not in data:
-            data['metadata'] = {}
-        if 'due_date' not in data:
-            data['due_date'] = None
-        
-        return Task(
-            id=data.get('id', 0),
-            description=data.get('description', ''),
-            created=data.get('created', ''),
-            completed=data.get('completed', False),
-            completed_at=data.get('completed_at'),
-            archived=data.get('archived', False),
-            archived_at=data.get('archived_at'),
-            notes=data.get('notes', ''),
-            tags=data.get('tags', []),
-            metadata=data.get('metadata', {}),
-            due_date=data.get('due_date')
-        )
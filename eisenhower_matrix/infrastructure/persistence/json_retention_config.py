@@ -0,0 +1,72 @@
+"""
+Infrastructure Layer - Retention Policy Configuration
+
+Reads retention policies from retention.json in the data directory:
+
+    {
+      "interval_minutes": 60,
+      "policies": [
+        {"action": "archive-completed", "older_than_days": 14},
+        {"action": "purge-archived", "older_than_days": 365,
+         "export_dir": "~/Documents/eisenhower-purged"}
+      ]
+    }
+
+Without the file no policy applies.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+from eisenhower_matrix.application.retention import RetentionPolicy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionConfig:
+    """Configured policies and how often they run"""
+    policies: List[RetentionPolicy] = field(default_factory=list)
+    interval_minutes: int = 60
+
+
+def retention_config_path() -> Path:
+    """Default location of retention.json"""
+    return Path.home() / ".local" / "share" / "eisenhower" / "retention.json"
+
+
+def load_retention_config(path: Optional[Path] = None) -> RetentionConfig:
+    """
+    Load the retention configuration
+    
+    Invalid policies are skipped with a message; a missing or unreadable
+    file yields no policies.
+    
+    Args:
+        path: Configuration file (defaults to retention_config_path())
+    """
+    path = path or retention_config_path()
+    if not path.exists():
+        return RetentionConfig()
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.error("Error loading retention policies: %s", e)
+        return RetentionConfig()
+    if not isinstance(data, dict):
+        logger.error("Error loading retention policies: expected a JSON object")
+        return RetentionConfig()
+    
+    config = RetentionConfig()
+    for record in data.get('policies') or []:
+        try:
+            config.policies.append(RetentionPolicy.from_dict(record))
+        except (ValueError, AttributeError) as e:
+            logger.warning("Ignoring invalid retention policy: %s", e)
+    interval = data.get('interval_minutes')
+    if isinstance(interval, int) and not isinstance(interval, bool) and interval > 0:
+        config.interval_minutes = interval
+    return config
@@ -0,0 +1,207 @@
+"""
+Infrastructure Layer - JSON Task Search Index Adapter
+
+Adapter that implements the ITaskSearchIndex port over the per-project
+tasks_<project_id>.json files and their tasks_<project_id>.archive.json
+archives.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from eisenhower_matrix.domain import ITaskSearchIndex, TaskSearchHit
+
+logger = logging.getLogger(__name__)
+
+
+class JsonTaskSearchIndex(ITaskSearchIndex):
+    """
+    Concrete implementation of ITaskSearchIndex over JSON task files
+    
+    Single Responsibility: Keep a searchable digest of every project's tasks
+    
+    Each task file and archive is digested into pre-lowercased search
+    entries; archive entries are always archived. The digest is persisted
+    next to the data so later sessions only re-read files whose size or
+    mtime changed.
+    """
+    
+    # Bump when the persisted entry layout changes
+    FORMAT_VERSION = 3
+    
+    ARCHIVE_SUFFIX = ".archive.json"
+    
+    def __init__(self, data_dir: str = None, index_file: str = None):
+        """
+        Initialize search index
+        
+        Args:
+            data_dir: Directory holding tasks_<project_id>.json files.
+                Defaults to standard location.
+            index_file: Where to persist the index. Defaults to
+                search_index.json in data_dir.
+        """
+        if data_dir is None:
+            self.data_dir = Path.home() / ".local" / "share" / "eisenhower"
+        else:
+            self.data_dir = Path(data_dir)
+        self.index_file = Path(index_file) if index_file else self.data_dir / "search_index.json"
+        
+        # file name -> {'project': project_id, 'stamp': [size, mtime_ns], 'entries': [...]}
+        # entry: [quadrant, task_id, uid, description, completed, archived, haystack]
+        self._files: Dict[str, dict] = self._load_index()
+    
+    def refresh(self) -> None:
+        """Re-read task files whose size or mtime changed, drop deleted ones"""
+        changed = False
+        seen = set()
+        
+        for project_id, path, archive in self._task_files():
+            seen.add(path.name)
+            stamp = self._file_stamp(path)
+            cached = self._files.get(path.name)
+            if stamp is None or (cached and cached['stamp'] == stamp):
+                continue
+            entries = self._digest_archive(path) if archive else self._digest(path)
+            self._files[path.name] = {'project': project_id, 'stamp': stamp, 'entries': entries}
+            changed = True
+        
+        for name in [name for name in self._files if name not in seen]:
+            del self._files[name]
+            changed = True
+        
+        if changed:
+            self._save_index()
+    
+    def search(self, search_text: str) -> List[TaskSearchHit]:
+        """
+        Find tasks matching search text (case-insensitive substring)
+        
+        Returns:
+            Hits in project, quadrant and task order (archived tasks of a
+            quadrant after its active ones)
+        """
+        needle = search_text.lower()
+        hits = []
+        # Per project: the tasks file, then its archive
+        names = sorted(self._files, key=lambda name: (self._files[name]['project'], name.endswith(self.ARCHIVE_SUFFIX)))
+        for name in names:
+            project_id = self._files[name]['project']
+            for quadrant, task_id, uid, description, completed, archived, haystack in self._files[name]['entries']:
+                if needle in haystack:
+                    hits.append(TaskSearchHit(
+                        project_id=project_id,
+                        quadrant=quadrant,
+                        task_id=task_id,
+                        uid=uid,
+                        description=description,
+                        completed=completed,
+                        archived=archived
+                    ))
+        hits.sort(key=lambda hit: (hit.project_id, hit.quadrant))
+        return hits
+    
+    def _task_files(self) -> List[Tuple[str, Path, bool]]:
+        """List (project_id, path, is archive) of every project task file and archive"""
+        files = []
+        for path in self.data_dir.glob("tasks_*.json"):
+            archive = path.name.endswith(self.ARCHIVE_SUFFIX)
+            suffix = self.ARCHIVE_SUFFIX if archive else ".json"
+            project_id = path.name[len("tasks_"):-len(suffix)]
+            # Skip other sidecar files such as tasks_<id>.journal.json
+            if project_id and '.' not in project_id:
+                files.append((project_id, path, archive))
+        return files
+    
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[List[int]]:
+        """Size and mtime of a file, or None if it vanished"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+    
+    @staticmethod
+    def _digest(path: Path) -> list:
+        """Turn a task file into search entries"""
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error("Error indexing tasks: %s", e)
+            return []
+        
+        return [
+            JsonTaskSearchIndex._entry(quadrant, task)
+            for quadrant in range(1, 5)
+            for task in data.get(str(quadrant)) or []
+        ]
+    
+    @staticmethod
+    def _digest_archive(path: Path) -> list:
+        """Turn an archive log into search entries (later lines winning, as in JsonArchiveRepository)"""
+        tasks: Dict[str, Tuple[int, dict]] = {}
+        try:
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if 'drop' in record:
+                            tasks.pop(record['drop'], None)
+                        else:
+                            task = record['task']
+                            tasks[task.get('uid') or task.get('id')] = (int(record['quadrant']), task)
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
+                        continue
+        except IOError as e:
+            logger.error("Error indexing archive: %s", e)
+            return []
+        return [
+            JsonTaskSearchIndex._entry(quadrant, task, archived=True)
+            for quadrant, task in tasks.values() if quadrant in range(1, 5)
+        ]
+    
+    @staticmethod
+    def _entry(quadrant: int, task: dict, archived: bool = False) -> list:
+        """Search entry of a stored task"""
+        description = task.get('description', '')
+        haystack = "\n".join(
+            [description, task.get('notes') or ''] + list(task.get('tags') or [])
+        ).lower()
+        return [
+            quadrant,
+            task.get('id', 0),
+            task.get('uid', ''),
+            description,
+            bool(task.get('completed', False)),
+            archived or bool(task.get('archived', False)),
+            haystack
+        ]
+    
+    def _load_index(self) -> Dict[str, dict]:
+        """Load the persisted index, or start empty"""
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error("Error loading search index: %s", e)
+            return {}
+        if data.get('version') != self.FORMAT_VERSION:
+            return {}
+        return data.get('files', {})
+    
+    def _save_index(self) -> None:
+        """Persist the index; failures only cost a rebuild next session"""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({'version': self.FORMAT_VERSION, 'files': self._files}, f)
+            os.replace(tmp_file, self.index_file)
+        except IOError as e:
+            logger.error("Error saving search index: %s", e)
@@ -0,0 +1,118 @@
+"""
+Infrastructure Layer - JSON Storage Helpers
+
+File locking, atomic replacement and the stored task format shared by
+the JSON adapters of one project (tasks file, archive log, history log).
+"""
+
+import os
+import tempfile
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from eisenhower_matrix.domain import Task
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; locking is skipped there
+    fcntl = None
+
+
+@contextmanager
+def locked(lock_file: Path, exclusive: bool) -> Iterator[None]:
+    """Hold an advisory lock on a sidecar lock file"""
+    if fcntl is None:
+        yield
+        return
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, 'a') as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace a file so readers never see a partial write"""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def task_to_dict(task: Task) -> dict:
+    """Convert Task entity to its stored dictionary"""
+    return {
+        'id': task.id,
+        'description': task.description,
+        'created': task.created,
+        'completed': task.completed,
+        'completed_at': task.completed_at,
+        'archived': task.archived,
+        'archived_at': task.archived_at,
+        'notes': task.notes,
+        'tags': task.tags,
+        'metadata': task.metadata,
+        'due_date': task.due_date,
+        'uid': task.uid
+    }
+
+
+def dict_to_task(data: dict) -> Task:
+    """
+    Convert a stored dictionary to Task entity with backward compatibility
+    
+    Single Responsibility: Task reconstruction
+    """
+    # Handle backward compatibility
+    if 'notes' not in data:
+        data['notes'] = ""
+    if 'tags' not in data:
+        data['tags'] = []
+    if 'metadata' not in data:
+        data['metadata'] = {}
+    if 'due_date' not in data:
+        data['due_date'] = None
+    
+    return Task(
+        id=data.get('id', 0),
+        description=data.get('description', ''),
+        created=data.get('created', ''),
+        completed=data.get('completed', False),
+        completed_at=data.get('completed_at'),
+        archived=data.get('archived', False),
+        archived_at=data.get('archived_at'),
+        notes=data.get('notes', ''),
+        tags=data.get('tags', []),
+        metadata=data.get('metadata', {}),
+        due_date=data.get('due_date'),
+        uid=data.get('uid') or legacy_uid(data)
+    )
+
+
+def legacy_uid(data: dict) -> str:
+    """
+    Derive a uid for a task saved before uids existed
+    
+    Derived rather than random so that every process reading the same
+    legacy file agrees on each task's identity until it is rewritten.
+    """
+    seed = f"{data.get('created', '')}|{data.get('description', '')}|{data.get('id', 0)}"
+    return uuid.uuid5(uuid.NAMESPACE_OID, seed).hex
@@ -0,0 +1,102 @@
+"""
+Infrastructure Layer - Open Project Session
+
+Creates project services and switches the open project between them,
+without GTK, so the GUI and headless drivers (benchmarks.memory) run the
+same switch.
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, List, Mapping, Optional
+from eisenhower_matrix.application import (
+    EisenhowerMatrixService, ProjectServiceCache, TaskExportUseCase, TaskImportUseCase
+)
+from eisenhower_matrix.infrastructure.persistence import JsonArchiveRepository, JsonTaskRepository
+from eisenhower_matrix.diagnostics import recorder_from_environment
+
+# Called with the new service and project ID after every switch
+SessionFollower = Callable[[EisenhowerMatrixService, str], None]
+
+
+def create_project_service(project_id: str, data_dir: Optional[Path] = None,
+                           environ: Mapping[str, str] = os.environ) -> EisenhowerMatrixService:
+    """
+    Service factory for a ProjectServiceCache
+    
+    The service is not loaded yet (autoload=False); switching to it
+    starts loading in the background.
+    
+    Args:
+        project_id: Project whose tasks the service manages
+        data_dir: Directory holding tasks_<project_id>.json. Defaults to
+            the standard location.
+        environ: Consulted for EISENHOWER_RECORD
+    """
+    if data_dir is None:
+        repository = JsonTaskRepository(project_id=project_id)
+    else:
+        repository = JsonTaskRepository(data_file=str(Path(data_dir) / f"tasks_{project_id}.json"))
+    service = EisenhowerMatrixService(
+        repository, autoload=False, archive=JsonArchiveRepository(repository), project_id=project_id
+    )
+    # Optional session trace for benchmarks.replay (EISENHOWER_RECORD)
+    recorder_from_environment(service, project_id, environ)
+    return service
+
+
+class ProjectSession:
+    """
+    The open project's service and the use cases built on it
+    
+    Single Responsibility: Switch the open project
+    
+    Services come warm from a ProjectServiceCache. Whatever follows the
+    open project (window, local API, retention, file watcher) registers a
+    follower and is rebound on every switch, in registration order.
+    """
+    
+    def __init__(self, cache: ProjectServiceCache, project_id: str,
+                 dispatch: Callable[[Callable[[], None]], object]):
+        """
+        Open a project
+        
+        Args:
+            cache: Source of project services
+            project_id: Project opened first
+            dispatch: Schedules a callable on the thread that owns the
+                services (e.g. GLib.idle_add); used for background loads
+        """
+        self.cache = cache
+        self._dispatch = dispatch
+        self._followers: List[SessionFollower] = []
+        self._bind(project_id)
+    
+    def follow(self, follower: SessionFollower) -> None:
+        """Call follower after every switch"""
+        self._followers.append(follower)
+    
+    def switch(self, project_id: str) -> EisenhowerMatrixService:
+        """
+        Make a project the open one
+        
+        Returns:
+            The project's service
+        """
+        self._bind(project_id)
+        for follower in self._followers:
+            follower(self.service, project_id)
+        self.load()
+        # A warm service may have missed changes made while in the cache
+        self.service.reload_external_changes()
+        return self.service
+    
+    def load(self) -> None:
+        """Start loading the open project's tasks, unless loaded"""
+        self.service.load_in_background(self._dispatch)
+    
+    def _bind(self, project_id: str) -> None:
+        self.project_id = project_id
+        self.service = self.cache.get(project_id)
+        self.export_use_case = TaskExportUseCase(self.service)
+        self.import_use_case = TaskImportUseCase(self.service)
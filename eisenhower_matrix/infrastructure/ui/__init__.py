@@ -2,14 +2,27 @@
 UI Infrastructure Layer - GTK Adapters
 
 This module contains UI adapters that connect the domain to GTK presentation.
+
+Exports are resolved lazily: widgets and dialogs are imported on first
+access rather than when the package is imported.
 """
 
-from eisenhower_matrix.infrastructure.ui.application import EisenhowerApp, main
-from eisenhower_matrix.infrastructure.ui.main_window import MainWindow
-from eisenhower_matrix.infrastructure.ui.quadrant_panel import QuadrantPanel
-from eisenhower_matrix.infrastructure.ui.task_dialog import TaskDialog
-from eisenhower_matrix.infrastructure.ui.task_row import TaskRow
-from eisenhower_matrix.infrastructure.ui.observer_adapter import GtkObserverAdapter
+from eisenhower_matrix._lazy import lazy_exports
+
+# Exported name -> module that defines it
+_LAZY_EXPORTS = {
+    'EisenhowerApp': 'eisenhower_matrix.infrastructure.ui.application',
+    'main': 'eisenhower_matrix.infrastructure.ui.application',
+    'MainWindow': 'eisenhower_matrix.infrastructure.ui.main_window',
+    'QuadrantPanel': 'eisenhower_matrix.infrastructure.ui.quadrant_panel',
+    'TaskDialog': 'eisenhower_matrix.infrastructure.ui.task_dialog',
+    'TaskRow': 'eisenhower_matrix.infrastructure.ui.task_row',
+    'GtkObserverAdapter': 'eisenhower_matrix.infrastructure.ui.observer_adapter',
+    'StoreWatcher': 'eisenhower_matrix.infrastructure.ui.store_watcher',
+    'RetentionScheduler': 'eisenhower_matrix.infrastructure.ui.retention_scheduler',
+    'ToastNotificationService': 'eisenhower_matrix.infrastructure.ui.toast_notifications',
+    'PerfHud': 'eisenhower_matrix.infrastructure.ui.perf_hud',
+}
 
 __all__ = [
     'EisenhowerApp',
@@ -18,5 +31,11 @@ __all__ = [
     'TaskDialog',
     'TaskRow',
     'GtkObserverAdapter',
+    'StoreWatcher',
+    'RetentionScheduler',
+    'ToastNotificationService',
+    'PerfHud',
     'main',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -4,14 +4,28 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, GLib, Gio
+import threading
 from pathlib import Path
 
-from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
 from eisenhower_matrix.application.project_management import ProjectManagementService
 from eisenhower_matrix.infrastructure.persistence import JsonTaskRepository
 from eisenhower_matrix.infrastructure.persistence.json_project_repository import JsonProjectRepository
+from eisenhower_matrix.infrastructure.persistence.json_retention_config import load_retention_config
 from eisenhower_matrix.infrastructure.ui.main_window import MainWindow
-from eisenhower_matrix.application import TaskExportUseCase, TaskImportUseCase
+from eisenhower_matrix.infrastructure.ui.store_watcher import StoreWatcher
+from eisenhower_matrix.infrastructure.ui.retention_scheduler import RetentionScheduler
+from eisenhower_matrix.infrastructure.ui.toast_notifications import ToastNotificationService
+from eisenhower_matrix.application import ProjectServiceCache
+from eisenhower_matrix.infrastructure.api import server_from_environment
+from eisenhower_matrix.infrastructure.project_session import ProjectSession, create_project_service
+from eisenhower_matrix.diagnostics.tracing import (
+    is_tracing, start_tracing, stop_tracing, tracing_from_environment
+)
+from eisenhower_matrix.diagnostics.profiler import ProfilerSession
+from eisenhower_matrix.diagnostics.memory import (
+    LeakCheck, memory_report, memory_tracing_from_environment, start_memory_tracing, write_memory_report
+)
+from eisenhower_matrix.diagnostics.slowlog import slow_log_from_environment
 
 
 class EisenhowerApp(Adw.Application):
@@ -22,11 +36,21 @@ class EisenhowerApp(Adw.Application):
     Dependency Injection: Creates and wires dependencies
     """
     
+    # Length of a profiling session started with Ctrl+Alt+Shift+P
+    PROFILE_SECONDS = 10
+    
     def __init__(self):
         super().__init__(
             application_id='com.github.alesima.eisenhower',
             flags=Gio.ApplicationFlags.FLAGS_NONE
         )
+        # Optional hot-path trace of the whole run (EISENHOWER_TRACE)
+        tracing_from_environment()
+        # Optional log of operations over EISENHOWER_SLOW_MS milliseconds
+        slow_log_from_environment()
+        # Optional tracemalloc for the whole run (EISENHOWER_MEMORY)
+        memory_tracing_from_environment()
+        
         # Dependency Injection: Create infrastructure and domain services
         self.project_repository = JsonProjectRepository()
         self.project_service = ProjectManagementService(self.project_repository)
@@ -39,11 +63,73 @@ class EisenhowerApp(Adw.Application):
             # Create default project if none exists
             self.current_project = self.project_service.create_project("My Tasks", "Default project")
         
-        # Create task repository for current project
-        repository = JsonTaskRepository(project_id=self.current_project.id)
-        self.service = EisenhowerMatrixService(repository)
-        self.export_use_case = TaskExportUseCase(self.service)
-        self.import_use_case = TaskImportUseCase(self.service)
+        # Services of recently used projects stay warm for instant switching;
+        # tasks are loaded in the background once the window is on screen
+        # Evicted services are watched so memory reports can show leaks
+        self._leak_check = LeakCheck()
+        self.service_cache = ProjectServiceCache(
+            create_project_service, on_evict=lambda project_id, service: self._leak_check.watch(service, project_id)
+        )
+        # The open project's service and use cases (see the properties below)
+        self.session = ProjectSession(self.service_cache, self.current_project.id, GLib.idle_add)
+        
+        # Optional local API (EISENHOWER_API); requests run on the GTK thread
+        self.api_server = server_from_environment(GLib.idle_add)
+        
+        # Picks up edits other processes make to the open project's file
+        self.store_watcher = None
+        
+        # Applies retention policies (retention.json) to the open project
+        self.retention_scheduler = RetentionScheduler(
+            load_retention_config(),
+            ToastNotificationService(self._show_toast),
+            default_export_dir=Path.home() / ".local" / "share" / "eisenhower" / "purged"
+        )
+        
+        # Running profiler session and the timeout that ends it
+        self._profiler = None
+        self._profile_timeout = 0
+        
+        # Everything that follows the open project, rebound on each switch
+        self.session.follow(self._refresh_window)
+        if self.api_server:
+            self.session.follow(self.api_server.attach)
+        self.session.follow(lambda service, project_id: self._watch_current_project())
+        self.session.follow(self.retention_scheduler.start)
+    
+    @property
+    def service(self):
+        """Service of the open project"""
+        return self.session.service
+    
+    @property
+    def export_use_case(self):
+        return self.session.export_use_case
+    
+    @property
+    def import_use_case(self):
+        return self.session.import_use_case
+    
+    def _prefetch_recent_projects(self, count: int = 2):
+        """Warm the most recently accessed projects in the background"""
+        recent = [
+            p.id for p in self.project_service.get_all_projects()
+            if not self.current_project or p.id != self.current_project.id
+        ]
+        self.service_cache.prefetch(recent[:count], GLib.idle_add)
+    
+    def _watch_current_project(self):
+        """Watch the open project's tasks file for external changes"""
+        if self.store_watcher:
+            self.store_watcher.cancel()
+        self.store_watcher = StoreWatcher(
+            JsonTaskRepository.path_for_project(self.current_project.id),
+            self._on_store_changed
+        )
+    
+    def _on_store_changed(self):
+        """Merge tasks another process saved into the live service"""
+        self.service.reload_external_changes()
     
     def switch_project(self, project_id: str):
         """
@@ -57,17 +143,16 @@ class EisenhowerApp(Adw.Application):
             self.current_project = project
             self.project_service.mark_project_accessed(project_id)
             
-            # Create new repository and service for the project
-            repository = JsonTaskRepository(project_id=project_id)
-            self.service = EisenhowerMatrixService(repository)
-            self.export_use_case = TaskExportUseCase(self.service)
-            self.import_use_case = TaskImportUseCase(self.service)
-            
-            # Refresh the main window
-            win = self.props.active_window
-            if win:
-                win.refresh_panels_for_project()
-                win.update_window_title()
+            # Reuse the project's warm service, or create one
+            self.session.switch(project_id)
+            self._prefetch_recent_projects()
+    
+    def _refresh_window(self, service, project_id: str):
+        """Show the open project in the main window"""
+        win = self.props.active_window
+        if win:
+            win.refresh_panels_for_project()
+            win.update_window_title()
     
     def do_activate(self):
         """Activate the application"""
@@ -75,6 +160,26 @@ class EisenhowerApp(Adw.Application):
         if not win:
             win = MainWindow(self)
         win.present()
+        
+        # Show the window chrome first, then stream tasks in
+        self.session.load()
+        self._prefetch_recent_projects()
+        if not self.store_watcher:
+            self._watch_current_project()
+            self.retention_scheduler.start(self.service, self.current_project.id)
+        
+        if self.api_server and not self.api_server.is_running:
+            self.api_server.attach(self.service, self.current_project.id)
+            self.api_server.start()
+    
+    def do_shutdown(self):
+        """Application shutdown"""
+        if self.store_watcher:
+            self.store_watcher.cancel()
+        self.retention_scheduler.cancel()
+        if self.api_server:
+            self.api_server.stop()
+        Adw.Application.do_shutdown(self)
     
     def do_startup(self):
         """Application startup"""
@@ -125,6 +230,21 @@ class EisenhowerApp(Adw.Application):
         import_merge_action.connect("activate", self.on_import_merge)
         self.add_action(import_merge_action)
         
+        # Hidden: start/stop a hot-path trace (see diagnostics.tracing)
+        trace_action = Gio.SimpleAction.new("toggle-trace", None)
+        trace_action.connect("activate", self.on_toggle_trace)
+        self.add_action(trace_action)
+        
+        # Hidden: profile the app for PROFILE_SECONDS (see diagnostics.profiler)
+        profile_action = Gio.SimpleAction.new("profile", None)
+        profile_action.connect("activate", self.on_profile)
+        self.add_action(profile_action)
+        
+        # Hidden: write a memory report (see diagnostics.memory)
+        memory_action = Gio.SimpleAction.new("memory-report", None)
+        memory_action.connect("activate", self.on_memory_report)
+        self.add_action(memory_action)
+        
         quit_action = Gio.SimpleAction.new("quit", None)
         quit_action.connect("activate", lambda *_: self.quit())
         self.add_action(quit_action)
@@ -140,6 +260,9 @@ class EisenhowerApp(Adw.Application):
         self.set_accels_for_action("app.about", ["F1"])
         self.set_accels_for_action("app.shortcuts", ["<Ctrl>question"])
         self.set_accels_for_action("app.user-guide", ["F2"])
+        self.set_accels_for_action("app.toggle-trace", ["<Ctrl><Alt><Shift>T"])
+        self.set_accels_for_action("app.profile", ["<Ctrl><Alt><Shift>P"])
+        self.set_accels_for_action("app.memory-report", ["<Ctrl><Alt><Shift>M"])
         
         # Register parameterized move-task action
         # Parameter format: "from_quadrant-task_id-to_quadrant"
@@ -156,16 +279,16 @@ class EisenhowerApp(Adw.Application):
         if not parameter:
             return
         
-        # Parse parameter: "from_quadrant-task_id-to_quadrant"
+        # Parse parameter: "from_quadrant-task_uid-to_quadrant"
         parts = parameter.get_string().split('-')
         if len(parts) != 3:
             return
         
         try:
-            from_q, task_id, to_q = int(parts[0]), int(parts[1]), int(parts[2])
+            from_q, task_uid, to_q = int(parts[0]), parts[1], int(parts[2])
             win = self.props.active_window
             if win and hasattr(win, 'on_task_move'):
-                win.on_task_move(from_q, task_id, to_q)
+                win.on_task_move(from_q, task_uid, to_q)
         except ValueError:
             pass  # Invalid parameter format
     
@@ -462,6 +585,74 @@ class EisenhowerApp(Adw.Application):
         else:
             self._show_error_dialog("Import Failed", "Could not import tasks from file")
     
+    def on_toggle_trace(self, action, param):
+        """Start tracing, or stop and write the trace"""
+        if not is_tracing():
+            start_tracing()
+            self._show_toast("Tracing started")
+            return
+        path = stop_tracing()
+        if path:
+            self._show_toast(f"Trace written to {path}")
+        else:
+            self._show_toast("Could not write trace")
+    
+    def on_profile(self, action, param):
+        """Start a profiling session, or end the running one early"""
+        if self._profiler is not None:
+            self._finish_profile()
+            return
+        self._profiler = ProfilerSession()
+        self._profiler.start()
+        self._profile_timeout = GLib.timeout_add_seconds(self.PROFILE_SECONDS, self._on_profile_timeout)
+        self._show_toast(f"Profiling for {self.PROFILE_SECONDS} seconds…")
+    
+    def _on_profile_timeout(self):
+        self._profile_timeout = 0
+        self._finish_profile()
+        return GLib.SOURCE_REMOVE
+    
+    def _finish_profile(self):
+        """Stop profiling and write the files off the main thread"""
+        if self._profile_timeout:
+            GLib.source_remove(self._profile_timeout)
+            self._profile_timeout = 0
+        session, self._profiler = self._profiler, None
+        session.stop()
+        
+        def write():
+            try:
+                prof_path, _ = session.write()
+                message = f"Profile saved to {prof_path}"
+            except OSError as e:
+                message = f"Could not save profile: {e}"
+            GLib.idle_add(self._on_profile_written, message)
+        threading.Thread(target=write, name="profile-writer", daemon=True).start()
+    
+    def _on_profile_written(self, message: str):
+        self._show_toast(message)
+        return GLib.SOURCE_REMOVE
+    
+    def on_memory_report(self, action, param):
+        """Write per-project memory footprints and leaked services to a file"""
+        win = self.props.active_window
+        widget_roots = {}
+        if win and self.current_project:
+            widget_roots[self.current_project.id] = list(win.panels.values())
+        report = memory_report(self.service_cache.services(), widget_roots, self._leak_check)
+        try:
+            path = write_memory_report(report)
+        except OSError as e:
+            self._show_toast(f"Could not save memory report: {e}")
+            return
+        message = f"Memory report saved to {path}"
+        if report['leaked']:
+            message += f" ({len(report['leaked'])} evicted projects still in memory)"
+        if start_memory_tracing():
+            # Allocations are attributed from now on; the next report has them
+            message += "; allocation tracing started"
+        self._show_toast(message)
+    
     def _show_toast(self, message: str):
         """Show a toast notification"""
         win = self.props.active_window
@@ -4,13 +4,14 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, Gio, GObject
+import os
+import time
 
 from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
 from eisenhower_matrix.infrastructure.ui.observer_adapter import GtkObserverAdapter
 from eisenhower_matrix.infrastructure.ui.quadrant_panel import QuadrantPanel
-from eisenhower_matrix.infrastructure.ui.task_dialog import TaskDialog
-from eisenhower_matrix.infrastructure.ui.project_dialog import ProjectSelectorDialog
-from eisenhower_matrix.infrastructure.ui.user_guide_dialog import UserGuideDialog
+from eisenhower_matrix.infrastructure.ui.perf_hud import PerfHud
+from eisenhower_matrix.diagnostics.tracing import span
 
 
 class MainWindow(Adw.ApplicationWindow):
@@ -23,6 +24,7 @@ class MainWindow(Adw.ApplicationWindow):
         # Create observer adapter and attach to service
         self.observer_adapter = GtkObserverAdapter(self.on_matrix_changed)
         self.app.service.add_observer(self.observer_adapter)
+        self._observed_service = self.app.service
         
         self.set_default_size(1200, 800)
         self.update_window_title()
@@ -151,7 +153,8 @@ class MainWindow(Adw.ApplicationWindow):
                 self.on_task_move,
                 self.on_task_edit,
                 self.on_task_reorder,
-                self.on_task_archive
+                self.on_task_archive,
+                on_selection_action=self.on_tasks_action
             )
             panel.set_show_completed(self.show_completed)
             self.panels[q] = panel
@@ -160,9 +163,16 @@ class MainWindow(Adw.ApplicationWindow):
         
         main_box.append(grid)
         
+        # Developer performance overlay (Ctrl+Alt+Shift+H or EISENHOWER_HUD=1)
+        self.perf_hud = PerfHud(self, lambda: self.app.service, lambda: self.panels)
+        hud_overlay = Gtk.Overlay()
+        hud_overlay.set_child(main_box)
+        hud_overlay.add_overlay(self.perf_hud)
+        
         # Wrap in toast overlay for notifications
         toast_overlay = Adw.ToastOverlay()
-        toast_overlay.set_child(main_box)
+        toast_overlay.set_child(hud_overlay)
+        self.toast_overlay = toast_overlay
         
         self.set_content(toast_overlay)
         
@@ -171,6 +181,9 @@ class MainWindow(Adw.ApplicationWindow):
         
         # Load CSS
         self.load_css()
+        
+        if os.environ.get('EISENHOWER_HUD', '') not in ('', '0'):
+            self.perf_hud.set_active(True)
     
     def _setup_keyboard_shortcuts(self):
         """Set up window-level keyboard shortcuts"""
@@ -199,6 +212,39 @@ class MainWindow(Adw.ApplicationWindow):
             action.connect("activate", lambda a, p, quadrant=q: self._focus_quadrant(quadrant))
             self.add_action(action)
             app.set_accels_for_action(f"win.focus-quadrant-{q}", [f"<Ctrl>{q}"])
+        
+        # Undo/redo: Ctrl+Z, Ctrl+Shift+Z
+        undo_action = Gio.SimpleAction.new("undo", None)
+        undo_action.connect("activate", lambda *args: self._on_undo())
+        self.add_action(undo_action)
+        app.set_accels_for_action("win.undo", ["<Ctrl>Z"])
+        
+        redo_action = Gio.SimpleAction.new("redo", None)
+        redo_action.connect("activate", lambda *args: self._on_redo())
+        self.add_action(redo_action)
+        app.set_accels_for_action("win.redo", ["<Ctrl><Shift>Z"])
+        
+        # Performance HUD: Ctrl+Alt+Shift+H (hidden developer shortcut)
+        hud_action = Gio.SimpleAction.new("toggle-hud", None)
+        hud_action.connect("activate", lambda *args: self.perf_hud.toggle())
+        self.add_action(hud_action)
+        app.set_accels_for_action("win.toggle-hud", ["<Ctrl><Alt><Shift>H"])
+    
+    def _on_undo(self):
+        """Undo the last change"""
+        label = self.app.service.undo()
+        self._show_toast(f"Undone: {label}" if label else "Nothing to undo")
+    
+    def _on_redo(self):
+        """Redo the last undone change"""
+        label = self.app.service.redo()
+        self._show_toast(f"Redone: {label}" if label else "Nothing to redo")
+    
+    def _show_toast(self, message: str):
+        """Show a short notification"""
+        toast = Adw.Toast.new(message)
+        toast.set_timeout(2)
+        self.toast_overlay.add_toast(toast)
     
     def _focus_quadrant(self, quadrant: int):
         """Focus on a specific quadrant"""
@@ -208,6 +254,8 @@ class MainWindow(Adw.ApplicationWindow):
     
     def _on_projects_clicked(self, button):
         """Handle projects button click"""
+        from eisenhower_matrix.infrastructure.ui.project_dialog import ProjectSelectorDialog
+        
         dialog = ProjectSelectorDialog(self, self.get_application())
         dialog.present()
     
@@ -321,6 +369,26 @@ class MainWindow(Adw.ApplicationWindow):
             border: 2px solid @accent_color;
             border-radius: 6px;
         }
+        
+        /* Multi-selection */
+        .task-row.selected-task {
+            background: alpha(@accent_color, 0.2);
+        }
+        
+        .rubber-band {
+            background: alpha(@accent_color, 0.15);
+            border: 1px solid @accent_color;
+        }
+        
+        /* Performance HUD */
+        .perf-hud {
+            background: alpha(black, 0.75);
+            color: white;
+            border-radius: 6px;
+            padding: 6px 10px;
+            font-family: monospace;
+            font-size: 0.85em;
+        }
         """
         css_provider.load_from_data(css.encode())
         Gtk.StyleContext.add_provider_for_display(
@@ -379,6 +447,9 @@ class MainWindow(Adw.ApplicationWindow):
     def _on_show_archived_toggled(self, button):
         """Toggle showing archived tasks"""
         self.show_archived = button.get_active()
+        if self.show_archived:
+            # Archived tasks live in cold storage, read only from here on
+            self.app.service.load_archive()
         
         # When showing archived tasks, also show completed tasks (since archived tasks are completed)
         if self.show_archived and not self.show_completed:
@@ -399,62 +470,81 @@ class MainWindow(Adw.ApplicationWindow):
     
     def on_matrix_changed(self):
         """Handle matrix data changes"""
-        for panel in self.panels.values():
-            panel.refresh()
+        started = time.perf_counter()
+        with span('MainWindow.refresh', project=self.app.service.project_id):
+            for panel in self.panels.values():
+                panel.refresh()
+        if self.perf_hud.active:
+            self.perf_hud.record_refresh(time.perf_counter() - started)
     
-    def on_task_complete(self, quadrant: int, task_id: int, completed: bool):
+    def on_task_complete(self, quadrant: int, task_uid: str, completed: bool):
         """Handle task completion toggle"""
         if completed:
-            self.app.service.complete_task(quadrant, task_id)
+            self.app.service.complete_task(quadrant, task_uid)
         else:
-            self.app.service.uncomplete_task(quadrant, task_id)
+            self.app.service.uncomplete_task(quadrant, task_uid)
     
-    def on_task_archive(self, quadrant: int, task_id: int, archived: bool):
+    def on_task_archive(self, quadrant: int, task_uid: str, archived: bool):
         """Handle task archive toggle"""
         if archived:
-            self.app.service.archive_task(quadrant, task_id)
+            self.app.service.archive_task(quadrant, task_uid)
         else:
-            self.app.service.unarchive_task(quadrant, task_id)
+            self.app.service.unarchive_task(quadrant, task_uid)
     
-    def on_task_delete(self, quadrant: int, task_id: int):
+    def on_task_delete(self, quadrant: int, task_uid: str):
         """Handle task deletion"""
-        self.app.service.remove_task(quadrant, task_id)
+        self.app.service.remove_task(quadrant, task_uid)
     
-    def on_task_move(self, from_q: int, task_id: int, to_q: int):
+    def on_task_move(self, from_q: int, task_uid: str, to_q: int):
         """Handle task move"""
-        self.app.service.move_task(from_q, task_id, to_q)
+        self.app.service.move_task(from_q, task_uid, to_q)
+    
+    def on_tasks_action(self, action: str, quadrant: int, task_uids, to_quadrant: int = None):
+        """Handle an action on a panel's selection: one save, one refresh"""
+        refs = [(quadrant, uid) for uid in task_uids]
+        service = self.app.service
+        if action == 'complete':
+            service.complete_tasks(refs)
+        elif action == 'archive':
+            service.archive_tasks(refs)
+        elif action == 'delete':
+            service.remove_tasks(refs)
+        elif action == 'move' and to_quadrant is not None and to_quadrant != quadrant:
+            service.move_tasks(refs, to_quadrant)
     
-    def on_task_edit(self, quadrant: int, task_id: int):
+    def on_task_edit(self, quadrant: int, task_uid: str):
         """Handle task edit"""
-        task = None
-        for t in self.app.service.get_tasks(quadrant):
-            if t.id == task_id:
-                task = t
-                break
-        
-        if not task:
+        found = self.app.service.find_task(task_uid)
+        if found is None or found[0] != quadrant:
             return
+        task = found[1]
+        
+        from eisenhower_matrix.infrastructure.ui.task_dialog import TaskDialog
         
         def on_save(description, notes, tags, metadata, due_date):
-            self.app.service.update_task(quadrant, task_id, description, notes, tags, metadata, due_date)
+            self.app.service.update_task(quadrant, task_uid, description, notes, tags, metadata, due_date)
         
         dialog = TaskDialog(self, quadrant, task, on_save)
         dialog.present()    
-    def on_task_reorder(self, quadrant: int, task_id: int, direction: str, target_task_id: int = None):
+    def on_task_reorder(self, quadrant: int, task_uid: str, direction: str, target_task_uid: str = None):
         """Handle task reordering"""
         if direction in ['up', 'down']:
             # Legacy up/down button support
-            self.app.service.reorder_task(quadrant, task_id, direction)
-        elif direction in ['before', 'after'] and target_task_id is not None:
+            self.app.service.reorder_task(quadrant, task_uid, direction)
+        elif direction in ['before', 'after'] and target_task_uid is not None:
             # Drag and drop support
-            self.app.service.reorder_task_relative(quadrant, task_id, direction, target_task_id)
+            self.app.service.reorder_task_relative(quadrant, task_uid, direction, target_task_uid)
     
     def refresh_panels_for_project(self):
         """Refresh all panels to use the new service after project switch"""
-        # Re-attach observer to new service
-        self.app.service.add_observer(self.observer_adapter)
+        # Move the observer to the new service; the old one may stay cached
+        # and must not keep this window alive or refresh it
+        if self._observed_service is not self.app.service:
+            self._observed_service.remove_observer(self.observer_adapter)
+            self.app.service.add_observer(self.observer_adapter)
+            self._observed_service = self.app.service
         
         # Update panels with new service
         for q, panel in self.panels.items():
-            panel.service = self.app.service
+            panel.set_service(self.app.service)
             panel.refresh()
\ No newline at end of file
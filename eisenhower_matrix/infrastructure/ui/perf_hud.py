@@ -0,0 +1,144 @@
+"""Performance HUD Overlay"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, GLib
+from collections import deque
+from typing import Callable, Dict, Optional
+
+
+class PerfHud(Gtk.Label):
+    """
+    Developer overlay with live UI performance figures
+    
+    Single Responsibility: Show frame times, refresh and save latency and
+    row counts of a window while enabled
+    
+    Frame times come from the window's Gdk.FrameClock ("after-paint");
+    GTK only paints when something changes, so an idle window shows no
+    new frames. Nothing is connected or polled while the HUD is hidden.
+    """
+    
+    # Milliseconds between text updates
+    UPDATE_INTERVAL = 500
+    # Frames the frame-time statistics cover
+    FRAME_WINDOW = 120
+    
+    def __init__(self, window: Gtk.Window, get_service: Callable, get_panels: Callable[[], Dict]):
+        """
+        Initialize HUD
+        
+        Args:
+            window: Window whose frame clock is measured
+            get_service: Returns the service whose save latency is shown
+            get_panels: Returns the quadrant panels by quadrant
+        """
+        super().__init__()
+        self._window = window
+        self._get_service = get_service
+        self._get_panels = get_panels
+        self._frame_intervals = deque(maxlen=self.FRAME_WINDOW)
+        self._last_frame_time: Optional[int] = None
+        self._clock = None
+        self._paint_handler = 0
+        self._realize_handler = 0
+        self._timeout = 0
+        self._refresh_seconds: Optional[float] = None
+        self._refresh_count = 0
+        
+        self.set_halign(Gtk.Align.END)
+        self.set_valign(Gtk.Align.END)
+        self.set_margin_end(12)
+        self.set_margin_bottom(12)
+        self.set_xalign(0)
+        self.set_can_target(False)
+        self.add_css_class('perf-hud')
+        self.set_visible(False)
+    
+    @property
+    def active(self) -> bool:
+        return self.get_visible()
+    
+    def toggle(self) -> None:
+        self.set_active(not self.active)
+    
+    def set_active(self, active: bool) -> None:
+        """Show the HUD and start measuring, or hide it and stop"""
+        if active == self.active:
+            return
+        self.set_visible(active)
+        if active:
+            self._connect_clock()
+            self._timeout = GLib.timeout_add(self.UPDATE_INTERVAL, self._on_update)
+            self._update_text()
+        else:
+            self._disconnect_clock()
+            if self._timeout:
+                GLib.source_remove(self._timeout)
+                self._timeout = 0
+    
+    def record_refresh(self, seconds: float) -> None:
+        """Report how long an on_matrix_changed refresh took"""
+        self._refresh_seconds = seconds
+        self._refresh_count += 1
+    
+    def _connect_clock(self) -> None:
+        clock = self._window.get_frame_clock()
+        if clock is None:
+            # Not realized yet; measure once it is
+            self._realize_handler = self._window.connect('realize', self._on_window_realize)
+            return
+        self._clock = clock
+        self._last_frame_time = None
+        self._frame_intervals.clear()
+        self._paint_handler = clock.connect('after-paint', self._on_after_paint)
+    
+    def _disconnect_clock(self) -> None:
+        if self._realize_handler:
+            self._window.disconnect(self._realize_handler)
+            self._realize_handler = 0
+        if self._paint_handler:
+            self._clock.disconnect(self._paint_handler)
+            self._paint_handler = 0
+        self._clock = None
+    
+    def _on_window_realize(self, window) -> None:
+        window.disconnect(self._realize_handler)
+        self._realize_handler = 0
+        if self.active:
+            self._connect_clock()
+    
+    def _on_after_paint(self, clock) -> None:
+        frame_time = clock.get_frame_time()
+        if self._last_frame_time is not None:
+            self._frame_intervals.append((frame_time - self._last_frame_time) / 1000.0)
+        self._last_frame_time = frame_time
+    
+    def _on_update(self):
+        self._update_text()
+        return GLib.SOURCE_CONTINUE
+    
+    def _update_text(self) -> None:
+        lines = []
+        if self._frame_intervals:
+            intervals = list(self._frame_intervals)
+            average = sum(intervals) / len(intervals)
+            fps = self._clock.get_fps() if self._clock is not None else 0.0
+            lines.append(f"frame    {intervals[-1]:6.1f} ms  avg {average:5.1f}  max {max(intervals):6.1f}  {fps:4.0f} fps")
+        else:
+            lines.append("frame        —  (no frames painted yet)")
+        
+        if self._refresh_seconds is not None:
+            lines.append(f"refresh  {self._refresh_seconds * 1000:6.1f} ms  (#{self._refresh_count})")
+        else:
+            lines.append("refresh      —")
+        
+        save = self._get_service().last_save_duration
+        lines.append(f"save     {save * 1000:6.1f} ms" if save is not None else "save         —")
+        
+        counts = []
+        for quadrant, panel in sorted(self._get_panels().items()):
+            pending = '+' if panel.is_populating else ''
+            counts.append(f"Q{quadrant} {panel.row_count}{pending}")
+        lines.append("rows     " + "  ".join(counts))
+        self.set_label("\n".join(lines))
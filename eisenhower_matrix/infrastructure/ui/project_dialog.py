@@ -163,11 +163,12 @@ class ProjectSelectorDialog(Adw.Window):
         
         # Add projects
         projects = self.app.project_service.get_all_projects()
+        can_delete = len(projects) > 1
         for project in projects:
-            row = self._create_project_row(project)
+            row = self._create_project_row(project, can_delete)
             self.list_box.append(row)
     
-    def _create_project_row(self, project: Project):
+    def _create_project_row(self, project: Project, can_delete: bool):
         """Create a row for a project"""
         row = Adw.ActionRow()
         row.set_title(project.name)
@@ -193,8 +194,7 @@ class ProjectSelectorDialog(Adw.Window):
         row.add_suffix(edit_btn)
         
         # Delete button (only if not the last project)
-        projects = self.app.project_service.get_all_projects()
-        if len(projects) > 1:
+        if can_delete:
             delete_btn = Gtk.Button(icon_name="user-trash-symbolic")
             delete_btn.set_valign(Gtk.Align.CENTER)
             delete_btn.add_css_class('destructive-action')
@@ -255,6 +255,7 @@ class ProjectSelectorDialog(Adw.Window):
                         self.app.switch_project(other_project.id)
                 
                 self.app.project_service.delete_project(project.id)
+                self.app.service_cache.discard(project.id)
                 self._refresh_projects()
             except ValueError as e:
                 # Show error if cannot delete
@@ -3,12 +3,15 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib, Gdk, Gio
 
+import time
+from typing import List, Optional, Set, Tuple
 from eisenhower_matrix.domain import QuadrantInfo
 from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
-from eisenhower_matrix.infrastructure.ui.task_dialog import TaskDialog
 from eisenhower_matrix.infrastructure.ui.task_row import TaskRow
+from eisenhower_matrix.infrastructure.ui.view_cache import FilteredViewCache
+from eisenhower_matrix.diagnostics.tracing import span
 
 
 class QuadrantPanel(Gtk.Box):
@@ -17,9 +20,41 @@ class QuadrantPanel(Gtk.Box):
     
     Single Responsibility: Display tasks for one quadrant
     Depends on domain service abstraction
+    
+    Tasks can be selected with Ctrl+click (toggle), Shift+click (range)
+    and by dragging a rubber band from empty space. The selection bar
+    completes, archives, deletes or moves all selected tasks through
+    on_selection_action, as one service mutation; Escape clears it.
+    
+    Drag and drop is handled by one DragSource and one DropTarget on the
+    task list rather than by every row: the row under the pointer is
+    found by hit-testing row bounds, and dragging near the top or bottom
+    edge scrolls the list. Drag data is "<quadrant>:<uid>[,<uid>...]";
+    dragging a selected row carries the whole selection.
     """
     
-    def __init__(self, quadrant: int, service: EisenhowerMatrixService, on_complete, on_delete, on_move, on_edit, on_reorder, on_archive):
+    # Seconds of row work done per main loop iteration while populating,
+    # leaving the rest of a 60 Hz frame for input, layout and drawing
+    FRAME_BUDGET = 0.008
+    
+    # Archived tasks added to the view per "Show more" click
+    ARCHIVE_PAGE_SIZE = 50
+    
+    # Height of the band along the list's top and bottom edges that
+    # scrolls it during a drag, and the scroll speed at the very edge
+    AUTOSCROLL_EDGE = 48
+    AUTOSCROLL_SPEED = 900.0  # pixels per second
+    
+    def __init__(self, quadrant: int, service: EisenhowerMatrixService, on_complete, on_delete, on_move, on_edit, on_reorder, on_archive,
+                 on_selection_action=None):
+        """
+        Initialize panel
+        
+        Args:
+            on_selection_action: Applies an action to several tasks, called
+                as (action, quadrant, task_uids, to_quadrant) with action one
+                of 'complete', 'archive', 'delete' or 'move'
+        """
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         self.quadrant = quadrant
         self.service = service
@@ -29,9 +64,38 @@ class QuadrantPanel(Gtk.Box):
         self.on_edit = on_edit
         self.on_reorder = on_reorder
         self.on_archive = on_archive
+        self.on_selection_action = on_selection_action
         self.show_completed = False
         self.show_archived = False
         self.search_text = ""
+        # Number of archived tasks shown while show_archived is set
+        self._archive_limit = self.ARCHIVE_PAGE_SIZE
+        
+        # Memoized filtered views and the key of the view on screen
+        self._view_cache = FilteredViewCache()
+        self._rendered_key = None
+        
+        # Pending incremental populate (generator) and its idle source
+        self._populate = None
+        self._populate_source = None
+        
+        # Selected task uids, the Shift+click anchor, the uids of the
+        # displayed tasks in display order, and the rubber band in progress
+        self._selection: Set[str] = set()
+        self._anchor_uid: Optional[str] = None
+        self._display_order: List[str] = []
+        self._band_start = None
+        self._band_base: Set[str] = set()
+        
+        # Drag and drop state: rows being dragged from this panel, the row
+        # highlighted as drop target, rows in display order for hit-testing
+        # (rebuilt lazily after a reconcile) and the edge autoscroll
+        self._dragged_rows = []
+        self._drop_row = None
+        self._hit_rows = None
+        self._autoscroll_speed = 0.0
+        self._autoscroll_tick = 0
+        self._autoscroll_time = None
         
         info = QuadrantInfo.get_info(quadrant)
         
@@ -65,12 +129,47 @@ class QuadrantPanel(Gtk.Box):
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.scrolled = scrolled
         
         # Task list
         self.task_list = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        scrolled.set_child(self.task_list)
+        
+        # Placeholder shown when no task matches; always the first child
+        self.empty_label = Gtk.Label(label="No tasks")
+        self.empty_label.add_css_class('dim-label')
+        self.empty_label.set_margin_top(24)
+        self.empty_label.set_margin_bottom(24)
+        self.task_list.append(self.empty_label)
+        
+        # Pages in more archived tasks; always the last child
+        self.more_button = Gtk.Button(label="Show more")
+        self.more_button.add_css_class('flat')
+        self.more_button.set_margin_top(6)
+        self.more_button.set_margin_bottom(6)
+        self.more_button.set_visible(False)
+        self.more_button.connect('clicked', self._on_more_clicked)
+        self.task_list.append(self.more_button)
+        
+        # Displayed rows keyed by task ID: (TaskRow, trailing separator)
+        self._rows = {}
+        
+        # Rubber band drawn over the task list while selecting
+        self.rubber_band = Gtk.Box()
+        self.rubber_band.add_css_class('rubber-band')
+        self.rubber_band.set_halign(Gtk.Align.START)
+        self.rubber_band.set_valign(Gtk.Align.START)
+        self.rubber_band.set_can_target(False)
+        self.rubber_band.set_visible(False)
+        list_overlay = Gtk.Overlay()
+        list_overlay.set_child(self.task_list)
+        list_overlay.add_overlay(self.rubber_band)
+        
+        scrolled.set_child(list_overlay)
         self.append(scrolled)
         
+        self._setup_selection()
+        self._setup_drag_and_drop()
+        
         # Add task button
         add_button = Gtk.Button(label="Add Task")
         add_button.set_margin_start(12)
@@ -87,14 +186,373 @@ class QuadrantPanel(Gtk.Box):
         # Load initial tasks
         self.refresh()
     
+    def _setup_selection(self):
+        """Set up click and rubber band selection, the selection bar and Escape"""
+        click = Gtk.GestureClick()
+        click.connect('released', self._on_list_click_released)
+        self.task_list.add_controller(click)
+        
+        band = Gtk.GestureDrag()
+        band.connect('drag-begin', self._on_band_begin)
+        band.connect('drag-update', self._on_band_update)
+        band.connect('drag-end', self._on_band_end)
+        self.task_list.add_controller(band)
+        
+        # Selection actions, reachable as panel.<name> from the selection bar
+        actions = Gio.SimpleActionGroup()
+        for name in ('complete', 'archive', 'delete'):
+            action = Gio.SimpleAction.new(f"{name}-selection", None)
+            action.connect('activate', lambda a, p, name=name: self._apply_to_selection(name))
+            actions.add_action(action)
+        move_action = Gio.SimpleAction.new("move-selection", GLib.VariantType.new("i"))
+        move_action.connect('activate', lambda a, p: self._apply_to_selection('move', p.get_int32()))
+        actions.add_action(move_action)
+        clear_action = Gio.SimpleAction.new("clear-selection", None)
+        clear_action.connect('activate', lambda *args: self.clear_selection())
+        actions.add_action(clear_action)
+        self.insert_action_group('panel', actions)
+        self._actions = actions
+        
+        self.selection_bar = Gtk.ActionBar()
+        self.selection_label = Gtk.Label()
+        self.selection_bar.pack_start(self.selection_label)
+        
+        clear_button = Gtk.Button(icon_name='edit-clear-symbolic', tooltip_text='Clear selection (Esc)')
+        clear_button.set_action_name('panel.clear-selection')
+        self.selection_bar.pack_end(clear_button)
+        
+        delete_button = Gtk.Button(icon_name='user-trash-symbolic', tooltip_text='Delete selected tasks')
+        delete_button.set_action_name('panel.delete-selection')
+        self.selection_bar.pack_end(delete_button)
+        
+        archive_button = Gtk.Button(icon_name='package-x-generic-symbolic', tooltip_text='Archive selected tasks')
+        archive_button.set_action_name('panel.archive-selection')
+        self.selection_bar.pack_end(archive_button)
+        
+        move_menu = Gio.Menu()
+        for q in range(1, 5):
+            if q != self.quadrant:
+                move_menu.append(f"Q{q}: {QuadrantInfo.get_info(q)['short_name']}", f"panel.move-selection({q})")
+        move_button = Gtk.MenuButton(icon_name='go-jump-symbolic', tooltip_text='Move selected tasks')
+        move_button.set_menu_model(move_menu)
+        self.selection_bar.pack_end(move_button)
+        
+        complete_button = Gtk.Button(icon_name='emblem-ok-symbolic', tooltip_text='Complete selected tasks')
+        complete_button.set_action_name('panel.complete-selection')
+        self.selection_bar.pack_end(complete_button)
+        
+        self.selection_bar.set_revealed(False)
+        self.append(self.selection_bar)
+        
+        # Escape clears the selection from anywhere in the window, and
+        # passes through (e.g. to the search bar) when nothing is selected
+        shortcuts = Gtk.ShortcutController()
+        shortcuts.set_scope(Gtk.ShortcutScope.GLOBAL)
+        shortcuts.add_shortcut(Gtk.Shortcut.new(
+            Gtk.ShortcutTrigger.parse_string('Escape'),
+            Gtk.CallbackAction.new(lambda *args: self.clear_selection())
+        ))
+        self.add_controller(shortcuts)
+    
+    @property
+    def selected_uids(self) -> List[str]:
+        """Selected task uids in display order"""
+        return [uid for uid in self._display_order if uid in self._selection]
+    
+    def clear_selection(self) -> bool:
+        """
+        Deselect all tasks
+        
+        Returns:
+            False if nothing was selected
+        """
+        if not self._selection:
+            return False
+        self._set_selection(set())
+        return True
+    
+    def _set_selection(self, uids: Set[str]):
+        """Select exactly uids, restyling only the rows whose state changed"""
+        changed = self._selection ^ uids
+        self._selection = set(uids)
+        for uid in changed:
+            entry = self._rows.get(uid)
+            if entry is not None:
+                entry[0].set_selected(uid in self._selection)
+        self._update_selection_bar()
+    
+    def _update_selection_bar(self):
+        """Reveal the selection bar with the selection count, or hide it"""
+        count = len(self._selection)
+        self.selection_bar.set_revealed(count > 0)
+        if count:
+            self.selection_label.set_label(f"{count} selected")
+        # Archived tasks cannot be archived again
+        self._actions.lookup_action('archive-selection').set_enabled(not self.show_archived)
+    
+    def _apply_to_selection(self, action: str, to_quadrant: Optional[int] = None):
+        """Hand the selected tasks to on_selection_action and deselect them"""
+        task_uids = self.selected_uids
+        if not task_uids or self.on_selection_action is None:
+            return
+        self.clear_selection()
+        self.on_selection_action(action, self.quadrant, task_uids, to_quadrant)
+    
+    def _row_at(self, x: float, y: float):
+        """
+        The row under a point of the task list
+        
+        Returns:
+            (TaskRow or None, whether the point is on one of its buttons)
+        """
+        widget = self.task_list.pick(x, y, Gtk.PickFlags.DEFAULT)
+        on_control = False
+        while widget is not None and widget is not self.task_list:
+            if isinstance(widget, (Gtk.Button, Gtk.CheckButton, Gtk.MenuButton)):
+                on_control = True
+            elif isinstance(widget, TaskRow):
+                return widget, on_control
+            widget = widget.get_parent()
+        return None, False
+    
+    def _on_list_click_released(self, gesture, n_press, x, y):
+        """Click selection: plain selects one, Ctrl toggles, Shift extends"""
+        row, on_control = self._row_at(x, y)
+        if on_control:
+            return
+        state = gesture.get_current_event_state()
+        ctrl = bool(state & Gdk.ModifierType.CONTROL_MASK)
+        shift = bool(state & Gdk.ModifierType.SHIFT_MASK)
+        
+        if row is None:
+            if not ctrl and not shift:
+                self.clear_selection()
+            return
+        
+        uid = row.task.uid
+        if shift and self._anchor_uid in self._display_order:
+            start = self._display_order.index(self._anchor_uid)
+            end = self._display_order.index(uid)
+            if start > end:
+                start, end = end, start
+            span_uids = set(self._display_order[start:end + 1])
+            self._set_selection(self._selection | span_uids if ctrl else span_uids)
+            return
+        
+        if ctrl:
+            self._set_selection(self._selection ^ {uid})
+        else:
+            self._set_selection({uid})
+        self._anchor_uid = uid
+    
+    def _on_band_begin(self, gesture, x, y):
+        """Start a rubber band, unless the press is on a row (a row drag)"""
+        row, _ = self._row_at(x, y)
+        if row is not None:
+            gesture.set_state(Gtk.EventSequenceState.DENIED)
+            return
+        ctrl = bool(gesture.get_current_event_state() & Gdk.ModifierType.CONTROL_MASK)
+        self._band_start = (x, y)
+        self._band_base = set(self._selection) if ctrl else set()
+    
+    def _on_band_update(self, gesture, offset_x, offset_y):
+        """Resize the rubber band and select the rows it crosses"""
+        if self._band_start is None:
+            return
+        start_x, start_y = self._band_start
+        left, top = min(start_x, start_x + offset_x), min(start_y, start_y + offset_y)
+        width, height = abs(offset_x), abs(offset_y)
+        self.rubber_band.set_margin_start(int(max(left, 0)))
+        self.rubber_band.set_margin_top(int(max(top, 0)))
+        self.rubber_band.set_size_request(int(width), int(height))
+        self.rubber_band.set_visible(True)
+        
+        bottom = top + height
+        hits = set()
+        for uid, (row, _) in self._rows.items():
+            ok, bounds = row.compute_bounds(self.task_list)
+            if ok and bounds.origin.y < bottom and bounds.origin.y + bounds.size.height > top:
+                hits.add(uid)
+        self._set_selection(self._band_base | hits)
+    
+    def _on_band_end(self, gesture, offset_x, offset_y):
+        """Finish the rubber band"""
+        self._band_start = None
+        self._band_base = set()
+        self.rubber_band.set_visible(False)
+    
+    def _setup_drag_and_drop(self):
+        """One drag source and one drop target for all rows of the panel"""
+        drag_source = Gtk.DragSource()
+        drag_source.set_actions(Gdk.DragAction.MOVE)
+        drag_source.connect('prepare', self._on_drag_prepare)
+        drag_source.connect('drag-begin', self._on_drag_begin)
+        drag_source.connect('drag-end', self._on_drag_end)
+        self.task_list.add_controller(drag_source)
+        
+        drop_target = Gtk.DropTarget()
+        drop_target.set_gtypes([str])
+        drop_target.set_actions(Gdk.DragAction.MOVE)
+        drop_target.connect('enter', self._on_drop_motion)
+        drop_target.connect('motion', self._on_drop_motion)
+        drop_target.connect('leave', self._on_drop_leave)
+        drop_target.connect('drop', self._on_drop)
+        self.task_list.add_controller(drop_target)
+    
+    def _row_at_y(self, y: float):
+        """
+        The row whose bounds contain y (task list coordinates)
+        
+        Binary search over the displayed rows, which are stacked in display
+        order, so hit-testing costs O(log n) bounds computations.
+        """
+        if self._hit_rows is None:
+            self._hit_rows = [self._rows[uid][0] for uid in self._display_order if uid in self._rows]
+        low, high = 0, len(self._hit_rows) - 1
+        while low <= high:
+            middle = (low + high) // 2
+            row = self._hit_rows[middle]
+            ok, bounds = row.compute_bounds(self.task_list)
+            if not ok:
+                return None
+            if y < bounds.origin.y:
+                high = middle - 1
+            elif y >= bounds.origin.y + bounds.size.height:
+                low = middle + 1
+            else:
+                return row
+        return None
+    
+    def _on_drag_prepare(self, source, x, y):
+        """Start dragging the row under the pointer (and the selection it is in)"""
+        row, on_control = self._row_at(x, y)
+        if row is None or on_control:
+            return None
+        uid = row.task.uid
+        if uid in self._selection and len(self._selection) > 1:
+            task_uids = self.selected_uids
+        else:
+            task_uids = [uid]
+        self._dragged_rows = [self._rows[u][0] for u in task_uids if u in self._rows]
+        return Gdk.ContentProvider.new_for_value(f"{self.quadrant}:{','.join(task_uids)}")
+    
+    def _on_drag_begin(self, source, drag):
+        """Use the shared drag icon and dim the dragged rows"""
+        icon = _drag_icon(self)
+        if icon is not None:
+            source.set_icon(icon, icon.get_intrinsic_width() // 2, icon.get_intrinsic_height() // 2)
+        for row in self._dragged_rows:
+            row.add_css_class('dragging')
+    
+    def _on_drag_end(self, source, drag, delete_data):
+        """Restore the dragged rows"""
+        for row in self._dragged_rows:
+            row.remove_css_class('dragging')
+        self._dragged_rows = []
+    
+    def _on_drop_motion(self, target, x, y):
+        """Highlight the row under the pointer and scroll near the edges"""
+        row = self._row_at_y(y)
+        if row is not self._drop_row:
+            if self._drop_row is not None:
+                self._drop_row.remove_css_class('drop-target')
+            if row is not None:
+                row.add_css_class('drop-target')
+            self._drop_row = row
+        self._update_autoscroll(y)
+        return Gdk.DragAction.MOVE
+    
+    def _on_drop_leave(self, target):
+        """Remove the highlight and stop scrolling"""
+        if self._drop_row is not None:
+            self._drop_row.remove_css_class('drop-target')
+            self._drop_row = None
+        self._stop_autoscroll()
+    
+    def _on_drop(self, target, value, x, y):
+        """Move tasks dropped from another quadrant, or reorder within this one"""
+        self._on_drop_leave(target)
+        if not value:
+            return False
+        try:
+            from_quadrant, task_uids = parse_drag_data(value)
+        except (ValueError, AttributeError):
+            return False
+        
+        if from_quadrant != self.quadrant:
+            if len(task_uids) == 1:
+                self.on_move(from_quadrant, task_uids[0], self.quadrant)
+            elif self.on_selection_action is not None:
+                self.on_selection_action('move', from_quadrant, task_uids, self.quadrant)
+            else:
+                return False
+            return True
+        
+        # Reorder a single task before or after the row it was dropped on
+        row = self._row_at_y(y)
+        if len(task_uids) != 1 or row is None or row.task.uid == task_uids[0]:
+            return False
+        ok, bounds = row.compute_bounds(self.task_list)
+        position = 'before' if ok and y < bounds.origin.y + bounds.size.height / 2 else 'after'
+        self.on_reorder(self.quadrant, task_uids[0], position, row.task.uid)
+        return True
+    
+    def _update_autoscroll(self, y: float):
+        """Set the autoscroll speed from the pointer's distance to an edge"""
+        adjustment = self.scrolled.get_vadjustment()
+        view_y = y - adjustment.get_value()
+        height = self.scrolled.get_height()
+        edge = min(self.AUTOSCROLL_EDGE, height / 3)
+        if view_y < edge:
+            speed = -self.AUTOSCROLL_SPEED * (edge - view_y) / edge
+        elif view_y > height - edge:
+            speed = self.AUTOSCROLL_SPEED * (view_y - (height - edge)) / edge
+        else:
+            speed = 0.0
+        self._autoscroll_speed = speed
+        if speed and not self._autoscroll_tick:
+            self._autoscroll_time = None
+            self._autoscroll_tick = self.scrolled.add_tick_callback(self._on_autoscroll_tick)
+        elif not speed:
+            self._stop_autoscroll()
+    
+    def _stop_autoscroll(self):
+        self._autoscroll_speed = 0.0
+        if self._autoscroll_tick:
+            self.scrolled.remove_tick_callback(self._autoscroll_tick)
+            self._autoscroll_tick = 0
+    
+    def _on_autoscroll_tick(self, widget, frame_clock):
+        """Scroll by speed × frame time, once per frame while dragging near an edge"""
+        now = frame_clock.get_frame_time()
+        if self._autoscroll_time is not None:
+            adjustment = self.scrolled.get_vadjustment()
+            delta = self._autoscroll_speed * (now - self._autoscroll_time) / 1e6
+            upper = adjustment.get_upper() - adjustment.get_page_size()
+            adjustment.set_value(min(max(adjustment.get_value() + delta, adjustment.get_lower()), upper))
+        self._autoscroll_time = now
+        return GLib.SOURCE_CONTINUE
+    
     def _on_add_clicked(self, button):
         """Handle add task button click"""
+        from eisenhower_matrix.infrastructure.ui.task_dialog import TaskDialog
+        
         def on_save(description, notes, tags, metadata, due_date):
             self.service.add_task(self.quadrant, description, notes, tags, metadata, due_date)
         
         dialog = TaskDialog(self.get_root(), self.quadrant, task=None, on_save=on_save)
         dialog.present()
     
+    def set_service(self, service: EisenhowerMatrixService):
+        """Display tasks from another service (e.g. after a project switch)"""
+        self._cancel_populate()
+        self.service = service
+        self._view_cache.clear()
+        self._rendered_key = None
+        self._archive_limit = self.ARCHIVE_PAGE_SIZE
+        self._anchor_uid = None
+        self.clear_selection()
+    
     def set_show_completed(self, show: bool):
         """Set whether to show completed tasks"""
         self.show_completed = show
@@ -102,21 +560,151 @@ class QuadrantPanel(Gtk.Box):
     def set_show_archived(self, show: bool):
         """Set whether to show archived tasks"""
         self.show_archived = show
+        self._archive_limit = self.ARCHIVE_PAGE_SIZE
+        self.clear_selection()
+        self._update_selection_bar()
+    
+    def _on_more_clicked(self, button):
+        """Show the next page of archived tasks"""
+        self._archive_limit += self.ARCHIVE_PAGE_SIZE
+        self.refresh()
+    
+    @property
+    def row_count(self) -> int:
+        """Number of task rows currently in the widget tree"""
+        return len(self._rows)
+    
+    @property
+    def is_populating(self) -> bool:
+        """Whether an incremental populate is still pending"""
+        return self._populate is not None
     
     def set_search_text(self, text: str):
         """Set search filter text"""
         self.search_text = text
     
     def refresh(self):
-        """Refresh the task list"""
-        # Clear existing tasks
-        child = self.task_list.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.task_list.remove(child)
-            child = next_child
-        
-        # Add tasks
+        """
+        Refresh the task list
+        
+        Reconciles the displayed rows against the filtered task list by
+        task ID: rows are reused and patched in place, and only rows that
+        were added, removed or moved touch the widget tree.
+        
+        The work is split into frame-budgeted slices: the first slice runs
+        immediately and the rest on idle, top rows first, so large
+        quadrants never block the main loop. A newer refresh cancels any
+        populate still pending.
+        """
+        key = (self.quadrant, self.service.version, self.show_completed,
+               self.show_archived, self.search_text, self._archive_limit)
+        if key == self._rendered_key:
+            return
+        with span('QuadrantPanel.refresh', quadrant=self.quadrant) as s:
+            tasks = self._view_cache.get(key, self._get_visible_tasks)
+            self._rendered_key = key
+            
+            # Archived views hold one task more than shown when more remain
+            has_more = self.show_archived and len(tasks) > self._archive_limit
+            self.more_button.set_visible(has_more)
+            if has_more:
+                tasks = tasks[:self._archive_limit]
+            self._display_order = [task.uid for task in tasks]
+            self._hit_rows = None
+            if s:
+                s.set(tasks=len(tasks), rows=len(self._rows))
+            
+            self._cancel_populate()
+            self._populate = self._reconcile(tasks)
+            if self._run_populate_slice():
+                self._populate_source = GLib.idle_add(self._on_populate_idle)
+    
+    def _reconcile(self, tasks):
+        """
+        Generator that reconciles rows with tasks, yielding after each row
+        
+        Rows are placed in display order before stale rows are removed, so
+        the visible top of the list settles first. Interrupting it at any
+        yield leaves a consistent widget tree for the next reconcile.
+        """
+        if self.service.is_loading(self.quadrant):
+            self.empty_label.set_label("Loading tasks…")
+        else:
+            self.empty_label.set_label("No tasks")
+        self.empty_label.set_visible(not tasks)
+        
+        # Insert, move or update rows in display order
+        previous = self.empty_label
+        for task in tasks:
+            entry = self._rows.get(task.uid)
+            if entry is None:
+                row = TaskRow(task, self.quadrant, self.on_complete, self.on_delete, self.on_edit, self.on_archive)
+                row.set_selected(task.uid in self._selection)
+                sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
+                self.task_list.insert_child_after(row, previous)
+                self.task_list.insert_child_after(sep, row)
+                self._rows[task.uid] = (row, sep)
+                self._hit_rows = None
+            else:
+                row, sep = entry
+                row.update(task)
+                if row.get_prev_sibling() is not previous:
+                    self.task_list.reorder_child_after(row, previous)
+                    self.task_list.reorder_child_after(sep, row)
+            previous = sep
+            yield
+        
+        # Remove rows whose tasks are no longer visible (and deselect them)
+        visible_uids = {task.uid for task in tasks}
+        if not self._selection <= visible_uids:
+            self._set_selection(self._selection & visible_uids)
+        for task_uid in [uid for uid in self._rows if uid not in visible_uids]:
+            row, sep = self._rows.pop(task_uid)
+            self._hit_rows = None
+            self.task_list.remove(row)
+            self.task_list.remove(sep)
+            yield
+    
+    def _run_populate_slice(self) -> bool:
+        """
+        Advance the pending populate for at most FRAME_BUDGET seconds
+        
+        Returns:
+            True if work remains, False once the populate finished
+        """
+        with span('QuadrantPanel.populate_slice', quadrant=self.quadrant) as s:
+            deadline = time.perf_counter() + self.FRAME_BUDGET
+            steps = 0
+            for _ in self._populate:
+                steps += 1
+                if time.perf_counter() >= deadline:
+                    if s:
+                        s.set(steps=steps, done=False)
+                    return True
+            if s:
+                s.set(steps=steps, done=True)
+            self._populate = None
+            return False
+    
+    def _on_populate_idle(self):
+        """Idle callback driving the pending populate"""
+        if self._run_populate_slice():
+            return GLib.SOURCE_CONTINUE
+        self._populate_source = None
+        return GLib.SOURCE_REMOVE
+    
+    def _cancel_populate(self):
+        """Cancel a populate still pending from an earlier refresh"""
+        if self._populate_source is not None:
+            GLib.source_remove(self._populate_source)
+            self._populate_source = None
+        self._populate = None
+    
+    def _get_visible_tasks(self):
+        """Apply the completed/archived/search filters and display order"""
+        if self.show_archived:
+            return self._get_archived_page()
+        
         all_tasks = self.service.get_tasks(self.quadrant)
         
         # Filter tasks based on show_completed setting
@@ -125,32 +713,59 @@ class QuadrantPanel(Gtk.Box):
         else:
             tasks = [t for t in all_tasks if not t.completed]
         
-        # Filter tasks based on show_archived setting
-        if self.show_archived:
-            # When showing archived, only show archived tasks
-            tasks = [t for t in tasks if t.archived]
-        else:
-            # When not showing archived, exclude archived tasks
-            tasks = [t for t in tasks if not t.archived]
+        # Exclude archived tasks (only found here without an archive)
+        tasks = [t for t in tasks if not t.archived]
         
         # Apply search filter
         if self.search_text:
             tasks = [t for t in tasks if t.matches_search(self.search_text)]
         
         # Sort tasks: uncompleted tasks always above completed tasks
-        tasks.sort(key=lambda t: (t.completed, t.id))
-        
-        if not tasks:
-            empty_label = Gtk.Label(label="No tasks")
-            empty_label.add_css_class('dim-label')
-            empty_label.set_margin_top(24)
-            empty_label.set_margin_bottom(24)
-            self.task_list.append(empty_label)
-        else:
-            for task in tasks:
-                task_row = TaskRow(task, self.quadrant, self.on_complete, self.on_delete, self.on_move, self.on_edit, self.on_reorder, self.on_archive)
-                self.task_list.append(task_row)
-                
-                # Add separator
-                sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-                self.task_list.append(sep)
+        return sorted(tasks, key=lambda t: (t.completed, t.id))
+    
+    def _get_archived_page(self):
+        """
+        Most recently archived tasks matching the search, newest first
+        
+        Reads the archive on first use. Returns one task more than the
+        current page limit when more remain.
+        """
+        count = self._archive_limit + 1
+        if not self.search_text:
+            return self.service.get_archived_tasks(self.quadrant, 0, count)
+        tasks = self.service.get_archived_tasks(self.quadrant)
+        return [t for t in tasks if t.matches_search(self.search_text)][:count]
+
+
+def parse_drag_data(value: str) -> Tuple[int, List[str]]:
+    """
+    Parse QuadrantPanel drag data
+    
+    Returns:
+        (source quadrant, dragged task uids)
+    
+    Raises:
+        ValueError: If value is not "<quadrant>:<uid>[,<uid>...]"
+    """
+    quadrant, uids = value.split(':', 1)
+    task_uids = [uid for uid in uids.split(',') if uid]
+    if not task_uids:
+        raise ValueError(f"no tasks in drag data: {value}")
+    return int(quadrant), task_uids
+
+
+# Drag icons by display and scale, shared by all panels
+_drag_icons = {}
+
+
+def _drag_icon(widget: Gtk.Widget):
+    """A small themed icon for dragged tasks, looked up once per display and scale"""
+    display = widget.get_display()
+    scale = widget.get_scale_factor()
+    key = (display, scale)
+    if key not in _drag_icons:
+        theme = Gtk.IconTheme.get_for_display(display)
+        _drag_icons[key] = theme.lookup_icon(
+            'view-list-symbolic', None, 32, scale, Gtk.TextDirection.NONE, 0
+        )
+    return _drag_icons[key]
@@ -0,0 +1,97 @@
+"""Retention Policy Scheduler"""
+
+import gi
+gi.require_version('GLib', '2.0')
+from gi.repository import GLib
+import logging
+from pathlib import Path
+from typing import Optional
+from eisenhower_matrix.domain.notification_service import INotificationService
+from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
+from eisenhower_matrix.application.retention import RetentionJob
+from eisenhower_matrix.infrastructure.persistence.json_retention_config import RetentionConfig
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionScheduler:
+    """
+    Applies retention policies to the open project in the background
+    
+    Single Responsibility: Run RetentionJob batches on the GTK main loop
+    without getting in the way of the user
+    
+    Runs shortly after a project is opened and then every configured
+    interval. Each batch runs from a low-priority idle handler, below
+    input, layout and drawing, and the job waits while the project is
+    still loading.
+    """
+    
+    # Seconds between opening a project and the first run
+    START_DELAY = 10
+    
+    def __init__(self, config: RetentionConfig, notifier: Optional[INotificationService] = None,
+                 default_export_dir: Optional[Path] = None):
+        """
+        Initialize scheduler
+        
+        Args:
+            config: Policies and run interval
+            notifier: Receives a notification per policy that changed tasks
+            default_export_dir: Export directory of purge policies without one
+        """
+        self._config = config
+        self._notifier = notifier
+        self._default_export_dir = default_export_dir
+        self._service: Optional[EisenhowerMatrixService] = None
+        self._project_id = ""
+        self._timeout_id = 0
+        self._idle_id = 0
+        self._steps = None
+    
+    def start(self, service: EisenhowerMatrixService, project_id: str):
+        """Apply policies to a (newly opened) project from now on"""
+        self.cancel()
+        if not self._config.policies:
+            return
+        self._service = service
+        self._project_id = project_id
+        self._timeout_id = GLib.timeout_add_seconds(self.START_DELAY, self._on_timeout)
+    
+    def cancel(self):
+        """Stop scheduling and abandon a run in progress"""
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = 0
+        if self._idle_id:
+            GLib.source_remove(self._idle_id)
+            self._idle_id = 0
+        self._steps = None
+        self._service = None
+    
+    def _on_timeout(self):
+        """Start a run, then wait an interval before the next one"""
+        if self._steps is None:
+            job = RetentionJob(
+                self._service, self._config.policies, self._notifier,
+                project_id=self._project_id, default_export_dir=self._default_export_dir
+            )
+            self._steps = job.steps()
+            self._idle_id = GLib.idle_add(self._on_idle, priority=GLib.PRIORITY_LOW)
+        self._timeout_id = GLib.timeout_add_seconds(self._config.interval_minutes * 60, self._on_timeout)
+        return GLib.SOURCE_REMOVE
+    
+    def _on_idle(self):
+        """Apply one batch"""
+        if self._service.is_loading():
+            return GLib.SOURCE_CONTINUE
+        try:
+            next(self._steps)
+            return GLib.SOURCE_CONTINUE
+        except StopIteration:
+            pass
+        except Exception as e:
+            logger.error("Error applying retention policies: %s", e)
+        self._steps = None
+        self._idle_id = 0
+        return GLib.SOURCE_REMOVE
@@ -31,6 +31,9 @@ class ShortcutsWindow(Gtk.ShortcutsWindow):
             ("<Ctrl>T", "Toggle light/dark theme"),
             ("<Ctrl>H", "Show/hide completed tasks"),
             ("<Ctrl>A", "Show/hide archived tasks"),
+            ("<Ctrl>Z", "Undo"),
+            ("<Ctrl><Shift>Z", "Redo"),
+            ("Escape", "Clear task selection"),
         ]
         
         for accel, title in shortcuts:
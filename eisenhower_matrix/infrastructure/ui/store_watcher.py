@@ -0,0 +1,64 @@
+"""Task File Watcher"""
+
+import gi
+gi.require_version('Gio', '2.0')
+from gi.repository import Gio, GLib
+from pathlib import Path
+from typing import Callable
+
+
+class StoreWatcher:
+    """
+    Watches a tasks file for changes made by other processes
+    
+    Single Responsibility: Turn file monitor events into one debounced
+    callback on the GTK main loop
+    
+    Atomic replaces, editors and scripts emit bursts of events; the
+    callback runs once the burst has been quiet for debounce_ms. The
+    callback should be cheap when nothing changed (this process's own
+    saves also trigger it).
+    """
+    
+    def __init__(self, path: Path, on_changed: Callable[[], None], debounce_ms: int = 250):
+        """
+        Start watching
+        
+        Args:
+            path: File to watch (need not exist yet)
+            on_changed: Called on the main loop after changes settle
+            debounce_ms: Quiet period before calling on_changed
+        """
+        self._on_changed = on_changed
+        self._debounce_ms = debounce_ms
+        self._timeout_id = 0
+        
+        # Watch the file itself; WATCH_MOVES reports atomic replaces as renames
+        self._monitor = Gio.File.new_for_path(str(path)).monitor_file(
+            Gio.FileMonitorFlags.WATCH_MOVES, None
+        )
+        self._handler_id = self._monitor.connect("changed", self._on_monitor_changed)
+    
+    def _on_monitor_changed(self, monitor, file, other_file, event_type):
+        """Restart the debounce timer on every event"""
+        if event_type == Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            return
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+        self._timeout_id = GLib.timeout_add(self._debounce_ms, self._on_quiet)
+    
+    def _on_quiet(self):
+        """Changes settled"""
+        self._timeout_id = 0
+        self._on_changed()
+        return False
+    
+    def cancel(self):
+        """Stop watching"""
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = 0
+        if self._monitor is not None:
+            self._monitor.disconnect(self._handler_id)
+            self._monitor.cancel()
+            self._monitor = None
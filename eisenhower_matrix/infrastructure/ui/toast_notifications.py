@@ -0,0 +1,42 @@
+"""Toast Notification Adapter"""
+
+from typing import Callable
+from eisenhower_matrix.domain.notification_service import INotificationService
+from eisenhower_matrix.domain.task import Task
+
+
+class ToastNotificationService(INotificationService):
+    """
+    Adapter: INotificationService shown as in-app toasts
+    
+    Single Responsibility: Tell the user about changes they did not make
+    themselves
+    
+    Changes the user makes are already visible in the matrix, so task
+    notifications are not repeated; automatic policies get a toast.
+    """
+    
+    def __init__(self, show_toast: Callable[[str], None]):
+        """
+        Initialize adapter
+        
+        Args:
+            show_toast: Shows a message as a toast
+        """
+        self._show_toast = show_toast
+    
+    def notify_task_added(self, task: Task, quadrant: int) -> None:
+        pass
+    
+    def notify_task_completed(self, task: Task, quadrant: int) -> None:
+        pass
+    
+    def notify_task_deleted(self, task: Task, quadrant: int) -> None:
+        pass
+    
+    def notify_policy_applied(self, policy: str, count: int, detail: str = "") -> None:
+        noun = "task" if count == 1 else "tasks"
+        message = f"{policy}: {count} {noun}"
+        if detail:
+            message += f" ({detail})"
+        self._show_toast(message)
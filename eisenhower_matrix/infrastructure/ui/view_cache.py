@@ -0,0 +1,54 @@
+"""Filtered Task View Cache"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, List
+from eisenhower_matrix.domain import Task
+
+
+class FilteredViewCache:
+    """
+    LRU cache of filtered and sorted task views
+    
+    Single Responsibility: Memoize the task lists a panel displays
+    
+    Keys must capture everything a view depends on, including the
+    service data version, so entries never need explicit invalidation;
+    stale ones simply age out.
+    """
+    
+    def __init__(self, capacity: int = 8):
+        """
+        Initialize cache
+        
+        Args:
+            capacity: Maximum number of views kept before evicting the
+                least recently used one
+        """
+        self._capacity = capacity
+        self._views: "OrderedDict[Hashable, List[Task]]" = OrderedDict()
+    
+    def get(self, key: Hashable, compute: Callable[[], List[Task]]) -> List[Task]:
+        """
+        Return the cached view for key, computing it on a miss
+        
+        Args:
+            key: Hashable description of the view
+            compute: Callable producing the view on a cache miss
+            
+        Returns:
+            Cached task list (callers must not mutate it)
+        """
+        view = self._views.get(key)
+        if view is not None:
+            self._views.move_to_end(key)
+            return view
+        
+        view = compute()
+        self._views[key] = view
+        if len(self._views) > self._capacity:
+            self._views.popitem(last=False)
+        return view
+    
+    def clear(self) -> None:
+        """Drop all cached views"""
+        self._views.clear()
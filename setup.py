@@ -20,7 +20,7 @@ setup(
     author_email="",
     url="https://github.com/alesima/eisenhower",
     license="MIT",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     python_requires=">=3.9",
     install_requires=[
         "PyGObject>=3.42.0",
@@ -34,10 +34,12 @@ setup(
     },
     entry_points={
         "console_scripts": [
+            "eisenhower=eisenhower_matrix.cli:main",
             "eisenhower-gui=eisenhower_matrix.infrastructure.ui.application:main",
         ],
     },
     scripts=[
+        "eisenhower-cli",
         "eisenhower-gui",
     ],
     data_files=[
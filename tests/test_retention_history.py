@@ -0,0 +1,59 @@
+"""Retention changes and the undo history"""
+
+from datetime import datetime, timedelta
+
+from eisenhower_matrix.application.matrix_service import EisenhowerMatrixService
+from eisenhower_matrix.application.retention import (
+    ARCHIVE_COMPLETED, PURGE_ARCHIVED, RetentionJob, RetentionPolicy
+)
+from eisenhower_matrix.infrastructure.persistence import JsonArchiveRepository, JsonTaskRepository
+
+
+def _service(tmp_path) -> EisenhowerMatrixService:
+    repository = JsonTaskRepository(data_file=str(tmp_path / "tasks.json"))
+    return EisenhowerMatrixService(repository, archive=JsonArchiveRepository(repository))
+
+
+def _later(days: int) -> datetime:
+    return datetime.now() + timedelta(days=days)
+
+
+def test_undo_skips_commands_of_tasks_retention_archived(tmp_path):
+    service = _service(tmp_path)
+    task = service.add_task(1, "Done")
+    service.complete_task(1, task.uid)
+    later = service.add_task(2, "Later")
+    
+    policy = RetentionPolicy(ARCHIVE_COMPLETED, 7)
+    assert RetentionJob(service, [policy], now=_later(30)).run() == {policy: 1}
+    
+    # Commands older than "Complete task" could only be undone after it
+    assert service.undo() == "Add task"
+    assert later not in service.get_tasks(2)
+    assert service.undo() is None
+    archived = service.get_archived_tasks(1)
+    assert [t.uid for t in archived] == [task.uid]
+    assert archived[0].completed
+
+
+def test_undo_does_not_restore_purged_tasks(tmp_path):
+    service = _service(tmp_path)
+    task = service.add_task(1, "Old")
+    service.archive_task(1, task.uid)
+    
+    policy = RetentionPolicy(PURGE_ARCHIVED, 7, export_dir=str(tmp_path))
+    assert RetentionJob(service, [policy], now=_later(30)).run() == {policy: 1}
+    
+    assert service.undo() is None
+    assert service.get_tasks(1) == []
+    assert service.count_archived_tasks(1) == 0
+
+
+def test_forgotten_history_stays_forgotten_after_reload(tmp_path):
+    service = _service(tmp_path)
+    task = service.add_task(1, "Done")
+    service.complete_task(1, task.uid)
+    RetentionJob(service, [RetentionPolicy(ARCHIVE_COMPLETED, 7)], now=_later(30)).run()
+    
+    reloaded = _service(tmp_path)
+    assert reloaded.undo_label is None